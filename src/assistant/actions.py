@@ -96,6 +96,7 @@ from .routines import (
 from .system_health import (
     system_health_report_action,
     system_health_watch_action,
+    system_health_watch_result_action,
 )
 from .clipboard_vault import (
     clipboard_save_action,
@@ -4602,7 +4603,13 @@ def execute_action(action: Dict[str, Any]) -> Dict[str, Any]:
         return resp
 
     if atype in {"system_health_watch", "health_watch"}:
-        resp = system_health_watch_action(params)
+        resp = system_health_watch_action(params, on_done=_notify)
+        if resp.get("say"):
+            _notify(resp["say"])
+        return resp
+
+    if atype in {"system_health_watch_result", "health_watch_result"}:
+        resp = system_health_watch_result_action(params)
         if resp.get("say"):
             _notify(resp["say"])
         return resp
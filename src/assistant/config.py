@@ -13,6 +13,16 @@ class Settings:
     # Default model for OpenAI chat completions; override with env OPENAI_MODEL
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     ASSISTANT_VOICE_LANG: str = os.getenv("ASSISTANT_VOICE_LANG", "en")
+    # Speech output engine: pyttsx3 (default), piper (streaming ONNX voice), or auto
+    # (piper when its model and dependencies are present, else pyttsx3)
+    TTS_BACKEND: str = os.getenv("TTS_BACKEND", "pyttsx3").lower()
+    PIPER_MODEL_PATH: str = os.getenv("PIPER_MODEL_PATH", "models/piper/voice.onnx")
+    # Speak in clause-sized chunks with the persona's occasional "umm"/"hmm" interjections
+    TTS_INTERJECTIONS: bool = os.getenv("TTS_INTERJECTIONS", "false").lower() in {"1", "true", "yes", "on"}
+    # Initialise the TTS engine in the background at startup to hide its cold-start
+    TTS_PRELOAD: bool = os.getenv("TTS_PRELOAD", "true").lower() in {"1", "true", "yes", "on"}
+    # Run the TTS engine in a child process so synthesis never stalls the UI/STT threads
+    TTS_PROCESS: bool = os.getenv("TTS_PROCESS", "false").lower() in {"1", "true", "yes", "on"}
     # Hybrid input by default (text + voice). Override with INPUT_MODE=text/voice as needed.
     INPUT_MODE: str = os.getenv("INPUT_MODE", "both").lower()
     # UI mode for command input: 'console' (default) or 'textbox'
@@ -24,6 +34,8 @@ class Settings:
     SPEECH_INTERRUPTIBLE: bool = os.getenv("SPEECH_INTERRUPTIBLE", "true").lower() in {"1", "true", "yes", "on"}
     STT_BACKEND: str = os.getenv("STT_BACKEND", "auto").lower()  # auto|vosk|sr
     VOSK_MODEL_PATH: str = os.getenv("VOSK_MODEL_PATH", "models/vosk")
+    # Frames per Vosk stream read; smaller blocks lower latency on slow CPUs (e.g. Pi)
+    VOSK_BLOCK_FRAMES: int = int(os.getenv("VOSK_BLOCK_FRAMES", "8000"))
     STT_DEVICE_INDEX: str = os.getenv("STT_DEVICE_INDEX", "")
     STT_DEBUG: bool = os.getenv("STT_DEBUG", "false").lower() in {"1", "true", "yes", "on"}
     # Listening timeout - how long to wait for speech to start
@@ -0,0 +1,182 @@
+"""Streaming Piper (ONNX VITS) backend for the assistant's TTS.
+
+Text is split on punctuation and each piece is phonemized and run through
+the Piper ONNX model on its own, so audio for the first clause can start
+playing while the rest is still being synthesized. Playback goes through a
+``sounddevice`` output stream fed by a producer thread.
+
+All heavy dependencies (numpy, onnxruntime, piper_phonemize, sounddevice)
+are optional; ``load_piper`` returns None when any of them, or the model
+file, is missing so `tts.py` can fall back to pyttsx3.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+try:
+    import numpy as _np
+except Exception:  # pragma: no cover - numpy is optional
+    _np = None
+
+try:
+    import onnxruntime as _ort
+except Exception:  # pragma: no cover - onnxruntime is optional
+    _ort = None
+
+try:
+    from piper_phonemize import phonemize_espeak as _phonemize_espeak
+except Exception:  # pragma: no cover - piper_phonemize is optional
+    _phonemize_espeak = None
+
+try:
+    import sounddevice as _sd
+except Exception:  # pragma: no cover - sounddevice is optional
+    _sd = None
+
+
+# Batch on clause punctuation: short first chunk, natural prosody per clause.
+_PIPER_SPLIT_RE = re.compile(r"[^.!?;]+(?:[.!?;]+|$)")
+
+_PAD, _BOS, _EOS = "_", "^", "$"
+
+
+class PiperTTS:
+    """Piper voice model run directly on onnxruntime."""
+
+    def __init__(self, model_path: str, config_path: Optional[str] = None, threads: Optional[int] = None):
+        cfg_path = config_path or f"{model_path}.json"
+        with open(cfg_path, "r", encoding="utf-8") as f:
+            cfg = json.load(f)
+
+        self.sample_rate: int = int(cfg["audio"]["sample_rate"])
+        self._id_map = cfg["phoneme_id_map"]
+        self._espeak_voice = (cfg.get("espeak") or {}).get("voice", "en-us")
+        inference = cfg.get("inference") or {}
+        self._scales = _np.array(
+            [
+                inference.get("noise_scale", 0.667),
+                inference.get("length_scale", 1.0),
+                inference.get("noise_w", 0.8),
+            ],
+            dtype=_np.float32,
+        )
+        self._multi_speaker = int(cfg.get("num_speakers", 1)) > 1
+
+        opts = _ort.SessionOptions()
+        opts.intra_op_num_threads = threads or os.cpu_count() or 1
+        self._session = _ort.InferenceSession(
+            model_path, sess_options=opts, providers=["CPUExecutionProvider"]
+        )
+
+    def _phoneme_ids(self, phonemes) -> list:
+        id_map = self._id_map
+        ids = list(id_map[_BOS])
+        for ph in phonemes:
+            mapped = id_map.get(ph)
+            if mapped is None:
+                continue
+            ids.extend(mapped)
+            ids.extend(id_map[_PAD])
+        ids.extend(id_map[_EOS])
+        return ids
+
+    def _infer(self, ids: list):
+        inputs = {
+            "input": _np.array([ids], dtype=_np.int64),
+            "input_lengths": _np.array([len(ids)], dtype=_np.int64),
+            "scales": self._scales,
+        }
+        if self._multi_speaker:
+            inputs["sid"] = _np.array([0], dtype=_np.int64)
+        audio = self._session.run(None, inputs)[0]
+        return _np.clip(audio.reshape(-1), -1.0, 1.0).astype(_np.float32, copy=False)
+
+    def synthesize_stream(self, text: str) -> Iterator["_np.ndarray"]:
+        """Yield float32 mono PCM, one array per punctuation-delimited chunk."""
+        for match in _PIPER_SPLIT_RE.finditer(text):
+            chunk = match.group().strip()
+            if not chunk:
+                continue
+            for sentence in _phonemize_espeak(chunk, self._espeak_voice):
+                ids = self._phoneme_ids(sentence)
+                if len(ids) > 2:
+                    yield self._infer(ids)
+
+
+def play_stream(
+    chunks: Iterator["_np.ndarray"],
+    sample_rate: int,
+    should_stop: Callable[[], bool],
+    first_block: float = 0.02,
+    max_block: float = 0.2,
+) -> None:
+    """Play PCM chunks as they arrive, synthesizing the next one meanwhile.
+
+    A producer thread drains ``chunks`` into a small queue while this thread
+    writes to the output stream. Writes start at ``first_block`` seconds and
+    double up to ``max_block`` so the first samples reach the device almost
+    immediately; the ramp restarts whenever playback had to wait for
+    synthesis. ``should_stop`` is checked between writes for barge-in.
+    """
+    pending: "queue.Queue[Optional[_np.ndarray]]" = queue.Queue(maxsize=4)
+    finished = threading.Event()  # set once the consumer returns
+
+    def _offer(item) -> bool:
+        # Never block for good: nobody drains the queue after a barge-in
+        while not finished.is_set():
+            try:
+                pending.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce() -> None:
+        try:
+            for chunk in chunks:
+                if should_stop() or not _offer(chunk):
+                    break
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+            _offer(None)
+
+    threading.Thread(target=_produce, name="PiperSynth", daemon=True).start()
+    first = max(1, int(sample_rate * first_block))
+    largest = max(first, int(sample_rate * max_block))
+    block = first
+    try:
+        with _sd.OutputStream(samplerate=sample_rate, channels=1, dtype="float32") as stream:
+            while True:
+                if pending.empty():
+                    block = first  # starved: ramp up again from a short write
+                chunk = pending.get()
+                if chunk is None:
+                    break
+                start = 0
+                while start < len(chunk):
+                    if should_stop():
+                        stream.abort()
+                        return
+                    stream.write(chunk[start:start + block])
+                    start += block
+                    block = min(block * 2, largest)
+    finally:
+        finished.set()
+
+
+def load_piper(model_path: str) -> Optional[PiperTTS]:
+    """Load a Piper voice, or return None if the backend can't run here."""
+    if None in (_np, _ort, _phonemize_espeak, _sd):
+        return None
+    if not model_path or not Path(model_path).is_file():
+        return None
+    return PiperTTS(model_path)
@@ -16,6 +16,11 @@ import io
 import struct
 from collections import namedtuple
 
+try:
+    import numpy as _np
+except Exception:  # pragma: no cover - numpy is optional
+    _np = None
+
 __all__ = ["Error", "open"]
 
 
@@ -56,6 +61,10 @@ def _read_extended_float(file) -> float:
     raw = file.read(10)
     if len(raw) != 10:
         raise EOFError("unexpected EOF while reading extended float")
+    return _decode_extended_float(raw)
+
+
+def _decode_extended_float(raw: bytes) -> float:
     expon, himant, lomant = struct.unpack(">HII", raw)
     if expon == himant == lomant == 0:
         return 0.0
@@ -84,6 +93,13 @@ def _read_pstring(file) -> bytes:
     return data
 
 
+# Canonical plain-AIFF layout written by SpeechRecognition/PyAudio: an 18-byte
+# COMM chunk immediately followed by the SSND preamble (offset, blocksize).
+_FAST_HEADER = struct.Struct(">4sIHIH10s4sIII")
+
+# struct format codes for big-endian PCM sample widths
+_SAMPLE_CODES = {1: "b", 2: "h", 4: "i"}
+
 _aifc_params = namedtuple(
     "_aifc_params",
     "nchannels sampwidth framerate nframes comptype compname",
@@ -97,6 +113,7 @@ class _AiffReader:
         self._ssnd_pos = None
         self._frame_size = 0
         self._soundpos = 0
+        self._sample_iter_struct = None
         self._parse_header()
 
     # Public API used by speech_recognition
@@ -131,6 +148,64 @@ class _AiffReader:
         self._soundpos += frames
         return data
 
+    def readframes_np(self, n):
+        """Read up to ``n`` frames as a native little-endian numpy array.
+
+        16-bit audio is returned as ``int16`` and 24/32-bit audio as
+        ``int32`` (24-bit samples are sign-extended). The big-endian swap
+        happens in place on the freshly read buffer, so no Python-level
+        per-sample loop is involved. Requires numpy.
+        """
+        if _np is None:
+            raise Error("numpy is required for readframes_np")
+        if self._ssnd_pos is None:
+            raise Error("SSND chunk missing in AIFF file")
+        self._ensure_ssnd_position()
+        buf = bytearray(n * self._frame_size)
+        readinto = getattr(self._file, "readinto", None)
+        if readinto is not None:
+            got = readinto(buf) or 0
+        else:
+            data = self._file.read(len(buf))
+            got = len(data)
+            buf[:got] = data
+        frames = got // self._frame_size
+        self._soundpos += frames
+        count = frames * self._params.nchannels
+        sampwidth = self._params.sampwidth
+        if sampwidth == 1:
+            return _np.frombuffer(buf, dtype=_np.int8, count=count)
+        if sampwidth == 2:
+            arr = _np.frombuffer(buf, dtype=">i2", count=count)
+            return arr.byteswap(inplace=True).view("<i2")
+        if sampwidth == 3:
+            raw = _np.frombuffer(buf, dtype=_np.uint8, count=count * 3).reshape(-1, 3)
+            wide = raw.astype("<i4")
+            # Place the 3 bytes in the top of an int32, then shift back down
+            # arithmetically so the sign bit is extended.
+            return ((wide[:, 0] << 24) | (wide[:, 1] << 16) | (wide[:, 2] << 8)) >> 8
+        if sampwidth == 4:
+            arr = _np.frombuffer(buf, dtype=">i4", count=count)
+            return arr.byteswap(inplace=True).view("<i4")
+        raise Error(f"unsupported sample width: {sampwidth}")
+
+    def readframes_samples(self, n):
+        """Iterate over up to ``n`` frames as tuples of Python ints.
+
+        Each item holds one sample per channel. Uses ``struct.iter_unpack``
+        so no n-sized intermediate tuple is built.
+        """
+        code = _SAMPLE_CODES.get(self._params.sampwidth)
+        if code is None:
+            raise Error(f"unsupported sample width: {self._params.sampwidth}")
+        unpacker = self._sample_iter_struct
+        if unpacker is None or unpacker.size != self._frame_size:
+            unpacker = struct.Struct(f">{self._params.nchannels}{code}")
+            self._sample_iter_struct = unpacker
+        data = self.readframes(n)
+        usable = len(data) - len(data) % unpacker.size
+        return unpacker.iter_unpack(memoryview(data)[:usable])
+
     def rewind(self):
         self.setpos(0)
 
@@ -157,38 +232,63 @@ class _AiffReader:
         if form_type not in {b"AIFF", b"AIFC"}:
             raise Error("not an AIFF/AIFC file")
         self._aifc = form_type == b"AIFC"
-        comm_found = False
-        ssnd_found = False
+        if not self._aifc and self._parse_fast_header():
+            return
+        found = 0
         while True:
             try:
                 chunk_id = _read_str4(self._file)
             except EOFError:
                 break
             chunk_size = _read_ulong(self._file)
-            chunk_start = self._file.tell()
-            if chunk_id == b"COMM":
-                self._read_comm(chunk_size)
-                comm_found = True
-            elif chunk_id == b"SSND":
-                self._read_ssnd(chunk_size)
-                ssnd_found = True
-            else:
-                # skip unrelated chunk
-                self._file.seek(chunk_size, io.SEEK_CUR)
-            # Chunks are padded to even length
-            if chunk_size % 2 == 1:
-                self._file.seek(1, io.SEEK_CUR)
-            if comm_found and ssnd_found:
-                break
-        if not comm_found or not ssnd_found:
+            entry = _CHUNK_HANDLERS.get(chunk_id)
+            if entry is not None:
+                handler, bit = entry
+                chunk_start = self._file.tell()
+                handler(self, chunk_size)
+                found |= bit
+                if found & _REQUIRED_CHUNKS == _REQUIRED_CHUNKS:
+                    break
+                # Handlers may stop short of the chunk end (e.g. SSND)
+                self._file.seek(chunk_start + chunk_size + (chunk_size & 1), io.SEEK_SET)
+                continue
+            # skip unrelated chunk; chunks are padded to even length
+            self._file.seek(chunk_size + (chunk_size & 1), io.SEEK_CUR)
+        if found & _REQUIRED_CHUNKS != _REQUIRED_CHUNKS:
             raise Error("COMM or SSND chunk missing in AIFF file")
 
+    def _parse_fast_header(self) -> bool:
+        """Parse the canonical COMM+SSND layout with a single read and unpack.
+
+        Returns False (with the file rewound) when the layout differs, so the
+        generic chunk loop can take over.
+        """
+        start = self._file.tell()
+        raw = self._file.read(_FAST_HEADER.size)
+        if len(raw) == _FAST_HEADER.size:
+            (comm_id, comm_size, nchannels, nframes, sampwidth_bits, rate_raw,
+             ssnd_id, _ssnd_size, offset, _blocksize) = _FAST_HEADER.unpack(raw)
+            if comm_id == b"COMM" and comm_size == 18 and ssnd_id == b"SSND":
+                self._set_params(
+                    nchannels,
+                    nframes,
+                    sampwidth_bits,
+                    int(_decode_extended_float(rate_raw)),
+                    b"NONE",
+                    b"not compressed",
+                )
+                self._ssnd_pos = start + _FAST_HEADER.size + offset
+                if offset:
+                    self._file.seek(self._ssnd_pos, io.SEEK_SET)
+                return True
+        self._file.seek(start, io.SEEK_SET)
+        return False
+
     def _read_comm(self, chunk_size):
         nchannels = _read_ushort(self._file)
         nframes = _read_ulong(self._file)
         sampwidth_bits = _read_ushort(self._file)
         framerate = int(_read_extended_float(self._file))
-        sampwidth = (sampwidth_bits + 7) // 8
         comptype = b"NONE"
         compname = b"not compressed"
         if self._aifc:
@@ -196,6 +296,10 @@ class _AiffReader:
             compname = _read_pstring(self._file)
             if comptype != b"NONE":
                 raise Error("compressed AIFF-C is not supported")
+        self._set_params(nchannels, nframes, sampwidth_bits, framerate, comptype, compname)
+
+    def _set_params(self, nchannels, nframes, sampwidth_bits, framerate, comptype, compname):
+        sampwidth = (sampwidth_bits + 7) // 8
         self._frame_size = nchannels * sampwidth
         self._params = _aifc_params(
             nchannels,
@@ -218,6 +322,20 @@ class _AiffReader:
             self._file.seek(expected, io.SEEK_SET)
 
 
+_COMM_BIT = 1 << 0
+_SSND_BIT = 1 << 1
+_REQUIRED_CHUNKS = _COMM_BIT | _SSND_BIT
+
+# Chunk id -> (handler, found bit). Handlers are called as
+# ``handler(reader, chunk_size)`` with the file positioned at the chunk body;
+# the parser re-seeks to the next chunk afterwards. Extra handlers (e.g. INST,
+# MARK) can be registered with a found bit of 0.
+_CHUNK_HANDLERS = {
+    b"COMM": (_AiffReader._read_comm, _COMM_BIT),
+    b"SSND": (_AiffReader._read_ssnd, _SSND_BIT),
+}
+
+
 class _AiffFile:
     def __init__(self, f, mode):
         if mode not in {"r", "rb"}:
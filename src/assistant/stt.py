@@ -1,17 +1,38 @@
 from typing import Optional, Callable, List, Tuple
+import array
+import functools
+import math
+import tempfile
 import time
+import wave
 import threading
+import atexit
 import os
 import json
 import sys
+from pathlib import Path
 from .config import settings
-from .tts import stop as tts_stop
+from .tts import barge_in as tts_barge_in
+from .tts import is_busy as tts_is_busy, wait_until_idle as tts_wait_until_idle
 
 _sr = None
 _pyaudio = None
 _sr_aifc_patched = False
+_pa_instance = None
+_pa_lock = threading.Lock()
+# Recognizer and open microphone stream reused by listen_once
+_sr_recognizer = None
+_sr_mic = None
+_sr_source = None
+_sr_mic_idx = None
+_sr_lock = threading.Lock()
 _VOICE_MODES = {"voice", "hybrid", "both"}
 
+STATE_DIR_ENV = "ASSISTANT_STATE_DIR"
+_ENERGY_CACHE_PATH = Path(os.environ.get(STATE_DIR_ENV) or (Path.home() / ".kypzer")) / "stt_energy.json"
+# Recalibrate against ambient noise at most once an hour
+_ENERGY_CACHE_MAX_AGE = 3600.0
+
 # Audio feedback state
 _AUDIO_FEEDBACK_ENABLED = True  # Can be overridden by config
 
@@ -43,12 +64,59 @@ def _play_listening_recognized():
     _play_beep(660, 80)  # Medium pitch
 
 
+_CHIME_RATE = 22050
+_chime_wav_path: Optional[str] = None
+
+
+def _render_tone(frequency: int, duration_ms: int) -> array.array:
+    count = _CHIME_RATE * duration_ms // 1000
+    step = 2.0 * math.pi * frequency / _CHIME_RATE
+    return array.array("h", (int(12000 * math.sin(step * i)) for i in range(count)))
+
+
+def _action_complete_wav_path() -> Optional[str]:
+    """Render the completion chime to a WAV file once and return its path.
+
+    PlaySound cannot play from memory asynchronously, so the pre-rendered
+    880 Hz / 50 ms gap / 1100 Hz sequence is written to the temp directory.
+    """
+    global _chime_wav_path
+    if _chime_wav_path is None:
+        samples = _render_tone(880, 80)
+        samples.extend(array.array("h", bytes(2 * (_CHIME_RATE * 50 // 1000))))
+        samples.extend(_render_tone(1100, 120))
+        if sys.byteorder != "little":
+            samples.byteswap()
+        path = os.path.join(tempfile.gettempdir(), "kypzer_action_complete.wav")
+        try:
+            with wave.open(path, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(_CHIME_RATE)
+                wav.writeframes(samples.tobytes())
+        except Exception:
+            return None
+        _chime_wav_path = path
+    return _chime_wav_path
+
+
 def _play_action_complete():
     """Play a pleasant double-beep when action completes."""
     if not getattr(settings, 'STT_AUDIO_FEEDBACK', True):
         return
     try:
         import winsound
+    except Exception:
+        return
+    path = _action_complete_wav_path()
+    if path:
+        try:
+            # Single non-blocking call; no helper thread or sleeps
+            winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+            return
+        except Exception:
+            pass
+    try:
         def _chime():
             winsound.Beep(880, 80)
             time.sleep(0.05)
@@ -65,6 +133,28 @@ def _play_error_beep():
     _play_beep(400, 200)  # Low pitch, longer
 
 
+def _load_energy_threshold() -> Optional[float]:
+    """Return the last calibrated energy threshold if it is still fresh."""
+    try:
+        with open(_ENERGY_CACHE_PATH, "r", encoding="utf-8") as fh:
+            payload = json.load(fh)
+        threshold = float(payload["threshold"])
+        if time.time() - float(payload["ts"]) < _ENERGY_CACHE_MAX_AGE and threshold > 0:
+            return threshold
+    except Exception:
+        pass
+    return None
+
+
+def _save_energy_threshold(threshold: float) -> None:
+    try:
+        _ENERGY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_ENERGY_CACHE_PATH, "w", encoding="utf-8") as fh:
+            json.dump({"threshold": threshold, "ts": time.time()}, fh)
+    except Exception:
+        pass
+
+
 def _voice_status_enabled() -> bool:
     return settings.INPUT_MODE in _VOICE_MODES
 
@@ -107,84 +197,148 @@ def _ensure_pyaudio():
     return _pyaudio
 
 
+def _terminate_pa() -> None:
+    global _pa_instance
+    with _pa_lock:
+        inst, _pa_instance = _pa_instance, None
+    if inst is not None:
+        try:
+            inst.terminate()
+        except Exception:
+            pass
+
+
+atexit.register(_terminate_pa)
+
+
+def _get_pa():
+    """Return a process-wide PyAudio instance, creating it on first use.
+
+    PyAudio construction enumerates every host API and is slow (50-200 ms),
+    so status checks and device probing share one instance. It is terminated
+    at interpreter exit. Returns None if PyAudio is unavailable.
+    """
+    global _pa_instance
+    pa = _ensure_pyaudio()
+    if not pa:
+        return None
+    with _pa_lock:
+        if _pa_instance is None:
+            try:
+                _pa_instance = pa.PyAudio()
+            except Exception:
+                return None
+        return _pa_instance
+
+
 def _detect_default_input_index_pyaudio() -> Optional[int]:
     """Use PyAudio to find the default input device index or the first input-capable device.
     Returns None if PyAudio isn't available or no input device is found.
     """
-    pa = _ensure_pyaudio()
-    if not pa:
+    pa_inst = _get_pa()
+    if pa_inst is None:
         return None
     try:
-        pa_inst = pa.PyAudio()
+        info = pa_inst.get_default_input_device_info()
+        if isinstance(info, dict) and "index" in info:
+            idx = info.get("index")
+            if isinstance(idx, int) and idx >= 0:
+                return idx
     except Exception:
-        return None
+        # Fall back to search
+        pass
     try:
+        count = pa_inst.get_device_count()
+        for i in range(count):
+            dev = pa_inst.get_device_info_by_index(i)
+            if int(dev.get("maxInputChannels", 0)) > 0:
+                return i
+    except Exception:
+        pass
+    return None
+
+
+def _get_sr_recognizer():
+    """Return the shared SpeechRecognition Recognizer (call with _sr_lock held)."""
+    global _sr_recognizer
+    if _sr_recognizer is None:
+        _sr_recognizer = _sr.Recognizer()
+    return _sr_recognizer
+
+
+def _get_sr_source(device_index: Optional[int]):
+    """Return an already-opened SR microphone source for ``device_index``.
+
+    Opening a Microphone sets up a PortAudio stream (~100 ms), so the stream
+    stays open across listen_once calls and is only rebuilt when the device
+    changes. Call with _sr_lock held.
+    """
+    global _sr_mic, _sr_source, _sr_mic_idx
+    if _sr_source is None or device_index != _sr_mic_idx:
+        _close_sr_source()
+        mic_kw = {}
+        if isinstance(device_index, int):
+            mic_kw["device_index"] = device_index
+        mic = _sr.Microphone(**mic_kw)
+        _sr_source = mic.__enter__()
+        _sr_mic = mic
+        _sr_mic_idx = device_index
+    return _sr_source
+
+
+def _close_sr_source() -> None:
+    global _sr_mic, _sr_source, _sr_mic_idx
+    mic, _sr_mic, _sr_source, _sr_mic_idx = _sr_mic, None, None, None
+    if mic is not None:
         try:
-            info = pa_inst.get_default_input_device_info()
-            if isinstance(info, dict) and "index" in info:
-                idx = info.get("index")
-                if isinstance(idx, int) and idx >= 0:
-                    return idx
-        except Exception:
-            # Fall back to search
-            pass
-        try:
-            count = pa_inst.get_device_count()
-            for i in range(count):
-                dev = pa_inst.get_device_info_by_index(i)
-                if int(dev.get("maxInputChannels", 0)) > 0:
-                    return i
-        except Exception:
-            pass
-        return None
-    finally:
-        try:
-            pa_inst.terminate()
+            mic.__exit__(None, None, None)
         except Exception:
             pass
 
 
-def _list_microphones_sr() -> List[Tuple[int, str]]:
+def _shutdown_sr_source() -> None:
+    with _sr_lock:
+        _close_sr_source()
+
+
+# Registered after _terminate_pa so it runs first at exit
+atexit.register(_shutdown_sr_source)
+
+
+def _list_microphones_sr(names: Optional[List[str]] = None) -> List[Tuple[int, str]]:
+    """Enumerate SR microphone names; pass ``names`` to reuse an existing listing."""
     result: List[Tuple[int, str]] = []
-    sr = _ensure_sr()
-    if sr:
+    if names is None:
+        sr = _ensure_sr()
+        if not sr:
+            return result
         try:
             names = sr.Microphone.list_microphone_names()
-            for i, name in enumerate(names or []):
-                result.append((i, str(name)))
         except Exception:
-            pass
+            return result
+    for i, name in enumerate(names or []):
+        result.append((i, str(name)))
     return result
 
 
 def _list_microphones_pyaudio() -> List[Tuple[int, str]]:
     result: List[Tuple[int, str]] = []
-    pa = _ensure_pyaudio()
-    if not pa:
+    pa_inst = _get_pa()
+    if pa_inst is None:
         return result
     try:
-        pa_inst = pa.PyAudio()
+        count = pa_inst.get_device_count()
+        for i in range(count):
+            try:
+                dev = pa_inst.get_device_info_by_index(i)
+                if int(dev.get("maxInputChannels", 0)) > 0:
+                    name = str(dev.get("name", f"Device {i}"))
+                    host = str(dev.get("hostApi", ""))
+                    result.append((i, f"{name} (hostApi={host})"))
+            except Exception:
+                continue
     except Exception:
-        return result
-    try:
-        try:
-            count = pa_inst.get_device_count()
-            for i in range(count):
-                try:
-                    dev = pa_inst.get_device_info_by_index(i)
-                    if int(dev.get("maxInputChannels", 0)) > 0:
-                        name = str(dev.get("name", f"Device {i}"))
-                        host = str(dev.get("hostApi", ""))
-                        result.append((i, f"{name} (hostApi={host})"))
-                except Exception:
-                    continue
-        except Exception:
-            pass
-    finally:
-        try:
-            pa_inst.terminate()
-        except Exception:
-            pass
+        pass
     return result
 
 
@@ -196,10 +350,15 @@ def _resolve_device_index() -> Optional[int]:
     3) First input-capable PyAudio device
     Otherwise None to let SR pick default.
     """
+    return _resolve_device_index_cached(settings.STT_DEVICE_INDEX)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_device_index_cached(override: str) -> Optional[int]:
     # 1) Explicit override
     try:
-        if settings.STT_DEVICE_INDEX.strip():
-            return int(settings.STT_DEVICE_INDEX.strip())
+        if override.strip():
+            return int(override.strip())
     except Exception:
         pass
     # 2/3) PyAudio-based detection
@@ -209,18 +368,31 @@ def _resolve_device_index() -> Optional[int]:
     return None
 
 
+def invalidate_device_cache() -> None:
+    """Forget the resolved microphone so the next lookup re-detects it.
+
+    Call after changing STT settings at runtime or when the device vanished.
+    The shared PyAudio instance is dropped too (its device list is fixed at
+    creation), as is the source listen_once keeps open.
+    """
+    _resolve_device_index_cached.cache_clear()
+    _terminate_pa()
+    _shutdown_sr_source()
+
+
 def stt_status() -> dict:
     """Return STT availability status for SR mic and Vosk model.
     Keys: sr_available (bool), sr_mic (bool), vosk_model (bool), backend (str)
     """
     have_sr = False
     have_mic = False
+    mic_names: Optional[List[str]] = None
     if _ensure_sr():
         have_sr = True
         try:
             # Will raise if portaudio not present or no devices
-            mics = _sr.Microphone.list_microphone_names()
-            have_mic = bool(mics)
+            mic_names = _sr.Microphone.list_microphone_names() or []
+            have_mic = bool(mic_names)
         except Exception:
             have_mic = False
     resolved_idx = _resolve_device_index()
@@ -241,8 +413,9 @@ def stt_status() -> dict:
     }
     if settings.STT_DEBUG:
         try:
-            sr_devices = _list_microphones_sr()
-            pa_devices = _list_microphones_pyaudio()
+            sr_devices = _list_microphones_sr(mic_names) if mic_names is not None else []
+            # SR already enumerated through PyAudio; only probe again if it found nothing
+            pa_devices = [] if sr_devices else _list_microphones_pyaudio()
             print("[STT] Status:", status, flush=True)
             if sr_devices:
                 print("[STT] SR devices:", ", ".join([f"{i}:{n}" for i, n in sr_devices]), flush=True)
@@ -258,29 +431,32 @@ def listen_once(timeout: Optional[float] = None, phrase_time_limit: Optional[flo
     phrase_time_limit = settings.STT_PHRASE_TIME_LIMIT if phrase_time_limit is None else phrase_time_limit
     # Prefer SR mic if available
     if settings.STT_BACKEND in {"auto", "sr"} and _ensure_sr():
-        sr = _sr
-        r = sr.Recognizer()
         try:
-            mic_kw = {}
             resolved_idx = _resolve_device_index()
-            if isinstance(resolved_idx, int):
-                mic_kw["device_index"] = resolved_idx
             if _voice_status_enabled():
                 print("Listening...", flush=True)
-            with sr.Microphone(**mic_kw) as source:
-                r.adjust_for_ambient_noise(source, duration=0.2)
-                audio = r.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+            with _sr_lock:
+                r = _get_sr_recognizer()
+                source = _get_sr_source(resolved_idx)
                 try:
-                    text = r.recognize_google(audio, language=settings.STT_LANG)
-                    if _voice_status_enabled():
-                        print(f"You: {text}", flush=True)
-                    if settings.STT_DEBUG:
-                        print(f"[STT] Heard: {text}", flush=True)
-                    return text
-                except Exception:
-                    if _voice_status_enabled():
-                        print("You: (not recognized)", flush=True)
-                    # return None
+                    r.adjust_for_ambient_noise(source, duration=0.2)
+                    audio = r.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+                except Exception as exc:
+                    if not isinstance(exc, _sr.WaitTimeoutError):
+                        # Stream is likely broken; reopen it on the next call
+                        _close_sr_source()
+                    raise
+            try:
+                text = r.recognize_google(audio, language=settings.STT_LANG)
+                if _voice_status_enabled():
+                    print(f"You: {text}", flush=True)
+                if settings.STT_DEBUG:
+                    print(f"[STT] Heard: {text}", flush=True)
+                return text
+            except Exception:
+                if _voice_status_enabled():
+                    print("You: (not recognized)", flush=True)
+                # return None
         except Exception:
             pass
     # Fallback to Vosk offline if available and configured
@@ -296,13 +472,16 @@ def listen_once(timeout: Optional[float] = None, phrase_time_limit: Optional[flo
             model = Model(model_path)
             rec = KaldiRecognizer(model, 16000)
             rec.SetWords(True)
-            pa = pyaudio.PyAudio()
-            stream = pa.open(format=pyaudio.paInt16, channels=1, rate=16000, input=True, frames_per_buffer=8000)
+            pa = _get_pa()
+            if pa is None:
+                return None
+            block = max(1, int(settings.VOSK_BLOCK_FRAMES))
+            stream = pa.open(format=pyaudio.paInt16, channels=1, rate=16000, input=True, frames_per_buffer=block)
             stream.start_stream()
             start = time.time()
             text_out = None
             while time.time() - start < phrase_time_limit:
-                data = stream.read(4000, exception_on_overflow=False)
+                data = stream.read(block, exception_on_overflow=False)
                 if len(data) == 0:
                     continue
                 if rec.AcceptWaveform(data):
@@ -311,13 +490,22 @@ def listen_once(timeout: Optional[float] = None, phrase_time_limit: Optional[flo
                     break
             stream.stop_stream()
             stream.close()
-            pa.terminate()
             return text_out
         except Exception:
             return None
     return None
 
 
+def _barge_in_for_command() -> None:
+    """A recognized command makes any speech still playing obsolete."""
+    if not settings.SPEECH_INTERRUPTIBLE:
+        return
+    try:
+        tts_barge_in()
+    except Exception:
+        pass
+
+
 def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Callable[[], None]] = None, should_continue: Optional[Callable[[], bool]] = None):
     """Continuously listen for voice commands and execute them.
     
@@ -349,6 +537,11 @@ def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Calla
             if callable(should_continue) and not should_continue():
                 break
 
+            # Settings are re-read once per mic (re)open rather than per utterance
+            voice_on = _voice_status_enabled()
+            stt_lang = settings.STT_LANG
+            stt_debug = settings.STT_DEBUG
+
             try:
                 r = sr.Recognizer()
                 r.energy_threshold = 300 # Default baseline
@@ -361,18 +554,23 @@ def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Calla
                 
                 # Context manager for Microphone
                 with sr.Microphone(**mic_kw) as source:
-                    # Calibration phase
-                    if _voice_status_enabled():
-                        print("🎤 Calibrating microphone... (Please wait)", flush=True)
-                    
-                    try:
-                        r.adjust_for_ambient_noise(source, duration=0.8)
-                        # Boost threshold slightly after calibration to avoid noise triggers
-                        r.energy_threshold = max(r.energy_threshold, 300)
-                    except Exception as e:
-                        print(f"[STT] Calibration failed: {e}. Retrying...", flush=True)
-                        time.sleep(1.0)
-                        continue # Retry outer loop (re-open mic)
+                    # Calibration phase (skipped while a recent calibration is cached)
+                    cached_threshold = _load_energy_threshold()
+                    if cached_threshold is not None:
+                        r.energy_threshold = cached_threshold
+                    else:
+                        if voice_on:
+                            print("🎤 Calibrating microphone... (Please wait)", flush=True)
+
+                        try:
+                            r.adjust_for_ambient_noise(source, duration=0.8)
+                            # Boost threshold slightly after calibration to avoid noise triggers
+                            r.energy_threshold = max(r.energy_threshold, 300)
+                            _save_energy_threshold(r.energy_threshold)
+                        except Exception as e:
+                            print(f"[STT] Calibration failed: {e}. Retrying...", flush=True)
+                            time.sleep(1.0)
+                            continue # Retry outer loop (re-open mic)
 
                     # Import TTS
                     try:
@@ -380,7 +578,7 @@ def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Calla
                     except ImportError:
                         tts = None
                     
-                    if _voice_status_enabled():
+                    if voice_on:
                         print("✓ Ready! Listening for voice commands...\n", flush=True)
                     
                     consecutive_listen_errors = 0
@@ -390,20 +588,15 @@ def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Calla
                         if callable(should_continue) and not should_continue():
                             return
                         
-                        # 1. TTS Backoff
-                        tts_wait_count = 0
-                        while tts and getattr(tts, "is_busy", lambda: False)():
-                            time.sleep(0.15)
-                            tts_wait_count += 1
-                            if tts_wait_count > 40: break # Max 6s wait
-                        
-                        if tts_wait_count > 0:
+                        # 1. TTS Backoff: block until speech ends (max 6s) instead of polling
+                        if tts and tts.is_busy():
+                            tts.wait_until_idle(timeout=6.0)
                             time.sleep(0.2) # Small gap after speaking
                         
                         try:
                             # 2. Listening Phase
                             _play_listening_start()
-                            if _voice_status_enabled():
+                            if voice_on:
                                 print("🎧 Listening...", end="\r", flush=True)
                             
                             try:
@@ -413,16 +606,16 @@ def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Calla
                                 # Silence (normal)
                                 continue
                             except Exception as e:
-                                if settings.STT_DEBUG:
+                                if stt_debug:
                                     print(f"\n[STT] Listen error: {e}", flush=True)
                                 continue
                             
-                            if _voice_status_enabled():
+                            if voice_on:
                                 print("                  ", end="\r", flush=True) # Clear line
 
                             # 3. Recognition Phase
                             try:
-                                text = r.recognize_google(audio, language=settings.STT_LANG)
+                                text = r.recognize_google(audio, language=stt_lang)
                             except sr.UnknownValueError:
                                 # Speech unintelligible
                                 _play_error_beep()
@@ -438,17 +631,18 @@ def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Calla
                                 
                             # 4. Success Phase
                             _play_listening_recognized()
-                            if _voice_status_enabled():
+                            if voice_on:
                                 print(f"📝 You said: \"{text}\"", flush=True)
                             
                             # 5. Execution Phase
-                            if _voice_status_enabled():
+                            if voice_on:
                                 print("⚡ Executing...", flush=True)
                             
                             try:
+                                _barge_in_for_command()
                                 on_command(text)
                                 _play_action_complete()
-                                if _voice_status_enabled():
+                                if voice_on:
                                     print("✅ Done!\n", flush=True)
                             except Exception as exec_err:
                                 _play_error_beep()
@@ -466,6 +660,7 @@ def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Calla
 
             except OSError as os_err:
                 print(f"[STT] Microphone hardware error: {os_err}. Retrying in 2s...", flush=True)
+                invalidate_device_cache()
                 time.sleep(2.0)
             except Exception as e:
                 print(f"[STT] Critical error: {e}. Retrying in 2s...", flush=True)
@@ -484,21 +679,26 @@ def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Calla
             model = Model(model_path)
             rec = KaldiRecognizer(model, 16000)
             rec.SetWords(True)
-            pa = pyaudio.PyAudio()
-            stream = pa.open(format=pyaudio.paInt16, channels=1, rate=16000, input=True, frames_per_buffer=4000)
+            pa = _get_pa()
+            if pa is None:
+                raise RuntimeError("PyAudio unavailable")
+            block = max(1, int(settings.VOSK_BLOCK_FRAMES))
+            stream = pa.open(format=pyaudio.paInt16, channels=1, rate=16000, input=True, frames_per_buffer=block)
             stream.start_stream()
             while True:
                 if callable(should_continue) and not should_continue():
                     try:
-                        stream.stop_stream(); stream.close(); pa.terminate()
+                        stream.stop_stream(); stream.close()
                     except Exception:
                         pass
                     return
+                # Speak-then-listen: don't pick up (or cut) our own reply
                 try:
-                    tts_stop()
+                    if tts_is_busy():
+                        tts_wait_until_idle(timeout=6.0)
                 except Exception:
                     pass
-                data = stream.read(4000, exception_on_overflow=False)
+                data = stream.read(block, exception_on_overflow=False)
                 if len(data) == 0:
                     continue
                 if rec.AcceptWaveform(data):
@@ -520,6 +720,7 @@ def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Calla
                         else:
                             continue
                     if (not settings.ENABLE_WAKE_WORD) or (now <= active_until):
+                        _barge_in_for_command()
                         on_command(text)
         except Exception:
             # Fall through to polling fallback if streaming not available
@@ -530,7 +731,8 @@ def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Calla
         if callable(should_continue) and not should_continue():
             return
         try:
-            tts_stop()
+            if tts_is_busy():
+                tts_wait_until_idle(timeout=6.0)
         except Exception:
             pass
         text = listen_once(timeout=2.0, phrase_time_limit=6.0)
@@ -550,4 +752,5 @@ def continuous_listen(on_command: Callable[[str], None], on_wake: Optional[Calla
             else:
                 continue
         if (not settings.ENABLE_WAKE_WORD) or (now <= active_until):
+            _barge_in_for_command()
             on_command(text)
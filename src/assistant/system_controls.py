@@ -2,17 +2,195 @@
 
 from __future__ import annotations
 
+import atexit
+import base64
 import ctypes
+import os
+import queue
 import subprocess
-from typing import Optional
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .win_input import KEYEVENTF_KEYUP, key_taps, send_inputs
+
+_IS_WINDOWS = os.name == "nt"
+
+try:
+    import comtypes.client as _comtypes_client
+except Exception:  # pragma: no cover - comtypes is optional (Windows only)
+    _comtypes_client = None
+
+try:
+    from comtypes import CLSCTX_ALL
+    from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+except Exception:  # pragma: no cover - pycaw/comtypes are optional (Windows only)
+    CLSCTX_ALL = None
+    AudioUtilities = None
+    IAudioEndpointVolume = None
+
+# WmiMonitorBrightnessMethods instances, resolved once per process
+_BRIGHTNESS_CACHE: Optional[List[Any]] = None
+_BRIGHTNESS_LOCK = threading.Lock()
+
+# Activated IAudioEndpointVolume pointers for the default speaker/microphone
+_VOLUME_EP: Any = None
+_MIC_EP: Any = None
+_VOLUME_LOCK = threading.Lock()
+
+
+def _activate_endpoint(device: Any) -> Any:
+    interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+    return ctypes.cast(interface, ctypes.POINTER(IAudioEndpointVolume))
+
+
+def _get_endpoint_volume(refresh: bool = False) -> Any:
+    """Return the cached speaker endpoint, activating it on first use."""
+    global _VOLUME_EP
+    if AudioUtilities is None:
+        raise RuntimeError("pycaw is not available")
+    with _VOLUME_LOCK:
+        if _VOLUME_EP is None or refresh:
+            _VOLUME_EP = _activate_endpoint(AudioUtilities.GetSpeakers())
+        return _VOLUME_EP
+
+
+def _get_mic_endpoint_volume(refresh: bool = False) -> Any:
+    """Return the cached microphone endpoint, activating it on first use."""
+    global _MIC_EP
+    if AudioUtilities is None:
+        raise RuntimeError("pycaw is not available")
+    with _VOLUME_LOCK:
+        if _MIC_EP is None or refresh:
+            _MIC_EP = _activate_endpoint(AudioUtilities.GetMicrophone())
+        return _MIC_EP
+
+
+def _with_endpoint(getter: Callable[..., Any], fn: Callable[[Any], Any]) -> Any:
+    """Run ``fn`` on a cached endpoint, re-activating once if the pointer went stale
+    (e.g. the default device changed)."""
+    try:
+        return fn(getter())
+    except Exception:
+        return fn(getter(refresh=True))
+
+
+@atexit.register
+def _release_endpoints() -> None:
+    global _VOLUME_EP, _MIC_EP
+    with _VOLUME_LOCK:
+        _VOLUME_EP = None
+        _MIC_EP = None
+
+
+class _PSHost:
+    """A single long-lived ``powershell -Command -`` process fed over stdin.
+
+    PowerShell startup and .NET JIT dominate one-off invocations, so helpers
+    send commands to one resident process and read stdout up to a sentinel.
+    A command that times out kills the host; the next call starts a new one.
+    """
+
+    _SENTINEL = "<<<KYPZER-PS-DONE>>>"
+
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+        # Functions already defined in the current host process
+        self._defined: set = set()
+
+    def _ensure(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._lines = queue.Queue()
+            self._defined = set()
+            self._proc = subprocess.Popen(
+                ["powershell", "-NoProfile", "-NoLogo", "-NonInteractive", "-Command", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=-1,
+                text=True,
+            )
+            threading.Thread(target=self._pump, args=(self._proc, self._lines), daemon=True).start()
+        return self._proc
+
+    @staticmethod
+    def _pump(proc: subprocess.Popen, lines: "queue.Queue[Optional[str]]") -> None:
+        for line in proc.stdout:  # type: ignore[union-attr]
+            lines.put(line.rstrip("\r\n"))
+        lines.put(None)
+
+    def run(self, command: str, timeout: float = 30.0) -> Tuple[bool, str]:
+        """Run a single-line command; returns (succeeded, stdout)."""
+        with self._lock:
+            proc = self._ensure()
+            wrapped = (
+                f"try {{ {command}; $__ok = $? }} catch {{ $__ok = $false }}; "
+                f"Write-Output \"{self._SENTINEL}$__ok\"\n"
+            )
+            try:
+                proc.stdin.write(wrapped)  # type: ignore[union-attr]
+                proc.stdin.flush()  # type: ignore[union-attr]
+            except Exception:
+                self._kill()
+                return False, ""
+            out: List[str] = []
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    line = self._lines.get(timeout=max(0.0, remaining))
+                except queue.Empty:
+                    self._kill()
+                    return False, "\n".join(out)
+                if line is None:
+                    self._proc = None
+                    return False, "\n".join(out)
+                if line.startswith(self._SENTINEL):
+                    return line[len(self._SENTINEL):] == "True", "\n".join(out)
+                out.append(line)
+
+    def call(self, name: str, definition_b64: str, args: str = "", timeout: float = 30.0) -> Tuple[bool, str]:
+        """Invoke function ``name``, defining it from its encoded script once per host.
+
+        ``definition_b64`` is the UTF-16LE/base64 encoding of a script that
+        defines the function (the same encoding ``-EncodedCommand`` uses), so
+        the body is parsed once and needs no quoting when sent over stdin.
+        """
+        if name not in self._defined:
+            ok, _ = self.run(
+                ". ([ScriptBlock]::Create([Text.Encoding]::Unicode.GetString("
+                f"[Convert]::FromBase64String('{definition_b64}'))))"
+            )
+            if not ok:
+                return False, ""
+            self._defined.add(name)
+        return self.run(f"{name} {args}".strip(), timeout)
+
+    def _kill(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is not None:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._kill()
+
+
+_PS_HOST = _PSHost()
+atexit.register(_PS_HOST.close)
 
 
 def shutdown(action: str) -> bool:
     try:
         if action == "shutdown":
-            subprocess.Popen(["shutdown", "/s", "/t", "0"], shell=True)
+            subprocess.Popen(["shutdown", "/s", "/t", "0"])
         elif action == "restart":
-            subprocess.Popen(["shutdown", "/r", "/t", "0"], shell=True)
+            subprocess.Popen(["shutdown", "/r", "/t", "0"])
         elif action == "sleep":
             ctypes.windll.powrprof.SetSuspendState(False, False, False)
         elif action == "lock":
@@ -26,47 +204,163 @@ def shutdown(action: str) -> bool:
         return False
 
 
+def _brightness_methods() -> List[Any]:
+    global _BRIGHTNESS_CACHE
+    if _BRIGHTNESS_CACHE is None:
+        if _comtypes_client is None:
+            raise RuntimeError("comtypes is not available")
+        svc = _comtypes_client.CoGetObject(r"winmgmts:\\.\root\WMI", dynamic=True)
+        _BRIGHTNESS_CACHE = list(svc.InstancesOf("WmiMonitorBrightnessMethods"))
+    return _BRIGHTNESS_CACHE
+
+
+def _set_brightness_wmi(percent: int) -> bool:
+    """Set brightness on every WMI-capable monitor in-process via COM."""
+    global _BRIGHTNESS_CACHE
+    with _BRIGHTNESS_LOCK:
+        try:
+            methods = _brightness_methods()
+            if not methods:
+                return False
+            for method in methods:
+                method.WmiSetBrightness(1, percent)
+            return True
+        except Exception:
+            # Stale or unavailable COM objects; re-resolve next time
+            _BRIGHTNESS_CACHE = None
+            return False
+
+
 def set_display_brightness(percent: int) -> bool:
     percent = max(0, min(100, int(percent)))
+    if _set_brightness_wmi(percent):
+        return True
     ps = (
         rf"$brightness={percent}; "
         "Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightnessMethods "
         "| ForEach-Object { $_.WmiSetBrightness(1,$brightness) }"
     )
     try:
-        subprocess.run(["powershell", "-NoProfile", "-Command", ps], check=True)
-        return True
+        ok, _ = _PS_HOST.run(ps)
+        return ok
     except Exception:
         return False
 
 
+_IF_TYPE_IEEE80211 = 71
+_GAA_FLAG_SKIP_ADDRESSES = 0x0001 | 0x0002 | 0x0004 | 0x0008
+_ERROR_BUFFER_OVERFLOW = 111
+_WIFI_ADAPTER_TTL = 30.0
+_WIFI_ADAPTER_CACHE: Dict[str, Any] = {"ts": 0.0, "names": []}
+
+
+class _IP_ADAPTER_ADDRESSES(ctypes.Structure):
+    """Leading fields of IP_ADAPTER_ADDRESSES (only what we read)."""
+
+
+_IP_ADAPTER_ADDRESSES._fields_ = [
+    ("Length", ctypes.c_ulong),
+    ("IfIndex", ctypes.c_ulong),
+    ("Next", ctypes.POINTER(_IP_ADAPTER_ADDRESSES)),
+    ("AdapterName", ctypes.c_char_p),
+    ("FirstUnicastAddress", ctypes.c_void_p),
+    ("FirstAnycastAddress", ctypes.c_void_p),
+    ("FirstMulticastAddress", ctypes.c_void_p),
+    ("FirstDnsServerAddress", ctypes.c_void_p),
+    ("DnsSuffix", ctypes.c_wchar_p),
+    ("Description", ctypes.c_wchar_p),
+    ("FriendlyName", ctypes.c_wchar_p),
+    ("PhysicalAddress", ctypes.c_ubyte * 8),
+    ("PhysicalAddressLength", ctypes.c_ulong),
+    ("Flags", ctypes.c_ulong),
+    ("Mtu", ctypes.c_ulong),
+    ("IfType", ctypes.c_ulong),
+]
+
+
+def _enumerate_wifi_adapters() -> List[str]:
+    """Return friendly names of 802.11 adapters via iphlpapi.GetAdaptersAddresses."""
+    iphlpapi = ctypes.windll.iphlpapi
+    size = ctypes.c_ulong(16 * 1024)
+    for _ in range(3):
+        buf = ctypes.create_string_buffer(size.value)
+        rc = iphlpapi.GetAdaptersAddresses(0, _GAA_FLAG_SKIP_ADDRESSES, None, buf, ctypes.byref(size))
+        if rc != _ERROR_BUFFER_OVERFLOW:
+            break
+    if rc != 0:
+        return []
+    names: List[str] = []
+    node = ctypes.cast(buf, ctypes.POINTER(_IP_ADAPTER_ADDRESSES))
+    while node:
+        entry = node.contents
+        if entry.IfType == _IF_TYPE_IEEE80211 and entry.FriendlyName:
+            names.append(entry.FriendlyName)
+        node = entry.Next
+    return names
+
+
+def _list_wifi_adapters() -> List[str]:
+    """Wi-Fi adapter names, cached for a short TTL between toggles."""
+    now = time.monotonic()
+    if _WIFI_ADAPTER_CACHE["names"] and now - _WIFI_ADAPTER_CACHE["ts"] < _WIFI_ADAPTER_TTL:
+        return list(_WIFI_ADAPTER_CACHE["names"])
+    try:
+        names = _enumerate_wifi_adapters()
+    except Exception:
+        names = []
+    if names:
+        _WIFI_ADAPTER_CACHE["names"] = names
+        _WIFI_ADAPTER_CACHE["ts"] = now
+    return names
+
+
+def _change_wifi_state_netsh(enabled: bool) -> bool:
+    # Disabled adapters are not reported by GetAdaptersAddresses, so enabling
+    # relies on the cached list; the PowerShell path covers a cold cache.
+    names = _list_wifi_adapters()
+    if not names:
+        return False
+    state = "enabled" if enabled else "disabled"
+    ok = True
+    for name in names:
+        result = subprocess.run(
+            ["netsh", "interface", "set", "interface", f"name={name}", f"admin={state}"],
+            capture_output=True,
+        )
+        ok = ok and result.returncode == 0
+    return ok
+
+
+_WIFI_PS_FUNCTION = (
+    "function Set-KypzerWifiState { param($enable) "
+    "$adapters = Get-NetAdapter | Where-Object { $_.Name -like '*Wi-Fi*' -or $_.InterfaceDescription -like '*Wireless*' }; "
+    "if (-not $adapters) { $adapters = Get-NetAdapter | Where-Object { $_.Status -ne 'Disabled' } } "
+    "if (-not $adapters) { throw 'no network adapters' } "
+    "foreach ($adapter in $adapters) { "
+    "  if ($enable) { Enable-NetAdapter -Name $adapter.Name -Confirm:$false -ErrorAction SilentlyContinue } "
+    "  else { Disable-NetAdapter -Name $adapter.Name -Confirm:$false -ErrorAction SilentlyContinue } "
+    "} }"
+)
+_WIFI_PS_B64 = base64.b64encode(_WIFI_PS_FUNCTION.encode("utf-16-le")).decode("ascii")
+
+
 def change_wifi_state(enabled: bool) -> bool:
-    ps_body = (
-        "param($enable); "
-        "$adapters = Get-NetAdapter | Where-Object { $_.Name -like '*Wi-Fi*' -or $_.InterfaceDescription -like '*Wireless*' }; "
-        "if (-not $adapters) { $adapters = Get-NetAdapter | Where-Object { $_.Status -ne 'Disabled' } } "
-        "if (-not $adapters) { exit 1 } "
-        "foreach ($adapter in $adapters) { "
-        "  if ($enable) { Enable-NetAdapter -Name $adapter.Name -Confirm:$false -ErrorAction SilentlyContinue } "
-        "  else { Disable-NetAdapter -Name $adapter.Name -Confirm:$false -ErrorAction SilentlyContinue } "
-        "}"
-    )
-    cmd = [
-        "powershell",
-        "-NoProfile",
-        "-Command",
-        f"& {{ {ps_body} }} $({'$true' if enabled else '$false'})",
-    ]
     try:
-        subprocess.run(cmd, check=True)
-        return True
+        if _change_wifi_state_netsh(enabled):
+            return True
+    except Exception:
+        pass
+    try:
+        ok, _ = _PS_HOST.call("Set-KypzerWifiState", _WIFI_PS_B64, "$true" if enabled else "$false")
+        return ok
     except Exception:
         return False
 
 
 def open_bluetooth_settings() -> bool:
     try:
-        subprocess.Popen(["start", "ms-settings:bluetooth"], shell=True)
+        # ShellExecute the settings URI directly; no cmd.exe "start" hop
+        os.startfile("ms-settings:bluetooth")  # type: ignore[attr-defined]
         return True
     except Exception:
         return False
@@ -74,29 +368,22 @@ def open_bluetooth_settings() -> bool:
 
 def set_volume(percent: Optional[int] = None, delta: Optional[int] = None, mute: Optional[bool] = None) -> bool:
     # Try pycaw first (Primary method)
-    try:
-        from ctypes import POINTER, cast
-        from comtypes import CLSCTX_ALL
-        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-
-        devices = AudioUtilities.GetSpeakers()
-        interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-        volume = cast(POINTER(IAudioEndpointVolume), interface)
-        
+    def _apply(volume: Any) -> None:
         if percent is not None:
-            percent = max(0, min(100, int(percent)))
-            volume.SetMasterVolumeLevelScalar(percent / 100.0, None)
-        
+            volume.SetMasterVolumeLevelScalar(max(0, min(100, int(percent))) / 100.0, None)
+
         if delta is not None:
             # Check current first to add delta
             # If pycaw fails to get current, we might fail here, triggering fallback
             current = volume.GetMasterVolumeLevelScalar()
             step = delta / 100.0
             volume.SetMasterVolumeLevelScalar(max(0.0, min(1.0, current + step)), None)
-            
+
         if mute is not None:
             volume.SetMute(1 if mute else 0, None)
-            
+
+    try:
+        _with_endpoint(_get_endpoint_volume, _apply)
         return True
     except Exception:
         # Fallback to legacy API (Secondary method)
@@ -116,11 +403,7 @@ def set_volume(percent: Optional[int] = None, delta: Optional[int] = None, mute:
             
         if mute is not None:
             # Toggle mute via keypress if absolute setting fails
-            # 0xAD is VK_VOLUME_MUTE
-            import ctypes
-            ctypes.windll.user32.keybd_event(0xAD, 0, 0, 0)
-            ctypes.windll.user32.keybd_event(0xAD, 0, 2, 0)
-            return True
+            return _tap(VK_VOLUME_MUTE)
             
     except Exception:
         pass
@@ -130,60 +413,96 @@ def set_volume(percent: Optional[int] = None, delta: Optional[int] = None, mute:
 
 def set_microphone_mute(mute: bool) -> bool:
     """Best-effort microphone mute toggle. Returns False if unsupported."""
-    try:
-        from ctypes import POINTER, cast
-        from comtypes import CLSCTX_ALL
-        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-    except Exception:
+    if AudioUtilities is None:
         return False
     try:
         # Not all systems expose a simple default microphone endpoint; this may fail.
-        devices = AudioUtilities.GetMicrophone()
-        interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-        volume = cast(POINTER(IAudioEndpointVolume), interface)
-        volume.SetMute(1 if mute else 0, None)
+        _with_endpoint(_get_mic_endpoint_volume, lambda volume: volume.SetMute(1 if mute else 0, None))
         return True
     except Exception:
         return False
 
 
 def get_volume_percent() -> Optional[int]:
+    if AudioUtilities is None:
+        return None
     try:
-        from ctypes import POINTER, cast
-        from comtypes import CLSCTX_ALL
-        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+        scalar = _with_endpoint(_get_endpoint_volume, lambda volume: volume.GetMasterVolumeLevelScalar())
+        return int(round(max(0.0, min(1.0, float(scalar))) * 100))
     except Exception:
         return None
 
 
 def nudge_volume_steps(steps: int) -> bool:
-    """Adjust system volume using APPCOMMAND steps. Positive=up, Negative=down."""
+    """Adjust system volume by volume-key steps. Positive=up, Negative=down.
+
+    All key presses go out in one SendInput batch; WM_APPCOMMAND messages are
+    only used when SendInput is swallowed (e.g. by a secure desktop).
+    """
+    count = abs(int(steps))
+    if count == 0:
+        return True
     try:
-        import time
-        user32 = ctypes.windll.user32
-        SendMessageW = user32.SendMessageW
-        GetForegroundWindow = user32.GetForegroundWindow
-        WM_APPCOMMAND = 0x0319
-        APPCOMMAND_VOLUME_UP = 0x0a
-        APPCOMMAND_VOLUME_DOWN = 0x09
-        hwnd = GetForegroundWindow()
-        if hwnd == 0:
-            # Try desktop window
-            hwnd = user32.GetDesktopWindow()
-        cmd = APPCOMMAND_VOLUME_UP if steps > 0 else APPCOMMAND_VOLUME_DOWN
-        count = abs(int(steps))
+        if _send_key_taps(VK_VOLUME_UP if steps > 0 else VK_VOLUME_DOWN, count):
+            return True
+    except Exception:
+        pass
+    try:
+        cmd = _APPCOMMAND_VOLUME_UP if steps > 0 else _APPCOMMAND_VOLUME_DOWN
         for _ in range(count):
-            lparam = (cmd << 16)
-            try:
-                SendMessageW(hwnd, WM_APPCOMMAND, hwnd, lparam)
-            except Exception:
+            if not _send_appcommand(cmd):
                 return False
-            time.sleep(0.03)
         return True
     except Exception:
         return False
 
 
+_WM_APPCOMMAND = 0x0319
+_APPCOMMAND_VOLUME_UP = 0x0a
+_APPCOMMAND_VOLUME_DOWN = 0x09
+_SMTO_BLOCK = 0x0001
+_SMTO_ABORTIFHUNG = 0x0002
+_APPCOMMAND_TIMEOUT_MS = 50
+_TRAY_HWND: Optional[int] = None
+
+
+def _tray_hwnd(refresh: bool = False) -> int:
+    """Shell tray window handle; the shell always handles APPCOMMAND promptly."""
+    global _TRAY_HWND
+    if _TRAY_HWND is None or refresh:
+        _TRAY_HWND = _FindWindowW("Shell_TrayWnd", None) or 0
+    return _TRAY_HWND
+
+
+def _appcommand_to(hwnd: int, cmd: int) -> bool:
+    result = ctypes.c_size_t()
+    return bool(
+        _SendMessageTimeoutW(
+            hwnd,
+            _WM_APPCOMMAND,
+            hwnd,
+            cmd << 16,
+            _SMTO_ABORTIFHUNG | _SMTO_BLOCK,
+            _APPCOMMAND_TIMEOUT_MS,
+            ctypes.byref(result),
+        )
+    )
+
+
+def _send_appcommand(cmd: int) -> bool:
+    """Deliver WM_APPCOMMAND without blocking on a hung window.
+
+    Targets the tray window (re-resolved once on failure), then falls back to
+    the foreground or desktop window.
+    """
+    for refresh in (False, True):
+        hwnd = _tray_hwnd(refresh)
+        if hwnd and _appcommand_to(hwnd, cmd):
+            return True
+    hwnd = _GetForegroundWindow() or _GetDesktopWindow()
+    return _appcommand_to(hwnd, cmd)
+
+
 def set_volume_percent_via_steps(target_percent: int, step_percent: int = 2) -> bool:
     """Best-effort absolute set using APPCOMMAND steps by estimating step size.
     Default assumes ~2% per step (typical Windows behavior)."""
@@ -206,51 +525,78 @@ def set_volume_percent_via_steps(target_percent: int, step_percent: int = 2) ->
         return nudge_volume_steps(steps if delta > 0 else -steps)
     except Exception:
         return False
-    try:
-        devices = AudioUtilities.GetSpeakers()
-        interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-        volume = cast(POINTER(IAudioEndpointVolume), interface)
-        scalar = volume.GetMasterVolumeLevelScalar()
-        return int(round(max(0.0, min(1.0, float(scalar))) * 100))
-    except Exception:
-        return None
 
 
-def play_pause_media() -> bool:
-    """Toggle play/pause using media keys."""
+VK_VOLUME_MUTE = 0xAD
+VK_VOLUME_DOWN = 0xAE
+VK_VOLUME_UP = 0xAF
+VK_MEDIA_NEXT_TRACK = 0xB0
+VK_MEDIA_PREV_TRACK = 0xB1
+VK_MEDIA_STOP = 0xB2
+VK_MEDIA_PLAY_PAUSE = 0xB3
+
+
+# Private user32 handle with typed prototypes. Using our own WinDLL keeps these
+# argtypes from leaking into other modules that call ctypes.windll.user32.
+_USER32 = ctypes.WinDLL("user32") if _IS_WINDOWS else None  # type: ignore[attr-defined]
+if _USER32 is not None:
+    _keybd_event = _USER32.keybd_event
+    _keybd_event.argtypes = [ctypes.c_ubyte, ctypes.c_ubyte, ctypes.c_ulong, ctypes.c_size_t]
+    _keybd_event.restype = None
+    _SendMessageTimeoutW = _USER32.SendMessageTimeoutW
+    _SendMessageTimeoutW.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_uint,
+        ctypes.c_size_t,
+        ctypes.c_ssize_t,
+        ctypes.c_uint,
+        ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    _SendMessageTimeoutW.restype = ctypes.c_ssize_t
+    _FindWindowW = _USER32.FindWindowW
+    _FindWindowW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p]
+    _FindWindowW.restype = ctypes.c_void_p
+    _GetForegroundWindow = _USER32.GetForegroundWindow
+    _GetForegroundWindow.restype = ctypes.c_void_p
+    _GetDesktopWindow = _USER32.GetDesktopWindow
+    _GetDesktopWindow.restype = ctypes.c_void_p
+
+
+def _send_key_taps(vk: int, count: int = 1) -> bool:
+    """Send ``count`` down/up pairs for ``vk`` in a single SendInput call."""
+    if count <= 0:
+        return True
+    inputs = key_taps(vk, count)
+    return send_inputs(inputs) == len(inputs)
+
+
+def _tap(vk: int) -> bool:
     try:
-        import pyautogui
-        pyautogui.press("playpause")
+        if _send_key_taps(vk):
+            return True
+        _keybd_event(vk, 0, 0, 0)
+        _keybd_event(vk, 0, KEYEVENTF_KEYUP, 0)
         return True
     except Exception:
         return False
 
 
+def play_pause_media() -> bool:
+    """Toggle play/pause using media keys."""
+    return _tap(VK_MEDIA_PLAY_PAUSE)
+
+
 def stop_media() -> bool:
     """Stop media using media keys."""
-    try:
-        import pyautogui
-        pyautogui.press("stop")
-        return True
-    except Exception:
-        return False
+    return _tap(VK_MEDIA_STOP)
 
 
 def next_track() -> bool:
     """Skip to next track."""
-    try:
-        import pyautogui
-        pyautogui.press("nexttrack")
-        return True
-    except Exception:
-        return False
+    return _tap(VK_MEDIA_NEXT_TRACK)
 
 
 def prev_track() -> bool:
     """Go to previous track."""
-    try:
-        import pyautogui
-        pyautogui.press("prevtrack")
-        return True
-    except Exception:
-        return False
+    return _tap(VK_MEDIA_PREV_TRACK)
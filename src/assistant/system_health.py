@@ -12,21 +12,63 @@ friendly summary while logs/tests can inspect the richer metadata.
 
 from __future__ import annotations
 
+import array
 import ctypes
+import functools
+import math
 import os
-import platform
 import shutil
+import threading
 import time
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional, Tuple
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 try:  # pragma: no cover - psutil is optional in CI
     import psutil  # type: ignore
 except Exception:  # pragma: no cover
     psutil = None  # type: ignore
 
+try:
+    import numpy as _np
+except Exception:  # pragma: no cover - numpy is optional
+    _np = None
 
-@dataclass
+
+_T = TypeVar("_T")
+
+# Shared pool so the blocking CPU sample overlaps the other probes
+_PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-probe")
+
+
+def _ttl_cache(
+    seconds: float, clock: Callable[[], float] = time.monotonic
+) -> Callable[[Callable[[], _T]], Callable[[], _T]]:
+    """Cache a zero-argument probe's result for ``seconds`` as measured by ``clock``.
+
+    Watch loops sample faster than memory/disk/battery meaningfully change, so
+    repeated kernel probes within the window are served from memory.
+    """
+
+    def decorator(fn: Callable[[], _T]) -> Callable[[], _T]:
+        state: Dict[str, Any] = {"ts": None, "value": None}
+
+        @functools.wraps(fn)
+        def wrapper() -> _T:
+            now = clock()
+            if state["ts"] is None or now - state["ts"] >= seconds:
+                state["value"] = fn()
+                state["ts"] = now
+            return state["value"]
+
+        wrapper.cache_clear = lambda: state.update(ts=None, value=None)  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+@dataclass(slots=True)
 class SystemHealthReport:
     cpu_percent: Optional[float]
     cpu_count: int
@@ -37,16 +79,40 @@ class SystemHealthReport:
     disk_free_gb: Optional[float]
     uptime_hours: Optional[float]
     battery_percent: Optional[float]
-    issues: List[str]
+    issues: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Fields are flat primitives, so skip asdict()'s recursive deepcopy
+        return {
+            "cpu_percent": self.cpu_percent,
+            "cpu_count": self.cpu_count,
+            "memory_percent": self.memory_percent,
+            "total_memory_gb": self.total_memory_gb,
+            "available_memory_gb": self.available_memory_gb,
+            "disk_percent": self.disk_percent,
+            "disk_free_gb": self.disk_free_gb,
+            "uptime_hours": self.uptime_hours,
+            "battery_percent": self.battery_percent,
+            "issues": list(self.issues),
+        }
+
+
+# Below this delay, sample non-blockingly against the previous call's baseline
+_NONBLOCKING_CPU_DELAY = 0.05
+
+if psutil is not None:
+    try:  # prime psutil's baseline so the first non-blocking read is meaningful
+        psutil.cpu_percent(interval=None)
+    except Exception:  # pragma: no cover
+        pass
 
 
 def _get_cpu_percent(samples: int = 1, delay: float = 0.2) -> Optional[float]:
     if psutil is None:
         return None
     try:
+        if delay <= _NONBLOCKING_CPU_DELAY:
+            return psutil.cpu_percent(interval=None)
         return psutil.cpu_percent(interval=delay)
     except Exception:
         values: List[float] = []
@@ -58,23 +124,43 @@ def _get_cpu_percent(samples: int = 1, delay: float = 0.2) -> Optional[float]:
         return sum(values) / len(values) if values else None
 
 
-def _memory_via_ctypes() -> Optional[Dict[str, float]]:
-    class MEMORYSTATUSEX(ctypes.Structure):  # type: ignore
-        _fields_ = [
-            ("dwLength", ctypes.c_uint),
-            ("dwMemoryLoad", ctypes.c_uint),
-            ("ullTotalPhys", ctypes.c_ulonglong),
-            ("ullAvailPhys", ctypes.c_ulonglong),
-            ("ullTotalPageFile", ctypes.c_ulonglong),
-            ("ullAvailPageFile", ctypes.c_ulonglong),
-            ("ullTotalVirtual", ctypes.c_ulonglong),
-            ("ullAvailVirtual", ctypes.c_ulonglong),
-            ("sullAvailExtendedVirtual", ctypes.c_ulonglong),
-        ]
+_IS_WINDOWS = os.name == "nt"
+
+
+class MEMORYSTATUSEX(ctypes.Structure):  # type: ignore
+    _fields_ = [
+        ("dwLength", ctypes.c_uint),
+        ("dwMemoryLoad", ctypes.c_uint),
+        ("ullTotalPhys", ctypes.c_ulonglong),
+        ("ullAvailPhys", ctypes.c_ulonglong),
+        ("ullTotalPageFile", ctypes.c_ulonglong),
+        ("ullAvailPageFile", ctypes.c_ulonglong),
+        ("ullTotalVirtual", ctypes.c_ulonglong),
+        ("ullAvailVirtual", ctypes.c_ulonglong),
+        ("sullAvailExtendedVirtual", ctypes.c_ulonglong),
+    ]
+
+
+# Private kernel32 handle so typed prototypes don't leak into ctypes.windll
+_KERNEL32 = ctypes.WinDLL("kernel32") if _IS_WINDOWS else None  # type: ignore[attr-defined]
+if _KERNEL32 is not None:
+    _GMSE = _KERNEL32.GlobalMemoryStatusEx
+    _GMSE.argtypes = [ctypes.POINTER(MEMORYSTATUSEX)]
+    _GMSE.restype = ctypes.c_int
+    _GDFSE = _KERNEL32.GetDiskFreeSpaceExW
+    _GDFSE.argtypes = [
+        ctypes.c_wchar_p,
+        ctypes.POINTER(ctypes.c_ulonglong),
+        ctypes.POINTER(ctypes.c_ulonglong),
+        ctypes.POINTER(ctypes.c_ulonglong),
+    ]
+    _GDFSE.restype = ctypes.c_int
+
 
+def _memory_via_ctypes() -> Optional[Dict[str, float]]:
     stat = MEMORYSTATUSEX()
     stat.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
-    if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(stat)):  # type: ignore[attr-defined]
+    if not _GMSE(ctypes.byref(stat)):
         return None
     total = stat.ullTotalPhys / (1024 ** 3)
     avail = stat.ullAvailPhys / (1024 ** 3)
@@ -82,6 +168,7 @@ def _memory_via_ctypes() -> Optional[Dict[str, float]]:
     return {"total_gb": total, "available_gb": avail, "percent": percent}
 
 
+@_ttl_cache(0.5)
 def _memory_info() -> Tuple[Optional[float], Optional[float], Optional[float]]:
     if psutil is not None:
         try:
@@ -89,24 +176,54 @@ def _memory_info() -> Tuple[Optional[float], Optional[float], Optional[float]]:
             return info.percent, info.total / (1024 ** 3), info.available / (1024 ** 3)
         except Exception:
             pass
-    if os.name == "nt":
+    if _IS_WINDOWS:
         data = _memory_via_ctypes()
         if data:
             return data["percent"], data["total_gb"], data["available_gb"]
     return None, None, None
 
 
+_HOME_DIR = os.path.expanduser("~")
+# Root of the drive holding the home directory, e.g. "C:\\" (Windows only)
+_HOME_DRIVE = os.path.splitdrive(_HOME_DIR)[0] + "\\"
+
+
+def _disk_via_ctypes() -> Optional[Tuple[int, int]]:
+    free_to_caller = ctypes.c_ulonglong()
+    total = ctypes.c_ulonglong()
+    total_free = ctypes.c_ulonglong()
+    ok = _GDFSE(
+        _HOME_DRIVE,
+        ctypes.byref(free_to_caller),
+        ctypes.byref(total),
+        ctypes.byref(total_free),
+    )
+    if not ok or not total.value:
+        return None
+    return total.value, total_free.value
+
+
+@_ttl_cache(0.5)
 def _disk_info() -> Tuple[Optional[float], Optional[float]]:
+    usage = None
+    if _IS_WINDOWS:
+        try:
+            usage = _disk_via_ctypes()
+        except Exception:
+            usage = None
     try:
-        usage = shutil.disk_usage(os.path.expanduser("~"))
-        total_gb = usage.total / (1024 ** 3)
-        free_gb = usage.free / (1024 ** 3)
-        percent = 100 - ((usage.free / usage.total) * 100)
+        if usage is None:
+            du = shutil.disk_usage(_HOME_DIR)
+            usage = (du.total, du.free)
+        total, free = usage
+        free_gb = free / (1024 ** 3)
+        percent = 100 - ((free / total) * 100)
         return percent, free_gb
     except Exception:
         return None, None
 
 
+@_ttl_cache(0.5)
 def _battery_info() -> Optional[float]:
     if psutil is None:
         return None
@@ -119,30 +236,54 @@ def _battery_info() -> Optional[float]:
         return None
 
 
-def _uptime_hours() -> Optional[float]:
-    if psutil is not None:
+@functools.lru_cache(maxsize=1)
+def _psutil_boot_time() -> Optional[float]:
+    # Boot time never changes while the process runs
+    if psutil is None:
+        return None
+    try:
+        return float(psutil.boot_time())
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _boot_time_posix() -> Optional[float]:
+    # Raw os.read avoids TextIOWrapper setup for a ~30 byte file read once
+    try:
+        fd = os.open("/proc/uptime", os.O_RDONLY)
         try:
-            boot = psutil.boot_time()
-            return (time.time() - boot) / 3600.0
-        except Exception:
-            pass
+            data = os.read(fd, 64)
+        finally:
+            os.close(fd)
+        return time.time() - float(data.split(b" ", 1)[0])
+    except Exception:
+        return None
+
+
+def _uptime_hours() -> Optional[float]:
+    boot = _psutil_boot_time()
+    if boot is not None:
+        return (time.time() - boot) / 3600.0
     if os.name == "posix":
-        try:
-            with open("/proc/uptime", "r", encoding="utf-8") as fh:
-                seconds = float(fh.read().split()[0])
-            return seconds / 3600.0
-        except Exception:
-            return None
+        boot = _boot_time_posix()
+        if boot is not None:
+            return (time.time() - boot) / 3600.0
     return None
 
 
 def collect_system_health(samples: int = 1, sample_delay: float = 0.25) -> SystemHealthReport:
+    f_mem = _PROBE_EXECUTOR.submit(_memory_info)
+    f_disk = _PROBE_EXECUTOR.submit(_disk_info)
+    f_battery = _PROBE_EXECUTOR.submit(_battery_info)
+    f_uptime = _PROBE_EXECUTOR.submit(_uptime_hours)
+    # CPU sampling sleeps for ``sample_delay``; run it here while the pool works
     cpu_percent = _get_cpu_percent(samples=samples, delay=sample_delay)
     cpu_count = os.cpu_count() or 1
-    mem_percent, mem_total, mem_available = _memory_info()
-    disk_percent, disk_free = _disk_info()
-    uptime = _uptime_hours()
-    battery = _battery_info()
+    mem_percent, mem_total, mem_available = f_mem.result()
+    disk_percent, disk_free = f_disk.result()
+    uptime = f_uptime.result()
+    battery = f_battery.result()
 
     issues: List[str] = []
     if cpu_percent is not None and cpu_percent >= 85:
@@ -198,24 +339,186 @@ def system_health_report_action(params: Dict[str, Any]) -> Dict[str, Any]:
     return {"ok": True, "say": summary, "report": report.to_dict()}
 
 
-def system_health_watch_action(params: Dict[str, Any]) -> Dict[str, Any]:
+_SERIES_FIELDS = (
+    "cpu_percent",
+    "cpu_count",
+    "memory_percent",
+    "total_memory_gb",
+    "available_memory_gb",
+    "disk_percent",
+    "disk_free_gb",
+    "uptime_hours",
+    "battery_percent",
+)
+
+
+class HealthSeries:
+    """Columnar store of health samples (one float array per metric).
+
+    Aggregations over a watch (e.g. mean CPU) work on a single array instead
+    of walking per-sample dicts. Missing readings are stored as NaN.
+    """
+
+    __slots__ = ("columns", "issues")
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, array.array] = {name: array.array("d") for name in _SERIES_FIELDS}
+        self.issues: List[List[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    def append(self, report: SystemHealthReport) -> None:
+        for name, column in self.columns.items():
+            value = getattr(report, name)
+            column.append(math.nan if value is None else float(value))
+        self.issues.append(list(report.issues))
+
+    def as_arrays(self) -> Dict[str, Any]:
+        """Columns as numpy float arrays, or ``array.array('d')`` without numpy."""
+        if _np is not None:
+            return {name: _np.frombuffer(column, dtype=_np.float64).copy() for name, column in self.columns.items()}
+        return {name: array.array("d", column) for name, column in self.columns.items()}
+
+    def to_dict(self) -> Dict[str, List[Optional[float]]]:
+        return {
+            name: [None if math.isnan(v) else v for v in column]
+            for name, column in self.columns.items()
+        }
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Per-sample dicts matching ``SystemHealthReport.to_dict``."""
+        series = self.to_dict()
+        rows: List[Dict[str, Any]] = []
+        for i, issues in enumerate(self.issues):
+            row: Dict[str, Any] = {name: series[name][i] for name in _SERIES_FIELDS}
+            if row["cpu_count"] is not None:
+                row["cpu_count"] = int(row["cpu_count"])
+            row["issues"] = list(issues)
+            rows.append(row)
+        return rows
+
+
+@dataclass
+class _WatchJob:
+    job_id: str
+    duration: float
+    interval: float
+    thread: Optional[threading.Thread] = None
+    stop: threading.Event = field(default_factory=threading.Event)
+    series: HealthSeries = field(default_factory=HealthSeries)
+    on_done: Optional[Callable[[str], None]] = None
+    done: bool = False
+    finished_at: float = 0.0
+
+
+_WATCH_JOBS: Dict[str, _WatchJob] = {}
+_WATCH_LOCK = threading.Lock()
+# Finished jobs stay fetchable this long (seconds), then are dropped
+_WATCH_TTL = 600.0
+
+
+def _evict_finished_watches(now: float) -> None:
+    """Drop finished jobs older than ``_WATCH_TTL``; caller holds the lock."""
+    for job_id in [j.job_id for j in _WATCH_JOBS.values() if j.done and now - j.finished_at > _WATCH_TTL]:
+        del _WATCH_JOBS[job_id]
+
+
+def _run_watch(job: _WatchJob) -> None:
+    start = time.time()
+    try:
+        while time.time() - start < job.duration and not job.stop.is_set():
+            # The wait between samples is the measurement window; don't block again
+            report = collect_system_health(samples=1, sample_delay=0.0)
+            job.series.append(report)
+            if job.stop.wait(job.interval):
+                break
+    finally:
+        job.finished_at = time.monotonic()
+        job.done = True
+    # A job stopped via the result action already reported there
+    if job.on_done is not None and not job.stop.is_set():
+        try:
+            job.on_done(_watch_summary(job))
+        except Exception:
+            pass
+
+
+def _watch_summary(job: _WatchJob) -> str:
+    return f"Captured {len(job.series)} health samples over {int(job.duration)} seconds."
+
+
+def _watch_payload(job: _WatchJob, say: str) -> Dict[str, Any]:
+    return {
+        "ok": True,
+        "say": say,
+        "job_id": job.job_id,
+        "running": not job.done,
+        "samples": job.series.rows(),
+        "series": job.series.to_dict(),
+    }
+
+
+def system_health_watch_action(
+    params: Dict[str, Any], on_done: Optional[Callable[[str], None]] = None
+) -> Dict[str, Any]:
+    """Sample system health periodically.
+
+    Runs in a background thread and returns a ``job_id`` immediately;
+    ``on_done`` is called with the spoken summary when sampling finishes,
+    and the samples stay fetchable with
+    :func:`system_health_watch_result_action` for ``_WATCH_TTL`` seconds.
+    Pass ``wait=True`` to block until sampling finishes (previous behaviour).
+    """
     duration = float(params.get("duration") or 60)
     interval = float(params.get("interval") or 10)
     duration = max(5.0, min(600.0, duration))
     interval = max(2.0, min(120.0, interval))
-    snapshots: List[Dict[str, Any]] = []
-    start = time.time()
-    while time.time() - start < duration:
-        report = collect_system_health(samples=1, sample_delay=interval / 5)
-        snapshots.append(report.to_dict())
-        time.sleep(interval)
-    say = f"Captured {len(snapshots)} health samples over {int(duration)} seconds."
-    return {"ok": True, "say": say, "samples": snapshots}
+    job = _WatchJob(job_id=uuid.uuid4().hex[:8], duration=duration, interval=interval)
+    if params.get("wait"):
+        _run_watch(job)
+        return _watch_payload(job, _watch_summary(job))
+    job.on_done = on_done
+    job.thread = threading.Thread(target=_run_watch, args=(job,), name=f"health-watch-{job.job_id}", daemon=True)
+    with _WATCH_LOCK:
+        _evict_finished_watches(time.monotonic())
+        _WATCH_JOBS[job.job_id] = job
+    job.thread.start()
+    say = f"Watching system health for {int(duration)} seconds in the background."
+    return {"ok": True, "say": say, "job_id": job.job_id}
+
+
+def system_health_watch_result_action(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Return samples for a watch job (latest job if no ``job_id``).
+
+    ``stop=True`` interrupts a running job; ``wait=True`` joins it first.
+    Finished jobs are removed once their result is returned.
+    """
+    job_id = str(params.get("job_id") or "").strip()
+    with _WATCH_LOCK:
+        _evict_finished_watches(time.monotonic())
+        if not job_id and _WATCH_JOBS:
+            job_id = next(reversed(_WATCH_JOBS))
+        job = _WATCH_JOBS.get(job_id)
+    if job is None:
+        return {"ok": False, "say": "I couldn't find that health watch."}
+    if params.get("stop"):
+        job.stop.set()
+    if (params.get("stop") or params.get("wait")) and job.thread is not None:
+        job.thread.join()
+    if not job.done:
+        say = f"Still watching system health; {len(job.series)} samples so far."
+        return _watch_payload(job, say)
+    with _WATCH_LOCK:
+        _WATCH_JOBS.pop(job.job_id, None)
+    return _watch_payload(job, _watch_summary(job))
 
 
 __all__ = [
+    "HealthSeries",
     "collect_system_health",
     "format_system_health",
     "system_health_report_action",
     "system_health_watch_action",
+    "system_health_watch_result_action",
 ]
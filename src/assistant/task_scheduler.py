@@ -15,19 +15,28 @@ This module provides scheduled task functionality for the PC Controller assistan
 
 from __future__ import annotations
 
+import functools
+import heapq
 import json
 import os
 import re
+import secrets
+import sqlite3
 import threading
 import time
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable, Union
-from uuid import uuid4
+from typing import Any, Dict, Iterable, List, Optional, Callable, Union
 import hashlib
 
+try:
+    import orjson as _orjson
+except Exception:  # pragma: no cover - orjson is optional
+    _orjson = None
+
 
 # -----------------------------------------------------------------------------
 # CONSTANTS
@@ -35,7 +44,8 @@ import hashlib
 
 # Default storage location
 DEFAULT_STORAGE_DIR = Path(__file__).parent.parent.parent / "data" / "scheduled_tasks"
-TASKS_FILE = "scheduled_tasks.json"
+TASKS_FILE = "scheduled_tasks.json"  # legacy format, imported into TASKS_DB once
+TASKS_DB = "scheduled_tasks.db"
 
 # Time word mappings
 TIME_WORDS: Dict[str, tuple] = {
@@ -70,6 +80,39 @@ DAY_WORDS: Dict[str, int] = {
     "day after": 2,
 }
 
+
+def _word_alternation(words) -> re.Pattern:
+    """Compile a whole-word alternation, longest phrase first so it wins ties."""
+    ordered = sorted(words, key=len, reverse=True)
+    body = "|".join(r"\s+".join(map(re.escape, w.split())) for w in ordered)
+    return re.compile(r"\b(" + body + r")\b")
+
+
+# Precompiled patterns for the time and command parsers
+_TIME_WORD_RE = _word_alternation(TIME_WORDS)
+_DAY_WORD_RE = _word_alternation(DAY_WORDS)
+# Gate for parse_scheduled_task_command: at/on as words, the other keywords
+# as word prefixes (reminder, scheduled), and am/pm also straight after a digit.
+_SCHEDULE_TRIGGER_RE = re.compile(
+    r"\b(?:at|on)\b"
+    r"|\b(?:schedul|remind|later|tomorrow|morning|afternoon|evening|tonight)"
+    r"|(?:\b|(?<=\d))[ap]\.?m\b"
+)
+_RELATIVE_RE = re.compile(r"(?:in|after)\s+(\d+)\s*(hours?|minutes?|mins?|hrs?)")
+_CLOCK_TIME_RE = re.compile(r"(\d{1,2})(?::?(\d{2}))?\s*([ap]\.?m\.?)?")
+_TIME_EXPR_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?:at|on)\s+(\d{1,2}(?::?\d{2})?\s*(?:[ap]\.?m\.?)?)",
+    r"(tomorrow\s+(?:morning|afternoon|evening|night)?)",
+    r"(tonight|this\s+evening|this\s+afternoon)",
+    r"(?:in|after)\s+(\d+\s+(?:hours?|minutes?))",
+    r"(morning|afternoon|evening)\s+(?:at\s+)?(\d{1,2}(?::?\d{2})?\s*(?:[ap]\.?m\.?)?)?",
+))
+_WA_SEND_RE = re.compile(r"(?:send|message|msg|bhej)\s+(.+?)\s+(?:to|for|tu|ko)\s+(.+)", re.IGNORECASE)
+_VOLUME_RE = re.compile(r"(?:set\s+)?volume\s+(?:to\s+)?(\d+)%?")
+_PLAY_RE = re.compile(r"play\s+(.+)")
+_REMIND_RE = re.compile(r"remind\s+(?:me\s+)?(?:to\s+)?(.+)")
+_FILLER_PREFIX_RE = re.compile(r"^(please|kindly)\s+", re.IGNORECASE)
+
 # Recurrence patterns
 class RecurrenceType(Enum):
     NONE = "none"
@@ -90,20 +133,61 @@ class TaskStatus(Enum):
 # DATA CLASSES
 # -----------------------------------------------------------------------------
 
-@dataclass
+def _iso(value: Union[datetime, str, None]) -> Optional[str]:
+    """ISO string for a datetime, passing through values not yet parsed."""
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+@dataclass(slots=True)
 class ScheduledTask:
     """Represents a scheduled task."""
     task_id: str
     task_type: str  # e.g., "whatsapp_send", "volume_set", "play_song"
     parameters: Dict[str, Any]
     scheduled_time: datetime
-    created_at: datetime = field(default_factory=datetime.now)
+    # created_at/last_executed are cold fields: from_dict stores their ISO
+    # strings as-is and the properties below parse them on first access.
+    _created_at: Union[datetime, str] = field(default_factory=datetime.now, repr=False)
     status: TaskStatus = TaskStatus.PENDING
     recurrence: RecurrenceType = RecurrenceType.NONE
     description: str = ""
     execution_count: int = 0
-    last_executed: Optional[datetime] = None
+    _last_executed: Union[datetime, str, None] = field(default=None, repr=False)
     error_message: Optional[str] = None
+    # Epoch mirror of scheduled_time for cheap due checks and heap ordering;
+    # from_dict seeds it from the stored value to skip the local-time conversion.
+    _scheduled_ts: Optional[float] = field(default=None, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        if self._scheduled_ts is None:
+            self._scheduled_ts = self.scheduled_time.timestamp()
+    
+    @property
+    def created_at(self) -> datetime:
+        if isinstance(self._created_at, str):
+            self._created_at = datetime.fromisoformat(self._created_at)
+        return self._created_at
+    
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_at = value
+    
+    @property
+    def last_executed(self) -> Optional[datetime]:
+        if isinstance(self._last_executed, str):
+            self._last_executed = datetime.fromisoformat(self._last_executed)
+        return self._last_executed
+    
+    @last_executed.setter
+    def last_executed(self, value: Optional[datetime]) -> None:
+        self._last_executed = value
+    
+    def reschedule(self, when: datetime) -> None:
+        """Move the task to a new time, keeping the epoch mirror in sync."""
+        self.scheduled_time = when
+        self._scheduled_ts = when.timestamp()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON storage."""
@@ -112,12 +196,13 @@ class ScheduledTask:
             "task_type": self.task_type,
             "parameters": self.parameters,
             "scheduled_time": self.scheduled_time.isoformat(),
-            "created_at": self.created_at.isoformat(),
+            "scheduled_ts": self._scheduled_ts,
+            "created_at": _iso(self._created_at),
             "status": self.status.value,
             "recurrence": self.recurrence.value,
             "description": self.description,
             "execution_count": self.execution_count,
-            "last_executed": self.last_executed.isoformat() if self.last_executed else None,
+            "last_executed": _iso(self._last_executed),
             "error_message": self.error_message,
         }
     
@@ -129,31 +214,36 @@ class ScheduledTask:
             task_type=data["task_type"],
             parameters=data["parameters"],
             scheduled_time=datetime.fromisoformat(data["scheduled_time"]),
-            created_at=datetime.fromisoformat(data.get("created_at", datetime.now().isoformat())),
+            _created_at=data.get("created_at") or datetime.now(),
             status=TaskStatus(data.get("status", "pending")),
             recurrence=RecurrenceType(data.get("recurrence", "none")),
             description=data.get("description", ""),
             execution_count=data.get("execution_count", 0),
-            last_executed=datetime.fromisoformat(data["last_executed"]) if data.get("last_executed") else None,
+            _last_executed=data.get("last_executed") or None,
             error_message=data.get("error_message"),
+            _scheduled_ts=data.get("scheduled_ts"),
         )
     
     @property
     def is_due(self) -> bool:
         """Check if task is due for execution."""
+        return self.is_due_at(time.time())
+    
+    def is_due_at(self, now: float) -> bool:
+        """Check due-ness against a caller-supplied epoch (one clock read per batch)."""
         return (
-            self.status == TaskStatus.PENDING and
-            datetime.now() >= self.scheduled_time
+            self.status is TaskStatus.PENDING and
+            now >= self._scheduled_ts
         )
     
     @property
     def time_until(self) -> timedelta:
         """Get time until scheduled execution."""
-        return self.scheduled_time - datetime.now()
+        return timedelta(seconds=self._scheduled_ts - time.time())
     
-    def get_friendly_time(self) -> str:
+    def get_friendly_time(self, now: Optional[datetime] = None) -> str:
         """Get human-friendly time description."""
-        now = datetime.now()
+        now = now or datetime.now()
         diff = self.scheduled_time - now
         
         if diff.days < 0:
@@ -188,34 +278,53 @@ def parse_time_expression(text: str, base_time: Optional[datetime] = None) -> Op
         - "at 8pm tomorrow" -> tomorrow at 8:00 PM
         - "in 2 hours" -> now + 2 hours
         - "after 30 minutes" -> now + 30 minutes
+    
+    Without an explicit base_time the parse is memoized per (text, minute);
+    relative offsets are still applied to the exact current time.
     """
     if not text:
         return None
     
-    base = base_time or datetime.now()
     low = text.lower().strip()
+    if base_time is None:
+        base = datetime.now()
+        spec = _parse_time_spec_cached(low, base.replace(second=0, microsecond=0))
+    else:
+        base = base_time
+        spec = _parse_time_spec(low, base)
+    
+    if spec is None:
+        return None
+    kind, value = spec
+    return base + value if kind == "delta" else value
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_time_spec_cached(low: str, minute: datetime) -> Optional[tuple]:
+    return _parse_time_spec(low, minute)
+
+
+def _parse_time_spec(low: str, base: datetime) -> Optional[tuple]:
+    """Parse lowercased text into ("delta", timedelta) or ("at", datetime)."""
     
     # Pattern: "in X hours/minutes"
-    relative_match = re.search(r"(?:in|after)\s+(\d+)\s*(hours?|minutes?|mins?|hrs?)", low)
+    relative_match = _RELATIVE_RE.search(low)
     if relative_match:
         amount = int(relative_match.group(1))
         unit = relative_match.group(2).lower()
         
         if unit.startswith("h"):
-            return base + timedelta(hours=amount)
+            return ("delta", timedelta(hours=amount))
         else:
-            return base + timedelta(minutes=amount)
+            return ("delta", timedelta(minutes=amount))
     
     # Find day offset
-    day_offset = 0
-    for day_word, offset in DAY_WORDS.items():
-        if day_word in low:
-            day_offset = offset
-            break
+    day_match = _DAY_WORD_RE.search(low)
+    day_offset = DAY_WORDS[" ".join(day_match.group(1).split())] if day_match else 0
     
     # Pattern: explicit time like "7:30pm", "19:30", "8 pm", "1:55 a.m.", "215am"
     # Handles optional dots in am/pm and optional colon
-    time_match = re.search(r"(\d{1,2})(?::?(\d{2}))?\s*([ap]\.?m\.?)?", low)
+    time_match = _CLOCK_TIME_RE.search(low)
     
     if time_match:
         hour = int(time_match.group(1))
@@ -241,26 +350,27 @@ def parse_time_expression(text: str, base_time: Optional[datetime] = None) -> Op
         if day_offset == 0 and result <= base:
             result += timedelta(days=1)
         
-        return result
+        return ("at", result)
     
     # Check for time words (morning, afternoon, etc.)
-    for time_word, (hour, minute) in TIME_WORDS.items():
-        if time_word in low:
-            result = base.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            result += timedelta(days=day_offset)
-            
-            # If time already passed today, schedule for tomorrow
-            if day_offset == 0 and result <= base:
-                result += timedelta(days=1)
-            
-            return result
+    word_match = _TIME_WORD_RE.search(low)
+    if word_match:
+        hour, minute = TIME_WORDS[" ".join(word_match.group(1).split())]
+        result = base.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        result += timedelta(days=day_offset)
+        
+        # If time already passed today, schedule for tomorrow
+        if day_offset == 0 and result <= base:
+            result += timedelta(days=1)
+        
+        return ("at", result)
     
     return None
 
 
-def format_time_friendly(dt: datetime) -> str:
+def format_time_friendly(dt: datetime, now: Optional[datetime] = None) -> str:
     """Format datetime in a friendly way."""
-    now = datetime.now()
+    now = now or datetime.now()
     today = now.date()
     tomorrow = today + timedelta(days=1)
     
@@ -276,75 +386,224 @@ def format_time_friendly(dt: datetime) -> str:
 # TASK STORAGE
 # -----------------------------------------------------------------------------
 
+_UPSERT_SQL = (
+    "INSERT OR REPLACE INTO tasks(task_id, scheduled_ts, status, blob) VALUES (?, ?, ?, ?)"
+)
+
+
+def _json_loads(raw: bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(data, option=_orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _task_row(task: ScheduledTask) -> tuple:
+    """Row tuple for _UPSERT_SQL; the full task rides along as a JSON blob."""
+    return (task.task_id, task._scheduled_ts, task.status.value, _json_dumps(task.to_dict()))
+
+
 class TaskStorage:
-    """Persistent storage for scheduled tasks."""
+    """Persistent storage for scheduled tasks.
+
+    Tasks live in a SQLite database (WAL mode), one row per task, so a
+    mutation touches a single row instead of rewriting the whole set. An
+    in-memory index keyed by task_id serves reads and is only rebuilt when
+    another connection changes the database (``PRAGMA data_version``).
+    A legacy ``scheduled_tasks.json`` is imported the first time the
+    database is created.
+    """
     
     def __init__(self, storage_dir: Optional[Path] = None):
         self.storage_dir = Path(storage_dir) if storage_dir else DEFAULT_STORAGE_DIR
         self.tasks_file = self.storage_dir / TASKS_FILE
+        self.db_path = self.storage_dir / TASKS_DB
         self._lock = threading.Lock()
+        self._by_id: Dict[str, ScheduledTask] = {}
+        self._data_version: Optional[int] = None
+        self._revision = 0
         self._ensure_storage_dir()
+        self._conn = self._connect()
     
     def _ensure_storage_dir(self) -> None:
         """Ensure storage directory exists."""
         self.storage_dir.mkdir(parents=True, exist_ok=True)
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema and importing legacy JSON."""
+        is_new = not self.db_path.exists()
+        conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS tasks("
+            "task_id TEXT PRIMARY KEY, scheduled_ts REAL, status TEXT, blob BLOB)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_due ON tasks(status, scheduled_ts)")
+        if is_new and self.tasks_file.exists():
+            legacy = self._read_legacy_file()
+            if legacy:
+                conn.execute("BEGIN")
+                conn.executemany(_UPSERT_SQL, [_task_row(t) for t in legacy])
+                conn.execute("COMMIT")
+        return conn
+    
+    def _read_legacy_file(self) -> List[ScheduledTask]:
+        """Parse the pre-SQLite JSON task file."""
+        try:
+            with open(self.tasks_file, "rb") as f:
+                data = _json_loads(f.read())
+            return [ScheduledTask.from_dict(t) for t in data]
+        except Exception:
+            return []
+    
+    def _load_if_stale(self) -> None:
+        """Rebuild the index if another connection wrote. Caller holds the lock."""
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._data_version:
+            return
+        rows = self._conn.execute("SELECT blob FROM tasks").fetchall()
+        by_id: Dict[str, ScheduledTask] = {}
+        for (blob,) in rows:
+            try:
+                task = ScheduledTask.from_dict(_json_loads(blob))
+            except Exception:
+                continue
+            by_id[task.task_id] = task
+        self._by_id = by_id
+        self._data_version = version
+        self._revision += 1
+    
+    def _ids_where(self, sql: str, args: tuple = ()) -> List[ScheduledTask]:
+        """Run an indexed id query and map the ids onto cached tasks. Caller holds the lock."""
+        self._load_if_stale()
+        rows = self._conn.execute(sql, args).fetchall()
+        return [self._by_id[r[0]] for r in rows if r[0] in self._by_id]
+    
+    @property
+    def revision(self) -> int:
+        """Counter bumped whenever the task set is reloaded or modified."""
+        with self._lock:
+            self._load_if_stale()
+            return self._revision
+    
+    def get_task(self, task_id: str) -> Optional[ScheduledTask]:
+        """Look up a single task by ID."""
+        with self._lock:
+            self._load_if_stale()
+            return self._by_id.get(task_id)
+    
     def load_tasks(self) -> List[ScheduledTask]:
         """Load all tasks from storage."""
         with self._lock:
-            if not self.tasks_file.exists():
-                return []
-            
-            try:
-                with open(self.tasks_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                return [ScheduledTask.from_dict(t) for t in data]
-            except Exception:
-                return []
+            self._load_if_stale()
+            return list(self._by_id.values())
     
     def save_tasks(self, tasks: List[ScheduledTask]) -> bool:
-        """Save all tasks to storage."""
+        """Replace the stored task set."""
         with self._lock:
             try:
-                self._ensure_storage_dir()
-                data = [t.to_dict() for t in tasks]
-                with open(self.tasks_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                return True
-            except Exception:
+                self._conn.execute("BEGIN")
+                self._conn.execute("DELETE FROM tasks")
+                self._conn.executemany(_UPSERT_SQL, [_task_row(t) for t in tasks])
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
                 return False
+            self._by_id = {t.task_id: t for t in tasks}
+            self._revision += 1
+            return True
     
     def add_task(self, task: ScheduledTask) -> bool:
         """Add a new task."""
-        tasks = self.load_tasks()
-        tasks.append(task)
-        return self.save_tasks(tasks)
+        with self._lock:
+            self._load_if_stale()
+            try:
+                self._conn.execute(_UPSERT_SQL, _task_row(task))
+            except sqlite3.Error:
+                return False
+            self._by_id[task.task_id] = task
+            self._revision += 1
+            return True
     
     def remove_task(self, task_id: str) -> bool:
         """Remove a task by ID."""
-        tasks = self.load_tasks()
-        original_count = len(tasks)
-        tasks = [t for t in tasks if t.task_id != task_id]
-        if len(tasks) < original_count:
-            return self.save_tasks(tasks)
-        return False
+        with self._lock:
+            self._load_if_stale()
+            try:
+                cur = self._conn.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+            except sqlite3.Error:
+                return False
+            if self._by_id.pop(task_id, None) is None and not cur.rowcount:
+                return False
+            self._revision += 1
+            return True
     
     def update_task(self, task: ScheduledTask) -> bool:
         """Update an existing task."""
-        tasks = self.load_tasks()
-        for i, t in enumerate(tasks):
-            if t.task_id == task.task_id:
-                tasks[i] = task
-                return self.save_tasks(tasks)
-        return False
+        with self._lock:
+            self._load_if_stale()
+            if task.task_id not in self._by_id:
+                return False
+            try:
+                self._conn.execute(_UPSERT_SQL, _task_row(task))
+            except sqlite3.Error:
+                return False
+            self._by_id[task.task_id] = task
+            self._revision += 1
+            return True
+    
+    def update_many(self, tasks: Iterable[ScheduledTask]) -> bool:
+        """Update several existing tasks in a single transaction."""
+        with self._lock:
+            self._load_if_stale()
+            known = [t for t in tasks if t.task_id in self._by_id]
+            if not known:
+                return False
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(_UPSERT_SQL, [_task_row(t) for t in known])
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                return False
+            for task in known:
+                self._by_id[task.task_id] = task
+            self._revision += 1
+            return True
     
     def get_pending_tasks(self) -> List[ScheduledTask]:
         """Get all pending tasks."""
-        return [t for t in self.load_tasks() if t.status == TaskStatus.PENDING]
+        with self._lock:
+            return self._ids_where(
+                "SELECT task_id FROM tasks WHERE status = ? ORDER BY scheduled_ts",
+                (TaskStatus.PENDING.value,),
+            )
+    
+    def get_due_tasks(self, now: Optional[float] = None) -> List[ScheduledTask]:
+        """Get all tasks that are due for execution as of ``now`` (epoch seconds)."""
+        if now is None:
+            now = time.time()
+        with self._lock:
+            return self._ids_where(
+                "SELECT task_id FROM tasks WHERE status = ? AND scheduled_ts <= ?",
+                (TaskStatus.PENDING.value, now),
+            )
     
-    def get_due_tasks(self) -> List[ScheduledTask]:
-        """Get all tasks that are due for execution."""
-        return [t for t in self.load_tasks() if t.is_due]
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
 
 
 # -----------------------------------------------------------------------------
@@ -360,12 +619,25 @@ class TaskScheduler:
         executor: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
         poll_interval: float = 5.0,
     ):
-        self.storage = storage or TaskStorage()
+        self.storage = storage or _get_storage()
         self.executor = executor  # Function to execute actions
         self.poll_interval = poll_interval
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
+        # Min-heap of (scheduled epoch, task_id, task) for pending tasks, rebuilt
+        # whenever the storage revision changes.
+        self._heap: List[tuple] = []
+        self._heap_revision = -1
+        self._heap_lock = threading.Lock()
+        # Set by stop()/notify() to cut the current wait short; unlike a
+        # Condition notify it is not lost if the loop is busy at the time.
+        self._wake = threading.Event()
+    
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is active."""
+        return self._running
     
     def start(self) -> None:
         """Start the scheduler background thread."""
@@ -381,22 +653,75 @@ class TaskScheduler:
         """Stop the scheduler."""
         with self._lock:
             self._running = False
+            self.notify()
             if self._thread:
                 self._thread.join(timeout=5.0)
                 self._thread = None
     
+    def notify(self) -> None:
+        """Wake the loop so it re-reads storage and recomputes its deadline."""
+        self._wake.set()
+    
     def _run_loop(self) -> None:
         """Main scheduler loop."""
         while self._running:
+            # Clear before working so a notify() that lands mid-pass still
+            # short-circuits the following wait.
+            self._wake.clear()
             try:
                 self._process_due_tasks()
+                timeout = self._next_timeout()
             except Exception:
-                pass
-            time.sleep(self.poll_interval)
+                timeout = self.poll_interval
+            if not self._running:
+                break
+            self._wake.wait(timeout)
+    
+    def _sync_heap(self) -> None:
+        """Rebuild the deadline heap if the stored task set changed."""
+        revision = self.storage.revision
+        if revision == self._heap_revision:
+            return
+        heap = [(t._scheduled_ts, t.task_id, t) for t in self.storage.get_pending_tasks()]
+        heapq.heapify(heap)
+        with self._heap_lock:
+            self._heap = heap
+            self._heap_revision = revision
+    
+    def _next_timeout(self) -> float:
+        """Seconds to sleep: until the earliest deadline, capped at poll_interval."""
+        self._sync_heap()
+        with self._heap_lock:
+            if not self._heap:
+                return self.poll_interval
+            until = self._heap[0][0] - time.time()
+        if until <= 0:
+            # Still overdue right after a pass means the task ran and stayed
+            # pending (the action reported failure); retry on the poll cadence.
+            return self.poll_interval
+        return min(self.poll_interval, until)
+    
+    def _pop_due(self) -> List[ScheduledTask]:
+        """Pop heap entries whose deadline has passed."""
+        now = time.time()
+        due: List[ScheduledTask] = []
+        with self._heap_lock:
+            while self._heap and self._heap[0][0] <= now:
+                when, _, task = heapq.heappop(self._heap)
+                # Skip entries made stale by a cancel or reschedule.
+                if task.status is TaskStatus.PENDING and task._scheduled_ts == when:
+                    due.append(task)
+        return due
     
     def _process_due_tasks(self) -> None:
-        """Process all due tasks."""
-        due_tasks = self.storage.get_due_tasks()
+        """Process all due tasks, persisting their new state in one write."""
+        if not self.executor:
+            return
+        
+        self._sync_heap()
+        due_tasks = self._pop_due()
+        if not due_tasks:
+            return
         
         for task in due_tasks:
             try:
@@ -404,10 +729,11 @@ class TaskScheduler:
             except Exception as e:
                 task.status = TaskStatus.FAILED
                 task.error_message = str(e)
-                self.storage.update_task(task)
+        
+        self.storage.update_many(due_tasks)
     
     def _execute_task(self, task: ScheduledTask) -> None:
-        """Execute a single task."""
+        """Execute a single task, updating it in place (the caller persists it)."""
         if not self.executor:
             return
         
@@ -423,30 +749,27 @@ class TaskScheduler:
             task.last_executed = datetime.now()
             
             if result.get("ok"):
-                if task.recurrence == RecurrenceType.NONE:
+                if task.recurrence is RecurrenceType.NONE:
                     task.status = TaskStatus.EXECUTED
                 else:
                     # Reschedule for next occurrence
-                    task.scheduled_time = self._get_next_occurrence(task)
+                    task.reschedule(self._get_next_occurrence(task))
             else:
                 task.error_message = result.get("say", "Unknown error")
             
-            self.storage.update_task(task)
-            
         except Exception as e:
             task.status = TaskStatus.FAILED
             task.error_message = str(e)
-            self.storage.update_task(task)
     
     def _get_next_occurrence(self, task: ScheduledTask) -> datetime:
         """Calculate next occurrence for recurring tasks."""
         base = task.scheduled_time
         
-        if task.recurrence == RecurrenceType.DAILY:
+        if task.recurrence is RecurrenceType.DAILY:
             return base + timedelta(days=1)
-        elif task.recurrence == RecurrenceType.WEEKLY:
+        elif task.recurrence is RecurrenceType.WEEKLY:
             return base + timedelta(weeks=1)
-        elif task.recurrence == RecurrenceType.MONTHLY:
+        elif task.recurrence is RecurrenceType.MONTHLY:
             # Approximate month as 30 days
             return base + timedelta(days=30)
         
@@ -460,6 +783,20 @@ class TaskScheduler:
 _scheduler: Optional[TaskScheduler] = None
 _scheduler_lock = threading.Lock()
 
+_storage: Optional[TaskStorage] = None
+_storage_lock = threading.Lock()
+
+
+def _get_storage() -> TaskStorage:
+    """Get or create the shared TaskStorage so its in-memory index is reused."""
+    global _storage
+    
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                _storage = TaskStorage()
+    return _storage
+
 
 def get_scheduler(
     executor: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
@@ -524,7 +861,7 @@ def schedule_task(
     
     # Create task
     task = ScheduledTask(
-        task_id=str(uuid4())[:8],
+        task_id=secrets.token_hex(4),
         task_type=task_type,
         parameters=parameters,
         scheduled_time=parsed_time,
@@ -533,8 +870,10 @@ def schedule_task(
     )
     
     # Save to storage
-    storage = TaskStorage()
+    storage = _get_storage()
     if storage.add_task(task):
+        if _scheduler is not None:
+            _scheduler.notify()
         friendly_time = format_time_friendly(parsed_time)
         return {
             "ok": True,
@@ -548,33 +887,31 @@ def schedule_task(
 
 def cancel_scheduled_task(task_id: str) -> Dict[str, Any]:
     """Cancel a scheduled task."""
-    storage = TaskStorage()
-    tasks = storage.load_tasks()
-    
-    for task in tasks:
-        if task.task_id == task_id:
-            task.status = TaskStatus.CANCELLED
-            if storage.update_task(task):
-                return {"ok": True, "say": f"Cancelled task {task_id}."}
-            break
+    storage = _get_storage()
+    task = storage.get_task(task_id)
+    if task is not None:
+        task.status = TaskStatus.CANCELLED
+        if storage.update_task(task):
+            return {"ok": True, "say": f"Cancelled task {task_id}."}
     
     return {"ok": False, "say": f"Task {task_id} not found."}
 
 
 def list_scheduled_tasks() -> Dict[str, Any]:
     """List all pending scheduled tasks."""
-    storage = TaskStorage()
+    storage = _get_storage()
     pending = storage.get_pending_tasks()
     
     if not pending:
         return {"ok": True, "say": "No scheduled tasks.", "tasks": []}
     
+    now = datetime.now()
     tasks_info = []
-    for task in sorted(pending, key=lambda t: t.scheduled_time):
+    for task in sorted(pending, key=attrgetter("_scheduled_ts")):
         tasks_info.append({
             "id": task.task_id,
             "type": task.task_type,
-            "time": format_time_friendly(task.scheduled_time),
+            "time": format_time_friendly(task.scheduled_time, now),
             "description": task.description,
         })
     
@@ -587,7 +924,7 @@ def list_scheduler_status() -> Dict[str, Any]:
     global _scheduler
     
     is_running = _scheduler is not None and _scheduler.running
-    storage = TaskStorage()
+    storage = _get_storage()
     pending = storage.get_pending_tasks()
     
     status_str = "active" if is_running else "inactive"
@@ -604,14 +941,7 @@ def list_scheduler_status() -> Dict[str, Any]:
 
 def get_task_details(task_id: str) -> Optional[ScheduledTask]:
     """Get details of a specific task."""
-    storage = TaskStorage()
-    tasks = storage.load_tasks()
-    
-    for task in tasks:
-        if task.task_id == task_id:
-            return task
-    
-    return None
+    return _get_storage().get_task(task_id)
 
 
 # -----------------------------------------------------------------------------
@@ -633,16 +963,33 @@ def parse_scheduled_task_command(text: str) -> Optional[Dict[str, Any]]:
     if not text:
         return None
     
-    low = text.lower().strip()
+    spec = _parse_command_spec(text.lower().strip())
+    if spec is None:
+        return None
     
+    # Only the extraction is memoized; parsed_time is resolved fresh so
+    # relative expressions ("in 10 minutes") stay anchored to now.
+    task_type, task_parameters, time_expr, description = spec
+    parsed_time = parse_time_expression(time_expr)
+    if not parsed_time:
+        return None
+    return {
+        "type": "schedule_task",
+        "parameters": {
+            "task_type": task_type,
+            "task_parameters": dict(task_parameters),
+            "scheduled_time": time_expr,
+            "parsed_time": parsed_time.isoformat(),
+            "description": description,
+        }
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_command_spec(low: str) -> Optional[tuple]:
+    """Extract (task_type, task_parameter_items, time_expr, description) from lowercased text."""
     # Check for scheduling keywords
-    schedule_triggers = [
-        "at", "on", "schedule", "remind", "later", "tomorrow",
-        "morning", "afternoon", "evening", "tonight", "pm", "am"
-    ]
-    
-    has_schedule_context = any(t in low for t in schedule_triggers)
-    if not has_schedule_context:
+    if not _SCHEDULE_TRIGGER_RE.search(low):
         return None
     
     # Pattern: action at/on time
@@ -651,20 +998,11 @@ def parse_scheduled_task_command(text: str) -> Optional[Dict[str, Any]]:
     #   - "at 8pm send hi to dad"
     #   - "tomorrow morning send good morning to parents"
     
-    # Extract time expression
-    time_patterns = [
-        r"(?:at|on)\s+(\d{1,2}(?::?\d{2})?\s*(?:[ap]\.?m\.?)?)",
-        r"(tomorrow\s+(?:morning|afternoon|evening|night)?)",
-        r"(tonight|this\s+evening|this\s+afternoon)",
-        r"(?:in|after)\s+(\d+\s+(?:hours?|minutes?))",
-        r"(morning|afternoon|evening)\s+(?:at\s+)?(\d{1,2}(?::?\d{2})?\s*(?:[ap]\.?m\.?)?)?",
-    ]
-    
     time_expr = None
     action_text = low
     
-    for pattern in time_patterns:
-        match = re.search(pattern, low)
+    for pattern in _TIME_EXPR_PATTERNS:
+        match = pattern.search(low)
         if match:
             time_expr = match.group(0)
             # Remove time from action text
@@ -675,8 +1013,7 @@ def parse_scheduled_task_command(text: str) -> Optional[Dict[str, Any]]:
         return None
     
     # Parse the time
-    parsed_time = parse_time_expression(time_expr)
-    if not parsed_time:
+    if not parse_time_expression(time_expr):
         return None
     
     # Try to extract the actual action
@@ -684,70 +1021,51 @@ def parse_scheduled_task_command(text: str) -> Optional[Dict[str, Any]]:
     
     # WhatsApp message
     # Enhanced to handle 'tu' (typo for 'to') and 'ko' (Hindi)
-    wa_match = re.search(r"(?:send|message|msg|bhej)\s+(.+?)\s+(?:to|for|tu|ko)\s+(.+)", action_text, flags=re.IGNORECASE)
+    wa_match = _WA_SEND_RE.search(action_text)
     if wa_match:
         message = wa_match.group(1).strip()
         recipients = wa_match.group(2).strip()
         
-        return {
-            "type": "schedule_task",
-            "parameters": {
-                "task_type": "whatsapp_send_multi",
-                "task_parameters": {
-                    "message": message,
-                    "contacts": recipients,
-                },
-                "scheduled_time": time_expr,
-                "parsed_time": parsed_time.isoformat(),
-                "description": f"Send '{message[:30]}...' to {recipients}",
-            }
-        }
+        return (
+            "whatsapp_send_multi",
+            (("message", message), ("contacts", recipients)),
+            time_expr,
+            f"Send '{message[:30]}...' to {recipients}",
+        )
     
     # Volume setting
-    vol_match = re.search(r"(?:set\s+)?volume\s+(?:to\s+)?(\d+)%?", action_text)
+    vol_match = _VOLUME_RE.search(action_text)
     if vol_match:
         level = int(vol_match.group(1))
-        return {
-            "type": "schedule_task",
-            "parameters": {
-                "task_type": "volume",
-                "task_parameters": {"percent": level},
-                "scheduled_time": time_expr,
-                "parsed_time": parsed_time.isoformat(),
-                "description": f"Set volume to {level}%",
-            }
-        }
+        return (
+            "volume",
+            (("percent", level),),
+            time_expr,
+            f"Set volume to {level}%",
+        )
     
     # Play song
-    play_match = re.search(r"play\s+(.+)", action_text)
+    play_match = _PLAY_RE.search(action_text)
     if play_match:
         song = play_match.group(1).strip()
-        return {
-            "type": "schedule_task",
-            "parameters": {
-                "task_type": "play_song",
-                "task_parameters": {"song": song},
-                "scheduled_time": time_expr,
-                "parsed_time": parsed_time.isoformat(),
-                "description": f"Play '{song}'",
-            }
-        }
+        return (
+            "play_song",
+            (("song", song),),
+            time_expr,
+            f"Play '{song}'",
+        )
     
     # Generic reminder
     if "remind" in low:
-        reminder_match = re.search(r"remind\s+(?:me\s+)?(?:to\s+)?(.+)", action_text)
+        reminder_match = _REMIND_RE.search(action_text)
         if reminder_match:
             reminder = reminder_match.group(1).strip()
-            return {
-                "type": "schedule_task",
-                "parameters": {
-                    "task_type": "reminder",
-                    "task_parameters": {"text": reminder},
-                    "scheduled_time": time_expr,
-                    "parsed_time": parsed_time.isoformat(),
-                    "description": f"Reminder: {reminder}",
-                }
-            }
+            return (
+                "reminder",
+                (("text", reminder),),
+                time_expr,
+                f"Reminder: {reminder}",
+            )
             
     # Fallback: Generic Command (Memory Planning)
     # If we have a valid time but matched no specific pattern, assume the whole text is a command
@@ -755,18 +1073,14 @@ def parse_scheduled_task_command(text: str) -> Optional[Dict[str, Any]]:
     if action_text.strip():
         cleaned_cmd = action_text.strip()
         # Remove common filler words
-        cleaned_cmd = re.sub(r"^(please|kindly)\s+", "", cleaned_cmd, flags=re.IGNORECASE)
+        cleaned_cmd = _FILLER_PREFIX_RE.sub("", cleaned_cmd)
         
-        return {
-            "type": "schedule_task",
-            "parameters": {
-                "task_type": "general_command", 
-                "task_parameters": {"command": cleaned_cmd},
-                "scheduled_time": time_expr,
-                "parsed_time": parsed_time.isoformat(),
-                "description": f"Execute later: {cleaned_cmd}",
-            }
-        }
+        return (
+            "general_command",
+            (("command", cleaned_cmd),),
+            time_expr,
+            f"Execute later: {cleaned_cmd}",
+        )
     
     return None
 
@@ -794,6 +1108,15 @@ def execute_scheduler_action(action: Dict[str, Any]) -> Dict[str, Any]:
         time_expr = params.get("scheduled_time")
         description = params.get("description", "")
         
+        # parse_scheduled_task_command already resolved the time; reuse it
+        # rather than running the natural-language parser a second time.
+        parsed_time = params.get("parsed_time")
+        if parsed_time:
+            try:
+                time_expr = datetime.fromisoformat(parsed_time)
+            except (TypeError, ValueError):
+                pass
+        
         return schedule_task(
             task_type=task_type,
             parameters=task_params,
@@ -1,5 +1,6 @@
 import tkinter as tk
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 
 
@@ -7,27 +8,45 @@ class TopTextboxApp:
     def __init__(self, on_command: Optional[Callable[[str], None]] = None, on_close: Optional[Callable[[], None]] = None):
         self.on_command = on_command
         self.on_close = on_close
-        self._stt_thread: Optional[threading.Thread] = None
-        self._stt_running = False
+        self._cmd_pool = self._new_cmd_pool()
+        # One long-lived STT worker parks on _stt_event; the mic button only
+        # sets/clears the event, so toggling never spawns a thread or re-imports.
+        try:
+            from src.assistant import stt as _stt
+        except Exception:
+            _stt = None
+        self._stt = _stt
+        self._stt_event = threading.Event()
+        self._closing = False
+        self._stt_thread = threading.Thread(target=self._stt_loop, name="STTWorker", daemon=True)
+        self._stt_thread.start()
+        # Display updates from any thread are coalesced into one pending slot
+        # flushed at most every 16 ms, instead of one Tk event per update.
+        self._pending_display: Optional[str] = None
+        self._pending_scheduled = False
+        self._last_display = ""  # skip repainting the label with unchanged text
 
         self.root = tk.Tk()
         self.root.title("Command Entry")
         self.root.geometry("700x60+0+0")
         self.root.configure(bg="#181A20")
-        self.root.attributes("-topmost", True)
         self.root.overrideredirect(True)
         self.root.resizable(False, False)
+        # Raise once the window is mapped rather than during construction
+        self.root.after_idle(lambda: self.root.attributes("-topmost", True))
 
+        # One fixed grid: display across the top, entry + mic button below
         self.frame = tk.Frame(self.root, bg="#181A20")
         self.frame.pack(fill="both", expand=True)
+        self.frame.grid_columnconfigure(0, weight=1)
 
         self.display_var = tk.StringVar()
         self.display = tk.Label(self.frame, textvariable=self.display_var, font=("Segoe UI", 16), bg="#181A20", fg="#E6EEF8", anchor="w")
-        self.display.pack(fill="x", padx=18, pady=(10, 0))
+        self.display.grid(row=0, column=0, columnspan=2, sticky="ew", padx=18, pady=(10, 0))
 
         self.entry_var = tk.StringVar()
         self.entry = tk.Entry(self.frame, textvariable=self.entry_var, font=("Segoe UI", 16), bg="#23262F", fg="#E6EEF8", insertbackground="#E6EEF8", relief="flat")
-        self.entry.pack(fill="x", padx=18, pady=(0, 10))
+        self.entry.grid(row=1, column=0, sticky="ew", padx=(18, 0), pady=(0, 10))
         self.entry.bind("<Return>", self._on_enter)
         self.entry.focus_set()
         try:
@@ -36,15 +55,18 @@ class TopTextboxApp:
             pass
 
         # Mic toggle button (starts/stops voice listening)
-        self.mic_btn = tk.Button(self.frame, text="🎤", command=self._toggle_mic, bg="#2D313B", fg="#E6EEF8", relief="flat", font=("Segoe UI", 12))
-        self.mic_btn.place(x=660, y=16, width=24, height=24)
+        self.mic_btn = tk.Button(self.frame, text="🎤", command=self._toggle_mic, bg="#2D313B", fg="#E6EEF8", relief="flat", font=("Segoe UI", 12), width=2)
+        self.mic_btn.grid(row=1, column=1, sticky="e", padx=8, pady=(0, 10))
 
     def _handle_close(self):
+        self._closing = True
+        self._stt_event.set()  # wake the STT worker so it can exit
         try:
             if callable(self.on_close):
                 self.on_close()
         except Exception:
             pass
+        self._cmd_pool.shutdown(wait=False)
         try:
             self.root.destroy()
         except Exception:
@@ -53,20 +75,41 @@ class TopTextboxApp:
     def _on_enter(self, event=None):
         text = self.entry_var.get().strip()
         if text:
-            self.display_var.set(f"You: {text}")
+            self._queue_display(f"You: {text}")
             self.entry_var.set("")
-            try:
-                if callable(self.on_command):
-                    self.on_command(text)
-            except Exception:
-                pass
+            self._dispatch_command(text)
 
     def show_assistant(self, message: str):
+        self._queue_display(f"Assistant: {message}")
+
+    def _queue_display(self, text: str):
+        """Set the display text from any thread; the latest value wins."""
+        self._pending_display = text
+        if self._pending_scheduled:
+            return
+        self._pending_scheduled = True
+        try:
+            self.root.after(16, self._flush_display)
+        except Exception:
+            self._pending_scheduled = False
+
+    def _flush_display(self):
+        # Clear the flag before reading so an update racing in reschedules.
+        self._pending_scheduled = False
+        text, self._pending_display = self._pending_display, None
+        if text is None or text == self._last_display:
+            return
+        self._last_display = text
         try:
-            self.display_var.set(f"Assistant: {message}")
+            self.display_var.set(text)
         except Exception:
             pass
 
+    @property
+    def _stt_running(self) -> bool:
+        # Polled by the listener every loop; Event/bool reads need no lock.
+        return self._stt_event.is_set() and not self._closing
+
     def _toggle_mic(self):
         if not self._stt_running:
             self._start_stt_thread()
@@ -74,46 +117,84 @@ class TopTextboxApp:
             self._stop_stt_thread()
 
     def _start_stt_thread(self):
-        self._stt_running = True
         self.mic_btn.configure(bg="#3BA55D")  # green
-        def _runner():
+        self._stt_event.set()
+
+    def _stop_stt_thread(self):
+        # cooperative stop: continuous_listen polls should_continue and returns
+        self._stt_event.clear()
+        self.mic_btn.configure(bg="#2D313B")
+
+    def _on_voice_command(self, text: str):
+        if not text:
+            return
+        # Update UI (coalesced onto the Tk thread) and forward to backend
+        self._queue_display(f"You (voice): {text}")
+        # continuous_listen already barged in before calling us
+        self._dispatch_command(text, barge=False)
+
+    @staticmethod
+    def _new_cmd_pool() -> ThreadPoolExecutor:
+        # Commands run off the Tk thread so slow backend calls never stall the
+        # UI; a single worker keeps them (and their barge-ins) in order.
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="TextboxCmd")
+
+    def _dispatch_command(self, text: str, barge: bool = True):
+        """Hand a command to the backend on the command pool and return at once.
+
+        UI updates from the callback must go through _queue_display.
+        """
+        try:
+            self._cmd_pool.submit(self._run_command, text, barge)
+        except RuntimeError:
+            pass  # pool already shut down: the window is closing
+
+    def _run_command(self, text: str, barge: bool = True):
+        if barge:
+            self._barge_in()
+        try:
+            if callable(self.on_command):
+                self.on_command(text)
+        except Exception:
+            pass
+
+    def _barge_in(self):
+        # A new command makes any reply still being spoken obsolete
+        try:
+            from src.assistant.config import settings
+            if not settings.SPEECH_INTERRUPTIBLE:
+                return
+            from src.assistant.tts import barge_in
+            barge_in()
+        except Exception:
+            pass
+
+    def _on_wake(self):
+        self._queue_display("(listening…)")
+
+    def _stt_loop(self):
+        while True:
+            self._stt_event.wait()
+            if self._closing:
+                return
             try:
-                from src.assistant import stt as _stt
-                def _on_cmd(text: str):
-                    if not text:
-                        return
-                    try:
-                        # Update UI and forward to backend on the Tk thread
-                        self.root.after(0, lambda: self.display_var.set(f"You (voice): {text}"))
-                    except Exception:
-                        pass
-                    try:
-                        if callable(self.on_command):
-                            self.on_command(text)
-                    except Exception:
-                        pass
-                def _on_wake():
-                    try:
-                        self.root.after(0, lambda: self.display_var.set("(listening…)"))
-                    except Exception:
-                        pass
-                _stt.continuous_listen(on_command=_on_cmd, on_wake=_on_wake, should_continue=lambda: self._stt_running)
+                if self._stt is not None:
+                    self._stt.continuous_listen(
+                        on_command=self._on_voice_command,
+                        on_wake=self._on_wake,
+                        should_continue=lambda: self._stt_running,
+                    )
             except Exception:
                 pass
-            finally:
-                # If the loop exits, reflect stopped state
-                self._stt_running = False
+            if self._closing:
+                return
+            if self._stt_event.is_set():
+                # The listener ended on its own (error/no mic): reflect stopped state
+                self._stt_event.clear()
                 try:
                     self.root.after(0, lambda: self.mic_btn.configure(bg="#2D313B"))
                 except Exception:
                     pass
-        self._stt_thread = threading.Thread(target=_runner, daemon=True)
-        self._stt_thread.start()
-
-    def _stop_stt_thread(self):
-        # cooperative stop: set flag; stt loop checks TTS stop but not a global; rely on closing app to fully stop
-        self._stt_running = False
-        self.mic_btn.configure(bg="#2D313B")
 
     def request_close(self):
         try:
@@ -125,5 +206,8 @@ class TopTextboxApp:
         self.root.mainloop()
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    multiprocessing.freeze_support()  # frozen builds: see src/main.py
     app = TopTextboxApp()
     app.run()
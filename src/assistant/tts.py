@@ -1,19 +1,154 @@
+import atexit
+import logging
+import os
+import queue
+import tempfile
 import threading
 import pyttsx3
 import random
 import time
 import re
+import wave
+from concurrent.futures import Future
 from .config import settings
-from typing import Optional
+from typing import Any, Callable, Optional
+
+try:
+    import simpleaudio as _simpleaudio
+except Exception:  # pragma: no cover - simpleaudio is optional
+    _simpleaudio = None
+
+logger = logging.getLogger(__name__)
 
 _engine = None
-_lock = threading.Lock()
 _current_voice_id = None
-_busy = False  # Track if TTS is currently speaking
+# Set while an utterance is being spoken. Status reads (is_busy, interrupt,
+# get_current_voice, get_persona) only look at module globals and this Event;
+# they must stay lock-free so the UI/STT threads can poll them at will.
+_speaking = threading.Event()
+# Set once _init_engine has run. Hot paths test it inline
+# (`if not _inited: _init_engine()`) so a ready engine costs no extra call.
+_inited = False
+# Voice list captured once at init (the SAPI voice enumeration is a COM
+# round-trip): (id, name, languages, haystack), where haystack is the lowercased
+# id, name and languages joined by \x1f so set_voice does one substring test
+_voices_cache: list = []
+# Last rate/volume written to the engine, so repeated sets (e.g. re-applying
+# the same profile) skip the SAPI property write entirely.
+_last_rate: Optional[int] = None
+_last_vol: Optional[float] = None
+
+# A single long-lived worker owns the engine: every engine call is queued to
+# it as a (callable, Future) job, so callers never spawn threads or contend
+# for a lock, and SAPI is only ever driven from the thread that created it.
+_tts_queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+_stop_gen = 0  # bumped by stop(); a running utterance bails at the next sentence
+_barge_gen = 0  # bumped by barge_in(); utterances queued before it are skipped
+_proc = None  # tts_proc.TTSProcess when TTS_PROCESS moves the engine out of process
+_proc_lock = threading.Lock()
+_child = False  # set inside that child so it serves requests in-process
+_piper = None  # streaming Piper voice when TTS_BACKEND selects it (see piper_tts.py)
+_piper_checked = False
+
+# Sentence splitter: each sentence gets its own runAndWait so the first audio
+# only waits on the first sentence, and stop() can cut between sentences.
+_SENT_RE = re.compile(r".+?(?:[.!?]+(?=\s|$)|$)", re.S)
+
+# Prebuffered playback: sentences are rendered to WAV with save_to_file and
+# played asynchronously by the OS, so runAndWait only covers synthesis and the
+# next sentence renders while the current one plays.
+_playback = None  # simpleaudio PlayObject for the clip now playing
+_PLAYBACK_POLL = 0.02
+
 
 def is_busy() -> bool:
-    """Check if TTS is currently speaking."""
-    return _busy
+    """Check if TTS is currently speaking or has speech queued (lock-free)."""
+    if _proc is not None and _proc.speaking:
+        return True
+    return _speaking.is_set() or not _tts_queue.empty()
+
+
+def wait_until_idle(timeout: Optional[float] = None) -> bool:
+    """Block until queued speech has finished; False if timeout expired first.
+
+    Lets callers wait instead of polling is_busy(): the worker runs jobs in
+    order, so an empty job completes only after everything queued before it.
+    """
+    if _proc is not None:
+        return _proc.wait_idle(timeout)
+    if not is_busy():
+        return True
+    try:
+        _submit(lambda: None).result(timeout)
+        return True
+    except Exception:
+        return False
+
+
+def _remote():
+    """Return the TTS child process if TTS_PROCESS is on, spawning it on first use."""
+    global _proc
+    if _child or not settings.TTS_PROCESS:
+        return None
+    if _proc is None or not _proc.alive:
+        with _proc_lock:
+            if _proc is None or not _proc.alive:
+                from .tts_proc import TTSProcess
+                if _proc is None:
+                    atexit.register(_close_remote)
+                _proc = TTSProcess()
+    return _proc
+
+
+def _close_remote() -> None:
+    if _proc is not None:
+        _proc.close()
+
+
+def _worker_loop() -> None:
+    while True:
+        item = _tts_queue.get()
+        if item is None:
+            break
+        fn, fut = item
+        if not fut.set_running_or_notify_cancel():
+            continue
+        try:
+            fut.set_result(fn())
+        except BaseException as exc:
+            fut.set_exception(exc)
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_worker_loop, name="TTSWorker", daemon=True)
+            _worker.start()
+
+
+def _submit(fn: Callable[[], Any]) -> Future:
+    """Queue fn to run on the TTS worker and return its Future."""
+    fut: Future = Future()
+    if threading.current_thread() is _worker:
+        # Re-entrant call from a job: run inline instead of deadlocking.
+        try:
+            fut.set_result(fn())
+        except BaseException as exc:
+            fut.set_exception(exc)
+        return fut
+    _ensure_worker()
+    _tts_queue.put((fn, fut))
+    return fut
+
+
+def _call(fn: Callable[[], Any]) -> Any:
+    """Run fn on the TTS worker and wait for its result."""
+    return _submit(fn).result()
 
 # Persona tuning: interjection frequency, choices, and pause lengths
 _PERSONA = {
@@ -21,25 +156,44 @@ _PERSONA = {
         'interj_freq': 0.30,  # chance to insert interjection per chunk
         'pause_after_interj': 0.08,
         'pause_between_chunks': 0.06,
-        'interjections': ['umm', 'ohh', 'ahh', 'oh'],
+        'interjections': ('umm', 'ohh', 'ahh', 'oh'),
         'default_emotion': 'friendly'
     },
     'thoughtful': {
         'interj_freq': 0.45,
         'pause_after_interj': 0.12,
         'pause_between_chunks': 0.14,
-        'interjections': ['hmm', 'uhm', 'ahh'],
+        'interjections': ('hmm', 'uhm', 'ahh'),
         'default_emotion': 'calm'
     },
     'energetic': {
         'interj_freq': 0.15,
         'pause_after_interj': 0.04,
         'pause_between_chunks': 0.04,
-        'interjections': ['wow', 'ohh', 'yeah'],
+        'interjections': ('wow', 'ohh', 'yeah'),
         'default_emotion': 'excited'
     }
 }
 
+# Voice names worth preferring at init (clear English SAPI voices)
+_PREF_RE = re.compile(r"english|en[-_]us|zira|david|mark|eva", re.IGNORECASE)
+
+# Per persona: interjection options plus None ("no interjection") and their
+# cumulative weights, so one random.choices call decides whether and which.
+_INTERJ_TABLE = {}
+for _name, _cfg in _PERSONA.items():
+    _freq = _cfg['interj_freq']
+    _each = _freq / len(_cfg['interjections'])
+    _INTERJ_TABLE[_name] = (
+        _cfg['interjections'] + (None,),
+        tuple(_each * (i + 1) for i in range(len(_cfg['interjections']))) + (1.0,),
+    )
+del _name, _cfg, _freq, _each
+
+# Clause chunker for persona speech; like _SENT_RE, punctuation only ends a
+# chunk when followed by whitespace, so "3.5" stays whole.
+_CHUNK_RE = re.compile(r".+?(?:[,.;:!?]+(?=\s|$)|$)", re.S)
+
 # active persona name
 _active_persona = 'friendly'
 
@@ -49,22 +203,23 @@ def _init_engine():
     We explicitly pick a likely English voice and set volume to 100%
     so that output is actually audible on most Windows setups.
     """
-    global _engine, _current_voice_id
+    global _engine, _current_voice_id, _voices_cache, _inited, _last_rate, _last_vol
     if _engine is not None:
         return
 
     try:
         _engine = pyttsx3.init()
-    except Exception:
-        _engine = pyttsx3.init()
+    except Exception as exc:
+        logger.warning("TTS engine initialisation failed: %s", exc)
+        raise
 
     # Try to pick a clear English voice and ensure loud volume
     try:
         voices = _engine.getProperty("voices") or []
+        _voices_cache = [_voice_entry(v) for v in voices]
         preferred = None
         for v in voices:
-            name = str(getattr(v, "name", "")).lower()
-            if any(tag in name for tag in ("english", "en-us", "zira", "david", "mark", "eva")):
+            if _PREF_RE.search(str(getattr(v, "name", ""))):
                 preferred = v
                 break
         if preferred is None and voices:
@@ -74,78 +229,260 @@ def _init_engine():
             _current_voice_id = preferred.id
         # Force max volume
         _engine.setProperty("volume", 1.0)
+        _last_vol = 1.0
         # Keep current rate if available
         try:
             rate = _engine.getProperty("rate") or 150
             _engine.setProperty("rate", int(rate))
+            _last_rate = int(rate)
         except Exception:
             pass
     except Exception:
         _current_voice_id = None
+    _inited = True
+
+
+def _voice_entry(v) -> tuple:
+    vid = str(getattr(v, "id", ""))
+    name = str(getattr(v, "name", ""))
+    try:
+        languages = list(getattr(v, "languages", None) or [])
+    except Exception:
+        languages = []
+    lang = ",".join(str(x) for x in languages)
+    return (vid, name, languages, f"{vid}\x1f{name}\x1f{lang}".lower())
+
+
+def _ensure_inited() -> None:
+    if not _inited:
+        _call(_init_engine)
+
+
+def _split_sentences(text: str) -> list:
+    parts = [m.group().strip() for m in _SENT_RE.finditer(text)]
+    return [p for p in parts if p] or [text]
+
+
+def _persona_chunks(text: str):
+    """Yield clause-sized chunks, some led by the active persona's interjection."""
+    options, cum = _INTERJ_TABLE[_active_persona]
+    for m in _CHUNK_RE.finditer(text):
+        chunk = m.group().strip()
+        if not chunk:
+            continue
+        interj = random.choices(options, cum_weights=cum)[0]
+        yield f"{interj}, {chunk}" if interj else chunk
 
 
 def stop():
-    _init_engine()
-    with _lock:
+    """Interrupt the current utterance (called from outside the worker)."""
+    global _stop_gen
+    if _proc is not None:
+        _proc.submit("stop")
+        return
+    _stop_gen += 1
+    _stop_playback()
+    if _engine is None:
+        return
+    try:
+        _engine.stop()
+    except Exception:
+        pass
+
+
+def interrupt() -> bool:
+    """Stop speech only if something is actually being spoken.
+
+    Call it once user speech or a command has actually been detected, not
+    on every mic block: it cuts whatever is playing right then.
+    """
+    busy = _proc.speaking if _proc is not None else _speaking.is_set()
+    if not busy:
+        return False
+    stop()
+    return True
+
+
+def barge_in() -> None:
+    """Cut the current utterance and drop speech queued before this call.
+
+    Call when the user issues a new command so the reply to it is heard
+    right away. Queued utterances are skipped rather than pulled off the
+    queue, so their Futures still resolve and other queued jobs still run.
+    """
+    global _barge_gen
+    if _proc is not None:
+        _proc.submit("barge_in")
+        return
+    _barge_gen += 1
+    interrupt()
+
+
+def _can_prebuffer() -> bool:
+    # Not winsound: PlaySound plays one sound per process, so speech and the
+    # STT chimes (stt._play_action_complete) would keep cutting each other off.
+    return _simpleaudio is not None and hasattr(_engine, "save_to_file")
+
+
+def _play_wav(path: str) -> float:
+    """Start playing a WAV file without blocking; return its duration in seconds."""
+    global _playback
+    with wave.open(path, "rb") as wf:
+        rate = wf.getframerate() or 1
+        nframes = wf.getnframes()
+        frames = wf.readframes(nframes)
+        channels, width = wf.getnchannels(), wf.getsampwidth()
+    _playback = _simpleaudio.play_buffer(frames, channels, width, rate)
+    return nframes / float(rate)
+
+
+def _stop_playback() -> None:
+    try:
+        if _playback is not None:
+            _playback.stop()
+    except Exception:
+        pass
+
+
+def _wait_until(deadline: float, gen: int) -> bool:
+    """Sleep until deadline; False if stop() was called meanwhile."""
+    while _stop_gen == gen:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return True
+        time.sleep(min(_PLAYBACK_POLL, remaining))
+    return False
+
+
+def _say_prebuffered(sentences: list, gen: int) -> None:
+    """Worker-side: render each sentence to WAV and play it asynchronously.
+
+    The next sentence is synthesized while the previous one is still playing;
+    temp files are removed once their playback has finished.
+    """
+    deadline = time.monotonic()
+    played: list = []
+    tmpdir = tempfile.mkdtemp(prefix="tts_")
+    try:
+        for i, sentence in enumerate(sentences):
+            if _stop_gen != gen:
+                break
+            path = os.path.join(tmpdir, f"{i}.wav")
+            _engine.save_to_file(sentence, path)
+            _engine.runAndWait()
+            if not os.path.exists(path) or not _wait_until(deadline, gen):
+                break
+            deadline = time.monotonic() + _play_wav(path)
+            played.append(path)
+        _wait_until(deadline, gen)
+    finally:
+        if _stop_gen != gen:
+            _stop_playback()
+        for path in played:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
         try:
-            _engine.stop()
-        except Exception:
+            os.rmdir(tmpdir)
+        except OSError:
             pass
 
 
+def _get_piper():
+    """Worker-side: load the Piper voice once if TTS_BACKEND asks for it."""
+    global _piper, _piper_checked
+    if not _piper_checked:
+        _piper_checked = True
+        if settings.TTS_BACKEND in ("piper", "auto"):
+            try:
+                from .piper_tts import load_piper
+                _piper = load_piper(settings.PIPER_MODEL_PATH)
+            except Exception as exc:
+                logger.warning("Piper TTS backend unavailable: %s", exc)
+            if _piper is None:
+                logger.info("Piper TTS not available; using pyttsx3")
+    return _piper
+
+
+def _say(text: str, epoch: int) -> None:
+    """Worker-side: speak one utterance queued at barge-in epoch ``epoch``."""
+    if epoch != _barge_gen:
+        return
+    piper = _piper if _piper_checked else _get_piper()
+    if piper is None and not _inited:
+        _init_engine()
+    gen = _stop_gen
+    _speaking.set()
+    try:
+        if piper is not None:
+            from .piper_tts import play_stream
+            play_stream(piper.synthesize_stream(text), piper.sample_rate, lambda: _stop_gen != gen)
+            return
+        sentences = _persona_chunks(text) if settings.TTS_INTERJECTIONS else _split_sentences(text)
+        if _can_prebuffer():
+            _say_prebuffered(sentences, gen)
+            return
+        for sentence in sentences:
+            if _stop_gen != gen:
+                break
+            _engine.say(sentence)
+            _engine.runAndWait()
+    except Exception:
+        pass
+    finally:
+        _speaking.clear()
+
+
 def speak(text: str, emotion: Optional[str] = None):
     """Speak text synchronously using a robust default voice.
 
     Emotion parameter is currently ignored for maximum reliability.
     """
-    global _busy
     if not text:
         return
-    _init_engine()
-    with _lock:
-        _busy = True
-        try:
-            _engine.say(text)
-            _engine.runAndWait()
-        except Exception:
-            pass
-        finally:
-            _busy = False
+    try:
+        proc = _remote()
+        if proc is not None:
+            proc.call("say", text)
+            return
+        epoch = _barge_gen
+        _call(lambda: _say(text, epoch))
+    except Exception:
+        pass
 
 
 def speak_async(text: str, emotion: Optional[str] = None):
-    """Speak text in a background thread (non-blocking).
+    """Queue text on the TTS worker and return immediately (non-blocking).
 
     Useful for UI/overlay code that shouldn't block the main thread while speaking.
+    Returns a Future that resolves once the text has been spoken.
     """
     if not text:
         return
-
-    def _runner(t: str):
-        try:
-            speak(t, emotion=emotion)
-        except Exception:
-            pass
-
-    th = threading.Thread(target=_runner, args=(text,), daemon=True)
-    th.start()
-    return th  # Return thread object for optional joining
+    try:
+        proc = _remote()
+    except Exception:
+        proc = None
+    if proc is not None:
+        return proc.submit("say", text)
+    epoch = _barge_gen
+    return _submit(lambda: _say(text, epoch))
 
 
 def list_voices() -> list:
     """Return a list of available voices (id, name, languages)."""
-    _init_engine()
-    out = []
     try:
-        for v in _engine.getProperty('voices'):
-            out.append({
-                'id': getattr(v, 'id', ''),
-                'name': getattr(v, 'name', ''),
-                'languages': getattr(v, 'languages', []),
-            })
+        proc = _remote()
+        if proc is not None:
+            return proc.call("voices")
+        _ensure_inited()
     except Exception:
-        pass
-    return out
+        return []
+    return [
+        {'id': vid, 'name': name, 'languages': list(languages)}
+        for vid, name, languages, _ in _voices_cache
+    ]
 
 
 def set_persona(name: str) -> bool:
@@ -178,38 +515,60 @@ def set_voice(criteria: str) -> bool:
     """Try to set the voice by matching id, name or language substring. Returns True on success."""
     if not criteria:
         return False
-    _init_engine()
+    global _current_voice_id
     crit = str(criteria).lower()
     try:
-        for v in _engine.getProperty('voices'):
-            vid = str(getattr(v, 'id', '')).lower()
-            name = str(getattr(v, 'name', '')).lower()
-            try:
-                lang = ",".join([str(x).lower() for x in getattr(v, 'languages', [])])
-            except Exception:
-                lang = ""
-            if crit in vid or crit in name or (lang and crit in lang):
-                _engine.setProperty('voice', v.id)
-                _current_voice_id = v.id
-                return True
+        proc = _remote()
+        if proc is not None:
+            ok, vid = proc.call("voice", criteria)
+            if ok:
+                _current_voice_id = vid
+            return ok
+        _ensure_inited()
     except Exception:
-        pass
-    return False
-
+        return False
+    for vid, _, _, hay in _voices_cache:
+        if crit in hay:
+            break
+    else:
+        return False
+    if vid == _current_voice_id:
+        return True
 
-def get_current_voice() -> Optional[str]:
+    def _job():
+        global _current_voice_id
+        _engine.setProperty('voice', vid)
+        _current_voice_id = vid
     try:
-        return _current_voice_id
+        _call(_job)
+        return True
     except Exception:
-        return None
+        return False
+
+
+def get_current_voice() -> Optional[str]:
+    # Plain global read (atomic on CPython); never take a lock here.
+    return _current_voice_id
 
 
 def set_rate(rate: int) -> bool:
     """Set speaking rate (words per minute-ish). Returns True on success."""
     try:
-        _init_engine()
-        with _lock:
-            _engine.setProperty('rate', int(rate))
+        r = int(rate)
+        proc = _remote()
+        if proc is not None:
+            return bool(proc.call("rate", r))
+        if _inited and r == _last_rate:
+            return True
+
+        def _job():
+            global _last_rate
+            if not _inited:
+                _init_engine()
+            if r != _last_rate:
+                _engine.setProperty('rate', r)
+                _last_rate = r
+        _call(_job)
         return True
     except Exception:
         return False
@@ -221,74 +580,101 @@ def set_volume_percent(percent: float) -> bool:
         p = float(percent)
         if p > 1.0:
             p = max(0.0, min(100.0, p)) / 100.0
-        _init_engine()
-        with _lock:
-            _engine.setProperty('volume', float(p))
+        proc = _remote()
+        if proc is not None:
+            return bool(proc.call("volume", p))
+        if _inited and p == _last_vol:
+            return True
+
+        def _job():
+            global _last_vol
+            if not _inited:
+                _init_engine()
+            if p != _last_vol:
+                _engine.setProperty('volume', p)
+                _last_vol = p
+        _call(_job)
         return True
     except Exception:
         return False
 
 
+# Voice profiles: (voice substrings to try in order, rate, volume); None
+# leaves that setting untouched. Aliases share the same tuple.
+_HINGLISH_PROFILE = (("india", "hindi", "indian", "harish", "hemant", "mahi", "kumar"), 150, 0.95)
+_ENGLISH_PROFILE = (("english", "en", "us", "uk", "vctk", "microsoft", "david", "zira", "mark"), 160, 0.95)
+_PROFILE_ALIASES = {
+    'hinglish': _HINGLISH_PROFILE,
+    'hindi': _HINGLISH_PROFILE,
+    'india': _HINGLISH_PROFILE,
+    'english': _ENGLISH_PROFILE,
+    'en': _ENGLISH_PROFILE,
+    'us': _ENGLISH_PROFILE,
+    'uk': _ENGLISH_PROFILE,
+    'slow': ((), 120, None),
+    'fast': ((), 200, None),
+}
+
+
 def set_profile(profile_name: str) -> bool:
     """Apply a named profile (e.g., 'hinglish') that tweaks voice/rate/volume and tries to pick a suitable voice."""
     if not profile_name:
         return False
-    pn = profile_name.strip().lower()
+    cfg = _PROFILE_ALIASES.get(profile_name.strip().lower())
+    if cfg is None:
+        return False
+    candidates, rate, volume = cfg
     try:
-        if pn in ('hinglish', 'hindi', 'india'):
-            # Try to pick an India-sounding voice if available, else keep current
-            # and adjust rate/volume for natural Hinglish delivery
-            # Try common substrings like 'india', 'ind', 'hindi', or names that include locales
-            candidates = ["india", "hindi", "indian", "harish", "hemant", "mahi", "kumar"]
-            for c in candidates:
-                if set_voice(c):
-                    break
-            # Tweak rate and volume to be clearer for Hinglish
-            set_rate(150)
-            set_volume_percent(0.95)
-            return True
-        if pn in ('english', 'en', 'us', 'uk'):
-            # Prefer an English-language voice and set a clear rate/volume for English output
-            candidates = ["english", "en", "us", "uk", "vctk", "microsoft", "david", "zira", "mark"]
-            for c in candidates:
-                if set_voice(c):
-                    break
-            # Tweak rate/volume for clear English delivery
-            set_rate(160)
-            set_volume_percent(0.95)
-            return True
-        elif pn == 'slow':
-            set_rate(120)
-            return True
-        elif pn == 'fast':
-            set_rate(200)
-            return True
-        else:
-            return False
+        for c in candidates:
+            if set_voice(c):
+                break
+        if rate is not None:
+            set_rate(rate)
+        if volume is not None:
+            set_volume_percent(volume)
+        return True
     except Exception:
         return False
 
 
+def preload() -> Optional[Future]:
+    """Start engine init on the TTS worker so the first speak() doesn't pay for it.
+
+    Init is queued like any other job, so a speak() issued meanwhile simply
+    runs after it; nothing has to wait on a separate ready flag.
+    """
+    if _inited:
+        return None
+    return _submit(_init_engine)
+
+
+# Warm SAPI up in the background at import. In process mode the child
+# preloads itself (tts_proc.main), so the parent never touches the engine.
+if settings.TTS_PRELOAD and not settings.TTS_PROCESS:
+    preload()
+
 # Do not auto-apply any profile on import; keep default system voice
 
 def debug_list_and_set_voice():
+    _call(_debug_list_and_set_voice)
+
+
+def _debug_list_and_set_voice():
     _init_engine()
     print('Available voices:')
-    voices = _engine.getProperty('voices')
-    for v in voices:
-        print(' -', getattr(v, 'id', ''), getattr(v, 'name', ''), getattr(v, 'languages', ''))
+    for vid, name, languages, _ in _voices_cache:
+        print(' -', vid, name, languages)
     # Try to set a common English voice
-    for v in voices:
-        name = str(getattr(v, 'name', '')).lower()
-        if 'english' in name or 'zira' in name or 'david' in name or 'mark' in name:
+    for vid, name, _, _ in _voices_cache:
+        if _PREF_RE.search(name):
             print('Setting voice:', name)
-            _engine.setProperty('voice', v.id)
+            _engine.setProperty('voice', vid)
             break
     print('Voice set. Try speaking now.')
 
 # Call this at module import for debug
 if __name__ == '__main__':
-    _init_engine()
+    _call(_init_engine)
     print('Testing voice output...')
     speak('Hello Final Boss. This is a test of the speaking system.', emotion='friendly')
     print('Test complete.')
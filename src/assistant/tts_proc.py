@@ -0,0 +1,155 @@
+"""Run the TTS engine in a child process.
+
+With ``TTS_PROCESS=1`` the assistant's process never drives pyttsx3/SAPI
+itself: `tts.py` forwards each call over a ``multiprocessing`` Pipe to a
+child running ``main()``, which serves the requests with the regular
+in-process TTS code. The Tk loop and the STT thread then keep running
+while the child synthesizes.
+
+Messages are ``(request_id, cmd, payload)`` tuples; the child answers each
+with ``(request_id, ok, value)``. ``say`` is answered when the utterance has
+finished, every other command right away, so ``stop`` can overtake a
+running ``say``. ``None`` shuts the child down.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, wait
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def main(conn) -> None:
+    """Child-process entry point: serve TTS requests arriving on ``conn``."""
+    from . import tts
+
+    tts._child = True
+    if tts.settings.TTS_PRELOAD:
+        tts.preload()
+    send_lock = threading.Lock()
+
+    def reply(rid: int, ok: bool, value: Any) -> None:
+        with send_lock:
+            try:
+                conn.send((rid, ok, value))
+            except (EOFError, OSError):
+                pass
+
+    def set_voice(criteria):
+        return tts.set_voice(criteria), tts.get_current_voice()
+
+    handlers = {
+        "stop": lambda _: tts.stop(),
+        "interrupt": lambda _: tts.interrupt(),
+        "barge_in": lambda _: tts.barge_in(),
+        "voices": lambda _: tts.list_voices(),
+        "voice": set_voice,
+        "rate": tts.set_rate,
+        "volume": tts.set_volume_percent,
+    }
+
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            break
+        if msg is None:
+            break
+        rid, cmd, payload = msg
+        if cmd == "say":
+            fut = tts.speak_async(payload)
+            if fut is None:
+                reply(rid, True, None)
+            else:
+                fut.add_done_callback(lambda f, rid=rid: reply(rid, f.exception() is None, None))
+            continue
+        try:
+            reply(rid, True, handlers[cmd](payload))
+        except Exception as exc:
+            reply(rid, False, str(exc))
+    tts._call(lambda: None)
+
+
+class TTSProcess:
+    """Parent-side handle: spawns the child and matches replies to Futures."""
+
+    def __init__(self):
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._proc = ctx.Process(target=main, args=(child_conn,), name="TTSProcess", daemon=True)
+        self._proc.start()
+        child_conn.close()
+        self._ids = itertools.count(1)
+        self._pending: dict = {}
+        self._says: set = set()
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read_loop, name="TTSProcessReader", daemon=True)
+        self._reader.start()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.is_alive()
+
+    @property
+    def speaking(self) -> bool:
+        return bool(self._says)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        with self._lock:
+            says = [self._pending[rid] for rid in self._says if rid in self._pending]
+        return not wait(says, timeout).not_done
+
+    def submit(self, cmd: str, payload: Any = None) -> Future:
+        fut: Future = Future()
+        with self._lock:
+            rid = next(self._ids)
+            self._pending[rid] = fut
+            if cmd == "say":
+                self._says.add(rid)
+            try:
+                self._conn.send((rid, cmd, payload))
+            except (EOFError, OSError) as exc:
+                self._pending.pop(rid, None)
+                self._says.discard(rid)
+                fut.set_exception(RuntimeError(f"TTS process unavailable: {exc}"))
+        return fut
+
+    def call(self, cmd: str, payload: Any = None, timeout: Optional[float] = None) -> Any:
+        return self.submit(cmd, payload).result(timeout)
+
+    def _read_loop(self) -> None:
+        while True:
+            try:
+                rid, ok, value = self._conn.recv()
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                fut = self._pending.pop(rid, None)
+                self._says.discard(rid)
+            if fut is None:
+                continue
+            if ok:
+                fut.set_result(value)
+            else:
+                fut.set_exception(RuntimeError(value))
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._says.clear()
+        for fut in pending.values():
+            fut.set_exception(RuntimeError("TTS process exited"))
+
+    def close(self, timeout: float = 2.0) -> None:
+        try:
+            self._conn.send(None)
+        except (EOFError, OSError):
+            pass
+        self._proc.join(timeout)
+        if self._proc.is_alive():
+            logger.warning("TTS process did not exit; terminating it")
+            self._proc.terminate()
+        self._conn.close()
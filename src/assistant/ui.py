@@ -1,15 +1,172 @@
 
-from typing import Optional, Tuple, List, Iterable
+import ctypes
+import functools
+import hashlib
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, List, Iterable, NamedTuple
 from .config import settings
+from .win_input import key_input, key_taps, mouse_input, send_inputs, system_metric
+
+# GUI/OCR backends are imported once here rather than inside every helper;
+# each is optional and the helpers bail out when theirs is None.
+try:
+    import uiautomation as _AUTO
+except Exception:  # pragma: no cover - uiautomation is optional (Windows only)
+    _AUTO = None
+
+try:
+    import pyautogui as _PG
+except Exception:  # pragma: no cover - pyautogui is optional
+    _PG = None
+
+try:
+    import numpy as _NP
+except Exception:  # pragma: no cover - numpy is optional
+    _NP = None
+
+try:
+    import cv2 as _CV
+except Exception:  # pragma: no cover - OpenCV is optional
+    _CV = None
+
+try:
+    import pytesseract as _PYT
+except Exception:  # pragma: no cover - pytesseract is optional
+    _PYT = None
+
+# Default Windows install location of tesseract.exe, checked once at import
+# rather than stat'ed on every OCR call.
+_TESSERACT_PATH = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+try:
+    if _PYT is not None and os.name == 'nt' and os.path.exists(_TESSERACT_PATH):
+        _PYT.pytesseract.tesseract_cmd = _TESSERACT_PATH
+except Exception:
+    pass
+
+# tesserocr keeps Tesseract loaded in-process; without it every OCR band
+# spawns a tesseract.exe through pytesseract.
+try:
+    import tesserocr as _tesserocr
+except Exception:  # pragma: no cover - tesserocr is optional
+    _tesserocr = None
+
+try:
+    import mss as _mss
+except Exception:  # pragma: no cover - mss is optional
+    _mss = None
+
+# mss handles hold per-thread GDI state, so each thread keeps its own.
+_capture_local = threading.local()
+# Per-thread OCR preprocessing state: a CLAHE instance plus output buffers
+# for the last frame size, reused across calls instead of reallocated.
+_ocr_local = threading.local()
+
+# OCR fan-out: every pytesseract call is its own tesseract process, so the
+# screenshot is cut into horizontal bands that are OCR'd on threads in parallel.
+# Bands overlap so no text line is cut in half; each word is kept only by the
+# band that owns its vertical centre.
+_OCR_MAX_BANDS = max(1, min(4, os.cpu_count() or 1))
+_OCR_BAND_MIN_HEIGHT = 300
+_OCR_BAND_OVERLAP = 40
+# Last OCR result keyed by a hash of a small thumbnail of the screenshot:
+# retry loops that re-run OCR on an unchanged screen reuse the word boxes
+# instead of re-preprocessing and re-running Tesseract.
+_OCR_CACHE = {'hash': None, 'data': None, 'ts': 0.0}
+_OCR_CACHE_TTL = 2.0
+# Lines naming Google chrome (tabs, ads, widgets) are never result titles.
+_BANNED_RE = re.compile(
+    r'(?i)\b(?:google|images|videos|news|shopping|more|people also ask|sponsored|ads?|filters|tools|translate|maps)\b'
+)
+# Frames are scaled so Tesseract sees about _OCR_TARGET_WIDTH columns: wide
+# (high-DPI) screens are shrunk, narrow ones below _OCR_UPSCALE_BELOW enlarged.
+_OCR_TARGET_WIDTH = 1600
+_OCR_UPSCALE_BELOW = 1200
+_OCR_DATA_KEYS = ('text', 'conf', 'left', 'top', 'width', 'height', 'block_num', 'par_num', 'line_num')
+
+
+_VK_TAB = 0x09
+_VK_SHIFT = 0x10
+_MOUSEEVENTF_MOVE = 0x0001
+_MOUSEEVENTF_LEFTDOWN = 0x0002
+_MOUSEEVENTF_LEFTUP = 0x0004
+_MOUSEEVENTF_VIRTUALDESK = 0x4000
+_MOUSEEVENTF_ABSOLUTE = 0x8000
+_SM_XVIRTUALSCREEN, _SM_YVIRTUALSCREEN, _SM_CXVIRTUALSCREEN, _SM_CYVIRTUALSCREEN = 76, 77, 78, 79
+
+
+def _abs_mouse_coords(x: int, y: int, vx: int, vy: int, vw: int, vh: int) -> Tuple[int, int]:
+    """Screen pixel -> SendInput absolute coordinates (0..65535 over the virtual desktop)."""
+    return ((x - vx) * 65535 // max(1, vw - 1), (y - vy) * 65535 // max(1, vh - 1))
+
+
+def _press_tab(count: int = 1, shift: bool = False) -> None:
+    """Press TAB (or SHIFT+TAB) ``count`` times, as one SendInput batch on Windows."""
+    keys = key_taps(_VK_TAB, count)
+    if shift:
+        keys = [key_input(_VK_SHIFT)] + keys + [key_input(_VK_SHIFT, up=True)]
+    try:
+        if send_inputs(keys):
+            return
+    except Exception:
+        pass
+    if shift:
+        for _ in range(count):
+            _PG.hotkey('shift', 'tab')
+    else:
+        _PG.press('tab', presses=count)
+
+
+def _fast_click(x: int, y: int) -> bool:
+    """Move to (x, y) and left-click with one SendInput batch (Windows only).
+
+    Skips pyautogui's animated move and per-call PAUSE; returns False when
+    SendInput isn't available or didn't inject all three events.
+    """
+    try:
+        dx, dy = _abs_mouse_coords(
+            x, y,
+            system_metric(_SM_XVIRTUALSCREEN), system_metric(_SM_YVIRTUALSCREEN),
+            system_metric(_SM_CXVIRTUALSCREEN), system_metric(_SM_CYVIRTUALSCREEN),
+        )
+        return send_inputs([
+            mouse_input(dx, dy, _MOUSEEVENTF_MOVE | _MOUSEEVENTF_ABSOLUTE | _MOUSEEVENTF_VIRTUALDESK),
+            mouse_input(0, 0, _MOUSEEVENTF_LEFTDOWN),
+            mouse_input(0, 0, _MOUSEEVENTF_LEFTUP),
+        ]) == 3
+    except Exception:
+        return False
+
+
+def _adaptive_wait(predicate: Callable[[], bool], timeout: float = 3.0, initial: float = 0.01, factor: float = 1.5, cap: float = 0.25) -> bool:
+    """Poll ``predicate`` until it is true or ``timeout`` seconds pass.
+
+    The poll interval starts at ``initial`` and grows by ``factor`` up to
+    ``cap``, so a UI that settles quickly is noticed within milliseconds
+    while a slow one isn't polled in a tight loop.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while True:
+        if predicate():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * factor, cap)
 
 
 def _click_with_cursor(control) -> bool:
     """Move the real cursor to a control's center and click; fallback to UIA click."""
     if not control or not control.Exists(0, 0):
         return False
-    try:
-        import pyautogui
-    except Exception:
+    pyautogui = _PG
+    if pyautogui is None:
         try:
             control.Click()
             return True
@@ -42,75 +199,63 @@ def click_first_hyperlink_in_foreground(retries: int = 3, sleep_seconds: float =
     """Try to click the first hyperlink control visible in the current foreground window.
     Requires 'uiautomation' package. Returns True if a click was performed.
     """
-    try:
-        import uiautomation as auto
-        import pyautogui
-        import time
-
-        # Small delay to allow UI to settle
-        time.sleep(sleep_seconds)
+    auto, pyautogui = _AUTO, _PG
+    if auto is None or pyautogui is None:
+        return False
 
-        for _ in range(max(1, retries)):
+    try:
+        win = auto.GetForegroundControl()
+        if not win:
+            return False
+        # Find first hyperlink descendant; UIA's own Exists() polls for it
+        # (returning as soon as it appears) within the old retry budget.
+        link = auto.HyperlinkControl(searchFromControl=win, foundIndex=1)
+        if not link or not link.Exists(sleep_seconds * max(1, retries), 0.1):
+            return False
+        rect = link.BoundingRectangle
+        # BoundingRectangle may be a tuple or object; normalize
+        x = y = width = height = None
+        try:
+            # object-style
+            x = int((rect.left + rect.right) / 2)
+            y = int((rect.top + rect.bottom) / 2)
+            width = abs(rect.right - rect.left)
+            height = abs(rect.bottom - rect.top)
+        except Exception:
+            # tuple-style: (l, t, r, b)
             try:
-                win = auto.GetForegroundControl()
-                if not win:
-                    time.sleep(sleep_seconds)
-                    continue
-                # Find first hyperlink descendant
-                link = auto.HyperlinkControl(searchFromControl=win, foundIndex=1)
-                # Validate link
-                if not link or not link.Exists(0, 0):
-                    time.sleep(sleep_seconds)
-                    continue
-                rect = link.BoundingRectangle
-                # BoundingRectangle may be a tuple or object; normalize
-                x = y = width = height = None
-                try:
-                    # object-style
-                    x = int((rect.left + rect.right) / 2)
-                    y = int((rect.top + rect.bottom) / 2)
-                    width = abs(rect.right - rect.left)
-                    height = abs(rect.bottom - rect.top)
-                except Exception:
-                    # tuple-style: (l, t, r, b)
-                    try:
-                        x = int((rect[0] + rect[2]) / 2)
-                        y = int((rect[1] + rect[3]) / 2)
-                        width = abs(rect[2] - rect[0])
-                        height = abs(rect[3] - rect[1])
-                    except Exception:
-                        pass
-                if x is None or y is None:
-                    time.sleep(sleep_seconds)
-                    continue
-                if y < min_y:
-                    time.sleep(sleep_seconds)
-                    continue
-                if width is not None and height is not None:
-                    if width < 40 or height < 12:
-                        time.sleep(sleep_seconds)
-                        continue
-                pyautogui.moveTo(x, y, duration=max(0.0, settings.CURSOR_MOVE_DURATION))
-                pyautogui.click()
-                return True
+                x = int((rect[0] + rect[2]) / 2)
+                y = int((rect[1] + rect[3]) / 2)
+                width = abs(rect[2] - rect[0])
+                height = abs(rect[3] - rect[1])
             except Exception:
-                time.sleep(sleep_seconds)
-                continue
-        return False
+                pass
+        if x is None or y is None:
+            return False
+        if y < min_y:
+            return False
+        if width is not None and height is not None:
+            if width < 40 or height < 12:
+                return False
+        pyautogui.moveTo(x, y, duration=max(0.0, settings.CURSOR_MOVE_DURATION))
+        pyautogui.click()
+        return True
     except Exception:
-        # uiautomation not installed or other errors
+        # uiautomation errors
         return False
 
 
-def _focus_first_result_via_tab(min_y: int = 0, max_tabs: int = 40, settle: float = 0.08) -> bool:
+def _focus_first_result_via_tab(min_y: int = 0, max_tabs: int = 40, settle: float = 0.08, batch: int = 4) -> bool:
     """Keyboard-based focusing of the first result link by sending TABs until a hyperlink below min_y is focused.
+
+    While focus is still in the page header (above min_y) TABs are sent in
+    bursts of ``batch`` with one settle per burst. A burst that carries focus
+    into the results is undone with SHIFT+TAB and walked one TAB at a time,
+    so the first result isn't skipped.
     Returns True if ENTER was sent on a suitable link.
     """
-    try:
-        import uiautomation as auto
-        import pyautogui
-        import time
-    except Exception:
+    auto, pyautogui = _AUTO, _PG
+    if auto is None or pyautogui is None:
         return False
 
     # Ensure we're at the top of results and reset focus traversal
@@ -124,58 +269,76 @@ def _focus_first_result_via_tab(min_y: int = 0, max_tabs: int = 40, settle: floa
             time.sleep(settle)
         except Exception:
             pass
-    for _ in range(max(1, max_tabs)):
+    def _focused():
         try:
-            # Check currently focused control
-            try:
-                focused = auto.GetFocusedControl()
-            except Exception:
-                focused = None
-            # Validate candidate hyperlink
-            def _is_good_link(ctrl) -> bool:
-                if not ctrl:
-                    return False
-                try:
-                    # Name should look like a result title, not tiny/tab links
-                    name = (ctrl.Name or "").strip()
-                except Exception:
-                    name = ""
-                if name and len(name) < 6:
-                    return False
-                # Control type should be Hyperlink ideally
-                try:
-                    ctn = getattr(ctrl, 'ControlTypeName', None) or ''
-                except Exception:
-                    ctn = ''
-                if 'Hyperlink' not in ctn:
-                    return False
-                # Check geometry
-                try:
-                    rect = ctrl.BoundingRectangle
-                    try:
-                        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
-                    except Exception:
-                        left, top, right, bottom = rect[0], rect[1], rect[2], rect[3]
-                    cx = int((left + right) / 2)
-                    cy = int((top + bottom) / 2)
-                    width = abs(int(right - left))
-                    height = abs(int(bottom - top))
-                except Exception:
-                    return False
-                if cy < min_y:
-                    return False
-                if width < 40 or height < 12:
-                    return False
-                return True
+            return auto.GetFocusedControl()
+        except Exception:
+            return None
+
+    def _focus_key(ctrl):
+        try:
+            return tuple(ctrl.GetRuntimeId())
+        except Exception:
+            return None
+
+    def _bounds(ctrl):
+        rect = ctrl.BoundingRectangle
+        try:
+            return rect.left, rect.top, rect.right, rect.bottom
+        except Exception:
+            return rect[0], rect[1], rect[2], rect[3]
+
+    def _in_header(ctrl) -> bool:
+        if not ctrl:
+            return False
+        try:
+            _l, top, _r, bottom = _bounds(ctrl)
+        except Exception:
+            return False
+        return int((top + bottom) / 2) < min_y
+
+    # Validate candidate hyperlink
+    def _is_good_link(ctrl) -> bool:
+        if not ctrl:
+            return False
+        try:
+            # Name should look like a result title, not tiny/tab links
+            name = (ctrl.Name or "").strip()
+        except Exception:
+            name = ""
+        if name and len(name) < 6:
+            return False
+        # Control type should be Hyperlink ideally
+        try:
+            ctn = getattr(ctrl, 'ControlTypeName', None) or ''
+        except Exception:
+            ctn = ''
+        if 'Hyperlink' not in ctn:
+            return False
+        # Check geometry
+        try:
+            left, top, right, bottom = _bounds(ctrl)
+            cy = int((top + bottom) / 2)
+            width = abs(int(right - left))
+            height = abs(int(bottom - top))
+        except Exception:
+            return False
+        if cy < min_y:
+            return False
+        if width < 40 or height < 12:
+            return False
+        return True
 
+    pressed = 0
+    careful = False
+    while pressed < max(1, max_tabs):
+        try:
+            # Check currently focused control
+            focused = _focused()
             if _is_good_link(focused):
                 # Move cursor to the focused link before activation to mirror human behavior
                 try:
-                    rect = focused.BoundingRectangle
-                    try:
-                        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
-                    except Exception:
-                        left, top, right, bottom = rect[0], rect[1], rect[2], rect[3]
+                    left, top, right, bottom = _bounds(focused)
                     cx = int((left + right) / 2)
                     cy = int((top + bottom) / 2)
                     pyautogui.moveTo(cx, cy, duration=max(0.0, settings.CURSOR_MOVE_DURATION))
@@ -185,19 +348,72 @@ def _focus_first_result_via_tab(min_y: int = 0, max_tabs: int = 40, settle: floa
                 pyautogui.press('enter')
                 return True
 
-            # Otherwise advance focus
-            pyautogui.press('tab')
-            time.sleep(settle)
+            burst = min(batch, max_tabs - pressed)
+            if not careful and burst > 1 and _in_header(focused):
+                # Still above the results: skip ahead a whole burst, settle once
+                _press_tab(burst)
+                pressed += burst
+                time.sleep(settle)
+                if not _in_header(_focused()):
+                    # The burst crossed into the results; undo it and walk it singly
+                    _press_tab(burst, shift=True)
+                    time.sleep(settle)
+                    careful = True
+                continue
+
+            # Otherwise advance focus and wait (at most `settle`) for it to move
+            prev_key = _focus_key(focused)
+            _press_tab(1)
+            pressed += 1
+            if prev_key is None:
+                time.sleep(settle)
+            else:
+                _adaptive_wait(lambda: _focus_key(_focused()) not in (None, prev_key), timeout=settle)
         except Exception:
+            pressed += 1
             time.sleep(settle)
             continue
     return False
 
 
+# (monotonic time, hwnd, title) of the last Win32 title read
+_TITLE_CACHE: Tuple[float, int, str] = (0.0, 0, "")
+_TITLE_CACHE_TTL = 0.05
+
+
+def _win32_foreground_title() -> Optional[str]:
+    """Foreground window title via GetForegroundWindow/GetWindowTextW (no COM).
+
+    Returns None when Win32 isn't available or there is no foreground window.
+    Reads of the same window within _TITLE_CACHE_TTL reuse the last title.
+    """
+    global _TITLE_CACHE
+    windll = getattr(ctypes, 'windll', None)
+    if windll is None:
+        return None
+    try:
+        user32 = windll.user32
+        hwnd = user32.GetForegroundWindow()
+        if not hwnd:
+            return None
+        now = time.monotonic()
+        ts, cached_hwnd, cached_title = _TITLE_CACHE
+        if cached_hwnd == hwnd and now - ts < _TITLE_CACHE_TTL:
+            return cached_title
+        buf = ctypes.create_unicode_buffer(512)
+        user32.GetWindowTextW(hwnd, buf, 512)
+        _TITLE_CACHE = (now, hwnd, buf.value)
+        return buf.value
+    except Exception:
+        return None
+
+
 def _get_foreground_title() -> str:
+    title = _win32_foreground_title()
+    if title is not None:
+        return title
     try:
-        import uiautomation as auto
-        win = auto.GetForegroundControl()
+        win = _AUTO.GetForegroundControl() if _AUTO is not None else None
         if win:
             try:
                 name = win.Name or ""
@@ -223,141 +439,449 @@ def _ocr_first_result_center(min_y: int = 0) -> Optional[Tuple[int, int]]:
     return centers[0] if centers else None
 
 
+def _ocr_band_spans(height: int) -> List[Tuple[int, int]]:
+    """Split [0, height) into up to _OCR_MAX_BANDS owned row ranges."""
+    count = max(1, min(_OCR_MAX_BANDS, height // _OCR_BAND_MIN_HEIGHT))
+    step = -(-height // count)
+    return [(i * step, min(height, (i + 1) * step)) for i in range(count)]
+
+
+def _ocr_in_bands(img, ocr: Callable[[object], dict]) -> dict:
+    """Run ``ocr`` (image array -> image_to_data dict) over bands of img concurrently.
+
+    Returns one image_to_data-shaped dict in full-image coordinates, stored
+    column-wise: ``text`` is a list and every other key a NumPy array. Block
+    numbers are offset per band so line keys from different bands never collide.
+    """
+    height = img.shape[0]
+    spans = _ocr_band_spans(height)
+
+    def _run(span):
+        lo, hi = span
+        top = max(0, lo - _OCR_BAND_OVERLAP)
+        bottom = min(height, hi + _OCR_BAND_OVERLAP)
+        band = img if len(spans) == 1 else img[top:bottom]
+        return lo, hi, top, ocr(band)
+
+    if len(spans) == 1:
+        results = [_run(spans[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=len(spans)) as pool:
+            results = list(pool.map(_run, spans))
+
+    _np = _NP
+    texts: List[str] = []
+    columns = {k: [] for k in _OCR_DATA_KEYS if k != 'text'}
+    for band_idx, (lo, hi, top, data) in enumerate(results):
+        band_texts = data.get('text', [])
+        n = len(band_texts)
+        if not n:
+            continue
+        try:
+            band = {k: _ocr_column(data, k, n) for k in columns}
+        except (TypeError, ValueError):
+            continue
+        band['top'] = band['top'] + top
+        centre = band['top'] + band['height'] // 2
+        own = _np.flatnonzero((centre >= lo) & (centre < hi))
+        band['block_num'] = band['block_num'] + band_idx * 10000
+        for k, col in columns.items():
+            col.append(band[k][own])
+        texts.extend(band_texts[i] for i in own.tolist())
+    merged = {
+        k: (_np.concatenate(parts) if parts else _np.zeros(0, dtype=float if k == 'conf' else _np.int64))
+        for k, parts in columns.items()
+    }
+    merged['text'] = texts
+    return merged
+
+
+def _ocr_column(data: dict, name: str, n: int):
+    """One image_to_data column as a NumPy array (zeros when missing)."""
+    _np = _NP
+    dtype = float if name == 'conf' else _np.int64
+    values = data.get(name)
+    if values is None or len(values) == 0:
+        return _np.zeros(n, dtype=dtype)
+    try:
+        return _np.asarray(values, dtype=dtype)
+    except (TypeError, ValueError):
+        if name != 'conf':
+            raise
+        return _np.array([_safe_float(c) for c in values])
+
+
+def _grab_screen():
+    """Capture the primary monitor as an (h, w, 3) BGR uint8 array.
+
+    Uses mss (raw BitBlt bytes, no PIL image) when installed and falls back
+    to pyautogui.screenshot().
+    """
+    _np = _NP
+    if _mss is not None:
+        try:
+            sct = getattr(_capture_local, 'sct', None)
+            if sct is None:
+                sct = _capture_local.sct = _mss.mss()
+            shot = sct.grab(sct.monitors[1])
+            bgra = _np.frombuffer(shot.bgra, dtype=_np.uint8).reshape(shot.height, shot.width, 4)
+            return _np.ascontiguousarray(bgra[:, :, :3])
+        except Exception:
+            pass
+    return _np.ascontiguousarray(_np.asarray(_PG.screenshot())[:, :, ::-1])  # PIL RGB -> BGR
+
+
+def _screen_signature(arr) -> bytes:
+    """Cheap content hash of a screenshot (~64x64 green-channel thumbnail)."""
+    h, w = arr.shape[:2]
+    thumb = arr[::max(1, h // 64), ::max(1, w // 64), 1]
+    return hashlib.blake2b(thumb.tobytes(), digest_size=8).digest()
+
+
+def _invalidate_ocr_cache() -> None:
+    """Forget the cached OCR result (call after scrolling or navigating)."""
+    _OCR_CACHE['hash'] = None
+
+
 def _ocr_first_result_centers(min_y: int = 0, max_candidates: int = 3, exclude_rects: Optional[List[Tuple[int,int,int,int]]] = None) -> List[Tuple[int, int]]:
     """Use pytesseract to find likely title-like text lines for the first few Google results.
     Returns up to max_candidates screen coordinates (x,y) ordered by visual top-to-bottom.
     """
-    try:
-        import pytesseract
-        import pyautogui
-        from PIL import Image
-    except Exception:
+    data = _ocr_screen_data(min_y)
+    if data is None:
         return []
+    return _ocr_centers_from_data(data, min_y, max_candidates, exclude_rects)
+
+
+def _ocr_screen_data(min_y: int = 0) -> Optional[dict]:
+    """OCR word boxes (screen coordinates) for the screen below min_y, cached while unchanged."""
+    if (_PYT is None and _tesserocr is None) or _NP is None:
+        return None
     try:
-        img = pyautogui.screenshot()
+        img = _grab_screen()
     except Exception:
-        return []
-    # Optional: set tesseract path on Windows and preprocess via OpenCV if available
+        return None
+    screen_h, screen_w = img.shape[:2]
+    top = max(0, min(int(min_y), screen_h - 1))
+    img = img[top:]
     try:
-        import os as _os
-        import platform as _pl
-        if _pl.system().lower().startswith('win'):
-            tpath = r"C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
-            try:
-                if _os.path.exists(tpath):
-                    import pytesseract as _pt
-                    _pt.pytesseract.tesseract_cmd = tpath
-            except Exception:
-                pass
+        signature = (_screen_signature(img), top)
     except Exception:
-        pass
-    # Preprocess image
+        signature = None
+    if (
+        signature is not None
+        and _OCR_CACHE['hash'] == signature
+        and time.monotonic() - _OCR_CACHE['ts'] < _OCR_CACHE_TTL
+    ):
+        data = _OCR_CACHE['data']
+    else:
+        data = _ocr_screenshot_data(img, _PYT, y_offset=top)
+        if data is None:
+            return None
+        data['screen_size'] = (screen_w, screen_h)
+        if signature is not None:
+            _OCR_CACHE.update(hash=signature, data=data, ts=time.monotonic())
+    return data
+
+
+def _ocr_scale(width: int) -> float:
+    """Resize factor applied before OCR for a frame ``width`` pixels wide."""
+    if width < _OCR_UPSCALE_BELOW:
+        return 1.5  # small fonts OCR better slightly enlarged
+    return min(1.0, _OCR_TARGET_WIDTH / float(width))
+
+
+class _OCRConfig(NamedTuple):
+    scale: float
+    size: Tuple[int, int]  # (w, h) handed to Tesseract
+    clahe_tiles: Tuple[int, int]
+    min_y_floor: int  # result titles never start above this
+    nav_max_bottom: int  # nav rows ('All Images ...') end above this
+
+
+@functools.lru_cache(maxsize=8)
+def _ocr_config(w: int, h: int) -> _OCRConfig:
+    """Size-dependent OCR parameters, computed once per frame size (it rarely changes)."""
+    scale = _ocr_scale(w)
+    size = (max(1, int(w * scale)), max(1, int(h * scale)))
+    tall = h >= 1200
+    return _OCRConfig(
+        scale=scale,
+        size=size,
+        clahe_tiles=(8, 8) if size[1] < 1440 else (12, 12),
+        min_y_floor=380 if tall else 280,
+        nav_max_bottom=500 if tall else 400,
+    )
+
+
+def _ocr_screenshot_data(img, pytesseract, y_offset: int = 0) -> Optional[dict]:
+    """Preprocess a screenshot and OCR it into an image_to_data-shaped dict.
+
+    ``img`` may be a crop starting ``y_offset`` rows down the screen; the
+    returned boxes are mapped back to full-screen coordinates.
+    """
+    # Preprocess image (img is a BGR array from _grab_screen)
+    h, w = img.shape[:2]
+    cfg = _ocr_config(w, h)
+    scale = cfg.scale
     try:
-        import numpy as _np
-        import cv2 as _cv
-        arr = _np.array(img)[:, :, ::-1]  # PIL RGB -> BGR
-        # scale up slightly to help OCR with small fonts
-        h, w = arr.shape[:2]
-        scale = 1.5 if max(h, w) < 1600 else 1.25
-        arr = _cv.resize(arr, (int(w * scale), int(h * scale)), interpolation=_cv.INTER_CUBIC)
-        gray = _cv.cvtColor(arr, _cv.COLOR_BGR2GRAY)
-        clahe = _cv.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-        eq = clahe.apply(gray)
-        blur = _cv.GaussianBlur(eq, (3,3), 0)
-        # light adaptive threshold retains headings while suppressing noise
-        th = _cv.adaptiveThreshold(blur, 255, _cv.ADAPTIVE_THRESH_GAUSSIAN_C, _cv.THRESH_BINARY, 31, 2)
-        # back to PIL
-        from PIL import Image as _Image
-        img = _Image.fromarray(th)
+        img = _ocr_preprocess(img, cfg)
     except Exception:
-        pass
+        img = img[:, :, ::-1]  # no OpenCV: hand Tesseract the raw RGB pixels
+        scale = 1.0
     # Use tesseract data to get word boxes and group into lines
+    engines = []
+    if _tesserocr is not None and not _tess_failed:
+        engines.append(_tesserocr_image_to_data)
+    if pytesseract is not None:
+        engines.append(
+            lambda band: pytesseract.image_to_data(band, output_type=pytesseract.Output.DICT, config='--oem 3 --psm 6')
+        )
+    data = None
+    for ocr in engines:
+        try:
+            data = _ocr_in_bands(img, ocr)
+            break
+        except Exception:
+            continue
+    if data is None:
+        return None
+    return _rescale_ocr_boxes(data, scale, y_offset)
+
+
+def _ocr_preprocess(img, cfg: _OCRConfig):
+    """Resize, equalise, blur and threshold a BGR frame for Tesseract.
+
+    With OpenCL available the chain runs on UMats so intermediates stay on
+    the device and only the final binary image is downloaded; otherwise it
+    runs on the CPU into this thread's reusable buffers.
+    """
+    _cv = _CV
+    interp = _cv.INTER_CUBIC if cfg.scale > 1.0 else _cv.INTER_AREA
+    if _use_opencl():
+        arr = _cv.UMat(img)
+        if cfg.scale != 1.0:
+            arr = _cv.resize(arr, cfg.size, interpolation=interp)
+        gray = _cv.cvtColor(arr, _cv.COLOR_BGR2GRAY)
+        eq = _ocr_clahe(cfg.clahe_tiles).apply(gray)
+        blur = _cv.GaussianBlur(eq, (3,3), 0)
+        return _cv.adaptiveThreshold(blur, 255, _cv.ADAPTIVE_THRESH_GAUSSIAN_C, _cv.THRESH_BINARY, 31, 2).get()
+    buf = _ocr_buffers(cfg.size[1], cfg.size[0], cfg.clahe_tiles)
+    if cfg.scale == 1.0:
+        arr = img
+    else:
+        arr = _cv.resize(img, cfg.size, dst=buf['scaled'], interpolation=interp)
+    gray = _cv.cvtColor(arr, _cv.COLOR_BGR2GRAY, dst=buf['gray'])
+    eq = buf['clahe'].apply(gray, dst=buf['eq'])
+    blur = _cv.GaussianBlur(eq, (3,3), 0, dst=buf['blur'])
+    # light adaptive threshold retains headings while suppressing noise
+    return _cv.adaptiveThreshold(blur, 255, _cv.ADAPTIVE_THRESH_GAUSSIAN_C, _cv.THRESH_BINARY, 31, 2, dst=buf['th'])
+
+
+@functools.lru_cache(maxsize=1)
+def _use_opencl() -> bool:
+    """True when OpenCV has a usable OpenCL device (checked once)."""
     try:
-        data = pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT, config='--oem 3 --psm 6')
+        return bool(_CV.ocl.haveOpenCL()) and bool(_CV.ocl.useOpenCL())
     except Exception:
-        return []
-    n = len(data.get('text', []))
-    if not n:
-        return []
-    # Group by (block_num, par_num, line_num)
-    lines = {}
-    for i in range(n):
+        return False
+
+
+# Idle tesserocr API handles. Each holds a loaded Tesseract instance and is
+# used by one band at a time, so concurrent bands check out separate handles.
+_tess_apis: "queue.LifoQueue" = queue.LifoQueue()
+_tess_failed = False
+
+
+def _tesserocr_image_to_data(band) -> dict:
+    """image_to_data-shaped dict for ``band`` from a pooled tesserocr API."""
+    global _tess_failed
+    tess = _tesserocr
+    try:
+        api = _tess_apis.get_nowait()
+    except queue.Empty:
         try:
-            text = (data['text'][i] or '').strip()
-            if not text:
-                continue
-            conf = int(data.get('conf', ['-1'])[i]) if data.get('conf') else 0
-            if conf < 40:
-                continue
-            x = int(data['left'][i]); y = int(data['top'][i]); w = int(data['width'][i]); h = int(data['height'][i])
-            key = (data.get('block_num', [0])[i], data.get('par_num', [0])[i], data.get('line_num', [0])[i])
-            arr = lines.setdefault(key, [])
-            arr.append((x, y, w, h, text))
+            api = tess.PyTessBaseAPI(psm=tess.PSM.SINGLE_BLOCK)
         except Exception:
-            continue
-    if not lines:
+            _tess_failed = True  # no usable tessdata: stay on pytesseract from now on
+            raise
+    try:
+        band = _NP.ascontiguousarray(band)
+        h, w = band.shape[:2]
+        bpp = 1 if band.ndim == 2 else band.shape[2]
+        api.SetImageBytes(band.tobytes(), w, h, bpp, w * bpp)
+        api.Recognize()
+        out = {k: [] for k in _OCR_DATA_KEYS}
+        ril = tess.RIL
+        block = par = line = 0
+        for it in tess.iterate_level(api.GetIterator(), ril.WORD):
+            if it.IsAtBeginningOf(ril.BLOCK):
+                block += 1; par = 0; line = 0
+            if it.IsAtBeginningOf(ril.PARA):
+                par += 1; line = 0
+            if it.IsAtBeginningOf(ril.TEXTLINE):
+                line += 1
+            box = it.BoundingBox(ril.WORD)
+            if box is None:
+                continue
+            x1, y1, x2, y2 = box
+            out['text'].append(it.GetUTF8Text(ril.WORD) or '')
+            out['conf'].append(it.Confidence(ril.WORD))
+            out['left'].append(x1)
+            out['top'].append(y1)
+            out['width'].append(x2 - x1)
+            out['height'].append(y2 - y1)
+            out['block_num'].append(block)
+            out['par_num'].append(par)
+            out['line_num'].append(line)
+        return out
+    finally:
+        _tess_apis.put(api)
+
+
+def _rescale_ocr_boxes(data: dict, scale: float, y_offset: int) -> dict:
+    """Map word boxes from a resized crop back to screen pixels (in place)."""
+    if scale != 1.0:
+        for key in ('left', 'top', 'width', 'height'):
+            data[key] = _NP.rint(data[key] / scale).astype(_NP.int64)
+    if y_offset:
+        data['top'] = data['top'] + y_offset
+    return data
+
+
+def _ocr_buffers(h: int, w: int, tiles: Tuple[int, int] = (8, 8)) -> dict:
+    """This thread's CLAHE and scratch arrays for an h x w preprocessed frame.
+
+    Buffers are kept for the last size only (the screen size rarely changes);
+    the thresholded output is overwritten by the next call on this thread.
+    """
+    buf = getattr(_ocr_local, 'buf', None)
+    if buf is None or (buf['h'], buf['w'], buf['tiles']) != (h, w, tiles):
+        empty = _NP.empty
+        buf = _ocr_local.buf = {
+            'h': h, 'w': w, 'tiles': tiles, 'clahe': _ocr_clahe(tiles),
+            'scaled': empty((h, w, 3), dtype=_NP.uint8),
+            'gray': empty((h, w), dtype=_NP.uint8),
+            'eq': empty((h, w), dtype=_NP.uint8),
+            'blur': empty((h, w), dtype=_NP.uint8),
+            'th': empty((h, w), dtype=_NP.uint8),
+        }
+    return buf
+
+
+def _ocr_clahe(tiles: Tuple[int, int]):
+    """This thread's CLAHE instance for the given tile grid."""
+    cached = getattr(_ocr_local, 'clahe', None)
+    if cached is None or cached[0] != tiles:
+        cached = _ocr_local.clahe = (tiles, _CV.createCLAHE(clipLimit=2.0, tileGridSize=tiles))
+    return cached[1]
+
+
+def _group_ocr_lines(data: dict) -> Optional[dict]:
+    """Group OCR words into text lines with NumPy instead of a per-word loop.
+
+    Words with confidence >= 40 are sorted by (block, par, line) and then x,
+    and per-line bounds come from ufunc.reduceat over the sorted arrays.
+    Returns per-line arrays ``left/top/right/bottom/height_avg/count`` plus
+    ``text`` (words joined left to right), or None when no word survives.
+    """
+    _np = _NP
+
+    texts = data.get('text', [])
+    n = len(texts)
+    if not n:
+        return None
+    conf = _ocr_column(data, 'conf', n)
+    has_text = _np.fromiter((bool(t and str(t).strip()) for t in texts), dtype=bool, count=n)
+    idx = _np.flatnonzero(has_text & (conf >= 40))
+    if not idx.size:
+        return None
+    def _col(name):
+        return _ocr_column(data, name, n)[idx]
+
+    left, top, width, height = _col('left'), _col('top'), _col('width'), _col('height')
+    keys = _col('block_num') * 1_000_000 + _col('par_num') * 1_000 + _col('line_num')
+    order = _np.lexsort((left, keys))  # by line key, then left to right
+    keys = keys[order]
+    left, top, width, height = left[order], top[order], width[order], height[order]
+    words = [str(texts[i]).strip() for i in idx[order]]
+
+    starts = _np.flatnonzero(_np.r_[True, keys[1:] != keys[:-1]])
+    ends = _np.r_[starts[1:], keys.size]
+    count = ends - starts
+    return {
+        'left': _np.minimum.reduceat(left, starts),
+        'top': _np.minimum.reduceat(top, starts),
+        'right': _np.maximum.reduceat(left + width, starts),
+        'bottom': _np.maximum.reduceat(top + height, starts),
+        'height_avg': _np.add.reduceat(height, starts) / count,
+        'count': count,
+        'text': [' '.join(words[a:b]) for a, b in zip(starts.tolist(), ends.tolist())],
+    }
+
+
+def _safe_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return -1.0
+
+
+def _ocr_centers_from_data(data: dict, min_y: int, max_candidates: int, exclude_rects) -> List[Tuple[int, int]]:
+    """Group OCR words into lines and pick likely result-title centers."""
+    try:
+        lines = _group_ocr_lines(data)
+    except Exception:
+        return []
+    if lines is None:
         return []
+    n_lines = len(lines['text'])
+    bottoms = lines['bottom'].tolist(); counts = lines['count'].tolist()
+    screen_size = data.get('screen_size')
+    cfg = _ocr_config(*screen_size) if screen_size else _ocr_config(1920, 1080)
     # Identify top markers to compute a dynamic min_y (below 'About X results' or nav row 'All Images ...')
     nav_bottom = 0
     about_bottom = 0
-    for key, words in list(lines.items()):
-        try:
-            text_line = ' '.join([t for x, y, w, h, t in sorted(words, key=lambda a: a[0])])
-            low = text_line.lower()
-            ys = [y for x, y, w, h, t in words]; hs = [h for x, y, w, h, t in words]
-            top = min(ys); bottom = max([y + h for x, y, w, h, t in words])
-            if ('about' in low and 'result' in low) or ('results' in low):
-                about_bottom = max(about_bottom, bottom)
-            # nav row often contains several of these tokens
-            nav_tokens = ['all', 'images', 'videos', 'news', 'shopping', 'maps']
-            token_hits = sum(1 for tok in nav_tokens if tok in low)
-            if token_hits >= 1 and len(words) >= 2 and bottom < 400:
-                nav_bottom = max(nav_bottom, bottom)
-        except Exception:
-            continue
-
-    dynamic_min_y = max(min_y, about_bottom + 60, nav_bottom + 60, 280)
-
+    nav_tokens = ['all', 'images', 'videos', 'news', 'shopping', 'maps']
+    for i in range(n_lines):
+        low = lines['text'][i].lower()
+        bottom = bottoms[i]
+        if ('about' in low and 'result' in low) or ('results' in low):
+            about_bottom = max(about_bottom, bottom)
+        # nav row often contains several of these tokens
+        token_hits = sum(1 for tok in nav_tokens if tok in low)
+        if token_hits >= 1 and counts[i] >= 2 and bottom < cfg.nav_max_bottom:
+            nav_bottom = max(nav_bottom, bottom)
+
+    dynamic_min_y = max(min_y, about_bottom + 60, nav_bottom + 60, cfg.min_y_floor)
+
+    # Geometric heuristics for a result title on Google, applied to all lines at once:
+    # below the header, in the first column (60..900 px), not small text, reasonably wide
+    widths_arr = lines['right'] - lines['left']
+    keep = (
+        (lines['top'] >= dynamic_min_y)
+        & (lines['left'] >= 60) & (lines['left'] <= 900)
+        & (lines['height_avg'] >= 12)
+        & (widths_arr >= 260)
+    )
+    # Exclude header/logo/search-box rectangles
+    if exclude_rects:
+        keep &= ~_excluded_points(
+            exclude_rects, (lines['left'] + lines['right']) // 2, (lines['top'] + lines['bottom']) // 2
+        )
     # Build line candidates
     candidates = []
-    for key, words in lines.items():
-        xs = [x for x, y, w, h, t in words]; ys = [y for x, y, w, h, t in words]
-        ws = [w for x, y, w, h, t in words]; hs = [h for x, y, w, h, t in words]
-        left = min(xs); right = max([x + w for x, y, w, h, t in words])
-        top = min(ys); bottom = max([y + h for x, y, w, h, t in words])
-        height_avg = sum(hs) / max(1, len(hs))
-        text_line = ' '.join([t for x, y, w, h, t in sorted(words, key=lambda a: a[0])])
-        # Heuristics for a result title on Google
-        if top < dynamic_min_y:
-            continue
-        if left < 60:
-            continue
-        if left > 900:  # too far to the right for typical first column
-            continue
-        if height_avg < 12:  # small text; skip
-            continue
+    for i in _NP.flatnonzero(keep).tolist():
+        text_line = lines['text'][i]
         if len(text_line) < 12:
             continue
-        banned = [
-            'Google', 'Images', 'Videos', 'News', 'Shopping', 'More', 'People also ask', 'Sponsored', 'Ads', 'Ad',
-            'Filters', 'Tools', 'Translate', 'Maps'
-        ]
-        if any(b.lower() in text_line.lower() for b in banned):
+        if _BANNED_RE.search(text_line):
             continue
-        # Require line width reasonably wide
+        left = int(lines['left'][i]); right = int(lines['right'][i])
+        top = int(lines['top'][i]); bottom = bottoms[i]
         width = right - left
-        if width < 260:
-            continue
         y_mid = int((top + bottom) / 2)
         x_mid = int((left + right) / 2)
-        # Exclude header/logo/search-box rectangles
-        if exclude_rects:
-            for (lx, ty, rx, by) in exclude_rects:
-                if lx <= x_mid <= rx and ty <= y_mid <= by:
-                    x_mid = -1; y_mid = -1
-                    break
-            if x_mid < 0:
-                continue
         candidates.append((top, x_mid, y_mid, text_line, width))
     if not candidates:
         return []
@@ -376,11 +900,50 @@ def _rect_contains_point(rect: Tuple[int,int,int,int], x: int, y: int) -> bool:
     return l <= x <= r and t <= y <= b
 
 
+_EXCLUDE_CELL = 32
+
+
+def _build_exclusion_mask(rects: List[Tuple[int,int,int,int]], cell: int = _EXCLUDE_CELL):
+    """Coarse grid (one bool per cell x cell pixels) of cells touched by any rect."""
+    rows = max(0, max(b for _l, _t, _r, b in rects)) // cell + 1
+    cols = max(0, max(r for _l, _t, r, _b in rects)) // cell + 1
+    mask = _NP.zeros((rows, cols), dtype=bool)
+    for l, t, r, b in rects:
+        if r < 0 or b < 0 or r < l or b < t:
+            continue
+        mask[max(0, t) // cell:b // cell + 1, max(0, l) // cell:r // cell + 1] = True
+    return mask
+
+
+def _excluded_points(rects: List[Tuple[int,int,int,int]], xs, ys, cell: int = _EXCLUDE_CELL):
+    """Boolean array marking which (xs[i], ys[i]) fall inside any of ``rects``.
+
+    A grid lookup rejects most points at once; only points in a cell some rect
+    touches (or at negative coordinates) get the exact per-rect test.
+    """
+    xs = _NP.asarray(xs, dtype=_NP.int64)
+    ys = _NP.asarray(ys, dtype=_NP.int64)
+    out = _NP.zeros(xs.shape, dtype=bool)
+    if not rects or not xs.size:
+        return out
+    mask = _build_exclusion_mask(rects, cell)
+    gx, gy = xs // cell, ys // cell
+    maybe = (xs < 0) | (ys < 0)
+    on_grid = ~maybe & (gy < mask.shape[0]) & (gx < mask.shape[1])
+    maybe[on_grid] = mask[gy[on_grid], gx[on_grid]]
+    for i in _NP.flatnonzero(maybe).tolist():
+        x, y = int(xs[i]), int(ys[i])
+        out[i] = any(_rect_contains_point(rect, x, y) for rect in rects)
+    return out
+
+
 def _get_exclusion_rects() -> List[Tuple[int,int,int,int]]:
     """Return rectangles to avoid clicking (logo area, search box, header bars) using UIA best-effort."""
     rects: List[Tuple[int,int,int,int]] = []
+    auto = _AUTO
+    if auto is None:
+        return rects
     try:
-        import uiautomation as auto
         win = auto.GetForegroundControl()
         if not win:
             return rects
@@ -422,51 +985,117 @@ def _get_exclusion_rects() -> List[Tuple[int,int,int,int]]:
     return rects
 
 
+def _hyperlink_rects(auto, win, limit: int = 29) -> List[Tuple[str, Tuple[int,int,int,int]]]:
+    """Return (name, (l,t,r,b)) for the first ``limit`` hyperlinks under ``win``.
+
+    Uses a single ``FindAll`` on the raw UIA element so all links come back in
+    one cross-process call; falls back to the per-index control search when
+    the raw interface isn't reachable.
+    """
+    links: List[Tuple[str, Tuple[int,int,int,int]]] = []
+    try:
+        uia = auto._AutomationClient.instance().IUIAutomation
+        cond = uia.CreatePropertyCondition(auto.PropertyId.ControlTypeProperty, auto.ControlType.HyperlinkControl)
+        found = win.Element.FindAll(auto.TreeScope.Descendants, cond)
+        for i in range(min(found.Length, limit)):
+            try:
+                el = found.GetElement(i)
+                rc = el.CurrentBoundingRectangle
+                links.append(((el.CurrentName or '').strip(), (int(rc.left), int(rc.top), int(rc.right), int(rc.bottom))))
+            except Exception:
+                continue
+        return links
+    except Exception:
+        links = []
+    for idx in range(1, limit + 1):
+        try:
+            link = auto.HyperlinkControl(searchFromControl=win, foundIndex=idx)
+            if not link or not link.Exists(0,0):
+                break
+            try:
+                name = (link.Name or '').strip()
+            except Exception:
+                name = ''
+            br = link.BoundingRectangle
+            try:
+                rect = (int(br.left), int(br.top), int(br.right), int(br.bottom))
+            except Exception:
+                rect = (int(br[0]), int(br[1]), int(br[2]), int(br[3]))
+            links.append((name, rect))
+        except Exception:
+            continue
+    return links
+
+
 def _enumerate_hyperlink_candidates(min_y: int = 0, max_candidates: int = 5) -> List[Tuple[int,int,str]]:
     """Enumerate top hyperlink controls that look like result titles, returning (x,y,name)."""
-    results: List[Tuple[int,int,str,int]] = []
+    auto = _AUTO
+    if auto is None:
+        return []
     try:
-        import uiautomation as auto
-        import time as _t
         win = auto.GetForegroundControl()
         if not win:
             return []
-        # Iterate by foundIndex; stop after a bunch
-        for idx in range(1, 30):
-            try:
-                link = auto.HyperlinkControl(searchFromControl=win, foundIndex=idx)
-                if not link or not link.Exists(0,0):
-                    break
-                try:
-                    name = (link.Name or '').strip()
-                except Exception:
-                    name = ''
-                if name and len(name) < 6:
-                    continue
-                br = link.BoundingRectangle
-                try:
-                    l,t,r,b = int(br.left), int(br.top), int(br.right), int(br.bottom)
-                except Exception:
-                    l,t,r,b = int(br[0]), int(br[1]), int(br[2]), int(br[3])
-                cx, cy = int((l+r)/2), int((t+b)/2)
-                width, height = r-l, b-t
-                if cy < min_y:
-                    continue
-                if width < 180 or height < 14:
-                    continue
-                if l < 60 or l > 900:
-                    continue
-                results.append((cx, cy, name, t))
-            except Exception:
-                continue
+        links = _hyperlink_rects(auto, win)
+        if not links:
+            return []
+        names = [name for name, _rect in links]
+        L, T, R, B = _NP.array([rect for _name, rect in links], dtype=_NP.int64).T
+        cx, cy = (L + R) // 2, (T + B) // 2
+        # Result titles: named (or unnamed) but not tiny tab links, below min_y,
+        # wide enough, in the first column
+        name_ok = _NP.fromiter((not n or len(n) >= 6 for n in names), dtype=bool, count=len(names))
+        keep = name_ok & (cy >= min_y) & (R - L >= 180) & (B - T >= 14) & (L >= 60) & (L <= 900)
+        idx = _NP.flatnonzero(keep)
         # sort by top ascending
-        results.sort(key=lambda x: x[3])
-        trimmed = [(cx, cy, name) for (cx, cy, name, _t) in results[:max_candidates]]
-        return trimmed
+        idx = idx[_NP.argsort(T[idx], kind='stable')][:max_candidates]
+        return [(int(cx[i]), int(cy[i]), names[i]) for i in idx.tolist()]
     except Exception:
         return []
 
 
+_discovery_pool: Optional[ThreadPoolExecutor] = None
+_discovery_lock = threading.Lock()
+
+
+def _get_discovery_pool() -> ThreadPoolExecutor:
+    global _discovery_pool
+    with _discovery_lock:
+        if _discovery_pool is None:
+            _discovery_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='ResultDiscovery')
+        return _discovery_pool
+
+
+def _uia_call(fn, *args, **kwargs):
+    """Run a UIA helper on a pool thread, initialising COM for that thread."""
+    init = getattr(_AUTO, 'UIAutomationInitializerInThread', None)
+    if init is None:
+        return fn(*args, **kwargs)
+    with init():
+        return fn(*args, **kwargs)
+
+
+def _discover_result_targets(min_y: int) -> Tuple[List[Tuple[int,int,int,int]], List[Tuple[int,int,str]], Optional[dict]]:
+    """Gather exclusion rects, UIA hyperlink candidates and OCR word boxes concurrently.
+
+    All three are I/O-bound (COM round-trips, screenshot, Tesseract processes),
+    so running them side by side costs max(t) instead of sum(t). A source
+    that fails or overruns its timeout contributes nothing.
+    """
+    pool = _get_discovery_pool()
+    fut_rects = pool.submit(_uia_call, _get_exclusion_rects)
+    fut_uia = pool.submit(_uia_call, _enumerate_hyperlink_candidates, min_y=min_y, max_candidates=5)
+    fut_ocr = pool.submit(_ocr_screen_data, min_y)
+
+    def _result(fut, timeout, default):
+        try:
+            return fut.result(timeout=timeout)
+        except Exception:
+            return default
+
+    return _result(fut_rects, 2.0, []), _result(fut_uia, 3.0, []), _result(fut_ocr, 8.0, None)
+
+
 def click_first_search_result(min_y: int = 0, retries: int = 2, verify: bool = True, prefer_keyboard: bool = False, hint_text: Optional[str] = None) -> bool:
     """Robust attempt to activate the first search result in the current foreground browser.
     Strategy:
@@ -474,21 +1103,16 @@ def click_first_search_result(min_y: int = 0, retries: int = 2, verify: bool = T
     2) Fallback to UI Automation hyperlink click heuristic.
     """
     # 1) Keyboard traversal (preferred for layout/DPI independence) with light retry/scroll
-    try:
-        import pyautogui as _pg
-        import time as _t
-    except Exception:
-        _pg = None
+    _pg, _t = _PG, time
     old_title = _get_foreground_title() if verify else ""
-    # Gather exclusion zones to avoid header/logo/search box
-    exclude_rects = _get_exclusion_rects()
+    # Exclusion zones (header/logo/search box), UIA candidates and OCR run concurrently
+    exclude_rects, uia_cands, ocr_data = _discover_result_targets(min_y)
     # Preferred order: UIA candidates (content-aware) -> OCR (cursor) -> Keyboard (optional)
     candidates_cursor: List[Tuple[int,int,str]] = []
     # 1) UIA: top N hyperlink candidates with their names
-    uia_cands = _enumerate_hyperlink_candidates(min_y=min_y, max_candidates=5)
     candidates_cursor.extend(uia_cands)
     # 2) OCR fallback: add centers with empty names (ranked after UIA)
-    ocr_centers = _ocr_first_result_centers(min_y=min_y, max_candidates=3, exclude_rects=exclude_rects)
+    ocr_centers = _ocr_centers_from_data(ocr_data, min_y, 3, exclude_rects) if ocr_data else []
     for (x,y) in ocr_centers:
         candidates_cursor.append((x,y,''))
     # Rank by hint_text overlap first
@@ -504,43 +1128,40 @@ def click_first_search_result(min_y: int = 0, retries: int = 2, verify: bool = T
         except Exception:
             return 0
     candidates_cursor.sort(key=lambda it: -_score(it[2]))
+    # Which candidates sit inside a header rectangle, decided for all of them at once
+    if exclude_rects and _NP is not None:
+        excluded = _excluded_points(
+            exclude_rects, [c[0] for c in candidates_cursor], [c[1] for c in candidates_cursor]
+        ).tolist()
+    else:
+        excluded = [any(_rect_contains_point(r, cx, cy) for r in exclude_rects or ()) for cx, cy, _n in candidates_cursor]
+
+    def _page_opened() -> bool:
+        new_title = _get_foreground_title()
+        return bool(new_title and new_title != old_title and ('google' not in new_title.lower()))
+
     # Try each candidate with hover then click; slightly nudge downward on click
-    if candidates_cursor and _pg:
+    if candidates_cursor:
         for idx, (cx, cy, name) in enumerate(candidates_cursor):
             try:
                 # Exclude if inside a header rectangle
-                if exclude_rects:
-                    skip = False
-                    for rect in exclude_rects:
-                        if _rect_contains_point(rect, cx, cy):
-                            skip = True; break
-                    if skip:
-                        continue
-                # Hover briefly before click to avoid hitting logo; then click
-                _pg.moveTo(cx, cy, duration=max(0.0, settings.CURSOR_MOVE_DURATION))
-                try:
-                    import time as _t
+                if excluded[idx]:
+                    continue
+                # Click slightly below the centre to bias toward title text, not toolbar.
+                # SendInput does move+click in one batch; pyautogui (hover, then nudge) is the fallback.
+                if not _fast_click(cx, cy + 6):
+                    _pg.moveTo(cx, cy, duration=max(0.0, settings.CURSOR_MOVE_DURATION), _pause=False)
                     _t.sleep(0.15)
-                except Exception:
-                    pass
-                # slight downward nudge before click to bias toward title text, not toolbar
-                _pg.moveRel(0, 6, duration=0.05)
-                _pg.click()
+                    _pg.moveRel(0, 6, duration=0.05, _pause=False)
+                    _pg.click(_pause=False)
                 if not verify:
                     return True
-                import time as _t
-                opened = False
-                for _ in range(14):
-                    _t.sleep(0.25)
-                    new_title = _get_foreground_title()
-                    if new_title and new_title != old_title and ('google' not in new_title.lower()):
-                        opened = True
-                        break
-                if opened:
+                if _adaptive_wait(_page_opened, timeout=3.5):
                     return True
                 # If this candidate didn't work, try a tiny scroll and next candidate
                 try:
                     _pg.scroll(-240)
+                    _invalidate_ocr_cache()
                     _t.sleep(0.15)
                 except Exception:
                     pass
@@ -551,12 +1172,8 @@ def click_first_search_result(min_y: int = 0, retries: int = 2, verify: bool = T
         if not verify:
             return True
         try:
-            import time as _t
-            for _ in range(12):
-                _t.sleep(0.25)
-                new_title = _get_foreground_title()
-                if new_title and new_title != old_title and ('google' not in new_title.lower()):
-                    return True
+            if _adaptive_wait(_page_opened, timeout=3.0):
+                return True
         except Exception:
             pass
     # 4) Keyboard traversal (only if explicitly preferred)
@@ -566,17 +1183,14 @@ def click_first_search_result(min_y: int = 0, retries: int = 2, verify: bool = T
                 if not verify:
                     return True
                 try:
-                    import time as _t
-                    for _ in range(12):
-                        _t.sleep(0.25)
-                        new_title = _get_foreground_title()
-                        if new_title and new_title != old_title and ('google' not in new_title.lower()):
-                            return True
+                    if _adaptive_wait(_page_opened, timeout=3.0):
+                        return True
                 except Exception:
                     pass
             if _pg:
                 try:
                     _pg.scroll(-300)
+                    _invalidate_ocr_cache()
                     _t.sleep(0.2)
                 except Exception:
                     pass
@@ -584,9 +1198,10 @@ def click_first_search_result(min_y: int = 0, retries: int = 2, verify: bool = T
 
 
 def _open_quick_settings() -> bool:
+    pyautogui = _PG
+    if pyautogui is None:
+        return False
     try:
-        import pyautogui
-        import time
         pyautogui.hotkey('winleft', 'a')
         time.sleep(0.7)
         return True
@@ -595,16 +1210,19 @@ def _open_quick_settings() -> bool:
 
 
 def _close_quick_settings():
+    if _PG is None:
+        return
     try:
-        import pyautogui
-        pyautogui.press('esc')
+        _PG.press('esc')
     except Exception:
         pass
 
 
 def _find_quick_action_button(name_pattern: str):
+    auto = _AUTO
+    if auto is None:
+        return None
     try:
-        import uiautomation as auto
         root = auto.GetRootControl()
         # Prefer the current foreground popup after Win+A
         fg = None
@@ -641,8 +1259,10 @@ def _find_quick_action_button(name_pattern: str):
 
 def _get_quick_settings_container():
     """Return the Quick Settings container/pane control if visible, else None."""
+    auto = _AUTO
+    if auto is None:
+        return None
     try:
-        import uiautomation as auto
         fg = None
         try:
             fg = auto.GetForegroundControl()
@@ -662,8 +1282,10 @@ def _get_quick_settings_container():
 
 
 def _find_quick_action_button_in(container, name_pattern: str):
+    auto = _AUTO
+    if auto is None:
+        return None
     try:
-        import uiautomation as auto
         if not container:
             return None
         try:
@@ -695,8 +1317,10 @@ def _rect_valid(br) -> bool:
 
 
 def _scroll_in_container(container, amount: int, hover_offset: int = 20):
+    pyautogui = _PG
+    if pyautogui is None:
+        return
     try:
-        import pyautogui, time
         br = container.BoundingRectangle
         try:
 
@@ -898,10 +1522,7 @@ def quick_toggle(name: str, desired: Optional[bool]) -> bool:
     if not pattern:
         # Try direct string
         pattern = rf"(?i){name}"
-    try:
-        import uiautomation as auto
-        import time
-    except Exception:
+    if _AUTO is None:
         return False
 
     if not _open_quick_settings():
@@ -935,37 +1556,33 @@ def quick_toggle(name: str, desired: Optional[bool]) -> bool:
                     if current is not None and current == want:
                         _close_quick_settings(); return True
                     clicked_once = False
-                    ok: Optional[bool] = None
+                    ok = False
                     if _rect_valid(btn.BoundingRectangle) and _click_with_cursor(btn):
                         clicked_once = True
-                        time.sleep(0.7)
-                        ok = _state_matches()
-                        if ok is True or ok is None:
+                        ok = _adaptive_wait(lambda: _state_matches() is not False, timeout=1.2, **_TOGGLE_POLL)
+                        if ok:
                             _close_quick_settings(); return True
-                    if ok is False or not clicked_once:
+                    if not ok or not clicked_once:
                         try:
                             import pyautogui
                             _ = btn.SetFocus()
                             time.sleep(0.1)
                             pyautogui.press('space')
-                            time.sleep(0.5)
-                            ok = _state_matches()
-                            if ok is True or ok is None:
+                            ok = _adaptive_wait(lambda: _state_matches() is not False, timeout=0.8, **_TOGGLE_POLL)
+                            if ok:
                                 _close_quick_settings(); return True
                             pyautogui.press('enter')
-                            time.sleep(0.5)
-                            ok = _state_matches()
-                            if ok is True or ok is None:
+                            ok = _adaptive_wait(lambda: _state_matches() is not False, timeout=0.8, **_TOGGLE_POLL)
+                            if ok:
                                 _close_quick_settings(); return True
                         except Exception:
                             pass
-                    if ok is False or not clicked_once:
+                    if not ok or not clicked_once:
                         # Do not scroll for noscroll keys; otherwise one more ensure
                         btn2 = None if key in NOSCROLL_KEYS else _ensure_quick_button_visible(pattern)
                         if btn2 and _rect_valid(btn2.BoundingRectangle) and _click_with_cursor(btn2):
-                            time.sleep(0.6)
-                            ok = _state_matches()
-                            if ok is True or ok is None:
+                            ok = _adaptive_wait(lambda: _state_matches() is not False, timeout=1.0, **_TOGGLE_POLL)
+                            if ok:
                                 _close_quick_settings(); return True
             except Exception:
                 time.sleep(0.5)
@@ -975,34 +1592,10 @@ def quick_toggle(name: str, desired: Optional[bool]) -> bool:
     # Settings page fallbacks (no scrolling)
     if key == 'night_light':
         try:
-            import subprocess, time as _t, uiautomation as auto
+            import subprocess
             subprocess.Popen(["start", "ms-settings:display"], shell=True)
-            _t.sleep(1.2)
-            for _ in range(12):
-                win = None
-                try:
-                    win = auto.GetForegroundControl()
-                except Exception:
-                    pass
-                if win:
-                    try:
-                        tog = auto.ToggleButtonControl(searchFromControl=win, RegexName=r"(?i)night\s*light")
-                        if tog and tog.Exists(0,0):
-                            try:
-                                tp = tog.GetTogglePattern()
-                                if desired is None:
-                                    _click_with_cursor(tog); return True
-                                want = 1 if desired else 0
-                                cur = tp.CurrentToggleState
-                                if cur != want:
-                                    _click_with_cursor(tog)
-                                    _t.sleep(0.7)
-                                return True
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-                _t.sleep(0.4)
+            if _set_foreground_toggle(r"(?i)night\s*light", desired):
+                return True
         except Exception:
             pass
     if key == 'battery_saver':
@@ -1014,45 +1607,63 @@ def quick_toggle(name: str, desired: Optional[bool]) -> bool:
 def _toggle_battery_saver_in_settings(desired: Optional[bool]) -> bool:
     """Open Settings to battery saver page and toggle state without QS scrolling."""
     try:
-        import subprocess, time as _t, uiautomation as auto
+        import subprocess
         # Try dedicated battery saver URI first; then fallback to power page
         uris = ["ms-settings:batterysaver", "ms-settings:powersleep", "ms-settings:power"]
-        ok_any = False
         for uri in uris:
             try:
                 subprocess.Popen(["start", uri], shell=True)
-                _t.sleep(1.2)
             except Exception:
                 continue
             # Look for Battery saver / Energy saver toggles
-            for _ in range(12):
-                win = None
-                try:
-                    win = auto.GetForegroundControl()
-                except Exception:
-                    pass
-                if win:
-                    try:
-                        label = r"(?i)(battery\s*saver|energy\s*saver)"
-                        tog = auto.ToggleButtonControl(searchFromControl=win, RegexName=label)
-                        if tog and tog.Exists(0,0):
-                            try:
-                                tp = tog.GetTogglePattern()
-                                if desired is None:
-                                    _click_with_cursor(tog); return True
-                                want = 1 if desired else 0
-                                cur = tp.CurrentToggleState
-                                if cur != want:
-                                    _click_with_cursor(tog)
-                                    _t.sleep(0.7)
-                                return True
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-                _t.sleep(0.4)
-            ok_any = ok_any or False
+            if _set_foreground_toggle(r"(?i)(battery\s*saver|energy\s*saver)", desired):
+                return True
+        return False
+    except Exception:
+        return False
+
+
+# Backoff for toggle-state and Settings-page polls: first check after 30 ms,
+# stretching to 350 ms, so a fast UI is not held up by fixed sleeps.
+_TOGGLE_POLL = {'initial': 0.03, 'factor': 1.7, 'cap': 0.35}
+
+
+def _set_foreground_toggle(label_pattern: str, desired: Optional[bool], timeout: float = 6.0) -> bool:
+    """Wait for a toggle named like label_pattern in the foreground window and set it.
+
+    desired: True/False to force a state, None to flip once. Returns False if
+    no toggle shows up within ``timeout``.
+    """
+    auto = _AUTO
+    if auto is None:
         return False
+    found = []
+
+    def _find() -> bool:
+        try:
+            win = auto.GetForegroundControl()
+            if not win:
+                return False
+            tog = auto.ToggleButtonControl(searchFromControl=win, RegexName=label_pattern)
+            if tog and tog.Exists(0, 0):
+                found.append((tog, tog.GetTogglePattern()))
+                return True
+        except Exception:
+            pass
+        return False
+
+    if not _adaptive_wait(_find, timeout=timeout, **_TOGGLE_POLL):
+        return False
+    tog, tp = found[-1]
+    try:
+        if desired is None:
+            _click_with_cursor(tog)
+            return True
+        want = 1 if desired else 0
+        if tp.CurrentToggleState != want:
+            _click_with_cursor(tog)
+            _adaptive_wait(lambda: tp.CurrentToggleState == want, timeout=1.2, **_TOGGLE_POLL)
+        return True
     except Exception:
         return False
 
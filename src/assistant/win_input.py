@@ -0,0 +1,94 @@
+"""Synthesized keyboard and mouse input through Win32 ``SendInput``.
+
+The INPUT structures are defined once here and ``SendInput`` is bound with
+typed prototypes on a private user32 handle, so the batching helpers in
+`system_controls.py` and `ui.py` share one definition instead of each
+declaring their own (or calling the untyped ``ctypes.windll.user32``).
+On other platforms ``send_inputs`` injects nothing and returns 0.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import os
+from typing import Sequence
+
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", ctypes.c_ulong), ("u", INPUTUNION)]
+
+
+# Private user32 handle: these argtypes must not leak into ctypes.windll.user32.
+_USER32 = ctypes.WinDLL("user32") if os.name == "nt" else None  # type: ignore[attr-defined]
+_SendInput = None
+_GetSystemMetrics = None
+if _USER32 is not None:
+    _SendInput = _USER32.SendInput
+    _SendInput.argtypes = [ctypes.c_uint, ctypes.POINTER(INPUT), ctypes.c_int]
+    _SendInput.restype = ctypes.c_uint
+    _GetSystemMetrics = _USER32.GetSystemMetrics
+    _GetSystemMetrics.argtypes = [ctypes.c_int]
+    _GetSystemMetrics.restype = ctypes.c_int
+
+
+def key_input(vk: int, up: bool = False) -> INPUT:
+    inp = INPUT(type=INPUT_KEYBOARD)
+    inp.ki = KEYBDINPUT(vk, 0, KEYEVENTF_KEYUP if up else 0, 0, 0)
+    return inp
+
+
+def mouse_input(dx: int, dy: int, flags: int) -> INPUT:
+    inp = INPUT(type=INPUT_MOUSE)
+    inp.mi = MOUSEINPUT(dx, dy, 0, flags, 0, 0)
+    return inp
+
+
+def key_taps(vk: int, count: int = 1) -> list:
+    """Down/up pairs for ``vk``, ``count`` times."""
+    inputs = []
+    for _ in range(count):
+        inputs += [key_input(vk), key_input(vk, up=True)]
+    return inputs
+
+
+def send_inputs(inputs: Sequence[INPUT]) -> int:
+    """Inject ``inputs`` in one SendInput call; returns how many went through."""
+    if _SendInput is None or not inputs:
+        return 0
+    batch = (INPUT * len(inputs))(*inputs)
+    return int(_SendInput(len(batch), batch, ctypes.sizeof(INPUT)))
+
+
+def system_metric(index: int) -> int:
+    """GetSystemMetrics(index), or 0 off Windows."""
+    return int(_GetSystemMetrics(index)) if _GetSystemMetrics is not None else 0
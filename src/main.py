@@ -649,4 +649,9 @@ def main() -> None:  # pragma: no cover
 
 
 if __name__ == "__main__":  # pragma: no cover - manual invocation entry point
+    import multiprocessing
+
+    # PyInstaller build: lets a spawned TTS_PROCESS child run tts_proc.main
+    # instead of starting the whole assistant again
+    multiprocessing.freeze_support()
     main()
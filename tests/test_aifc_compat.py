@@ -0,0 +1,68 @@
+import io
+import struct
+
+import pytest
+
+from src.assistant.stdlib_compat import aifc
+
+
+def _extended(rate: int) -> bytes:
+    # 80-bit IEEE extended float for an integral sample rate
+    expon = 16383 + rate.bit_length() - 1
+    mant = rate << (64 - rate.bit_length())
+    return struct.pack(">HII", expon, mant >> 32, mant & 0xFFFFFFFF)
+
+
+def _build_aiff(samples, sampwidth=2, nchannels=1, rate=16000, extra_chunks=b""):
+    if sampwidth == 2:
+        data = struct.pack(f">{len(samples)}h", *samples)
+    else:
+        data = b"".join(s.to_bytes(sampwidth, "big", signed=True) for s in samples)
+    nframes = len(samples) // nchannels
+    comm = struct.pack(">hIh", nchannels, nframes, sampwidth * 8) + _extended(rate)
+    ssnd = struct.pack(">II", 0, 0) + data
+    body = b"AIFF"
+    body += extra_chunks
+    body += b"COMM" + struct.pack(">I", len(comm)) + comm
+    body += b"SSND" + struct.pack(">I", len(ssnd)) + ssnd
+    return b"FORM" + struct.pack(">I", len(body)) + body
+
+
+def test_readframes_roundtrip():
+    samples = [0, 1, -1, 32767, -32768, 1234]
+    f = aifc.open(io.BytesIO(_build_aiff(samples)))
+    assert f.getnchannels() == 1
+    assert f.getsampwidth() == 2
+    assert f.getframerate() == 16000
+    assert f.getnframes() == len(samples)
+    assert f.readframes(len(samples)) == struct.pack(f">{len(samples)}h", *samples)
+    assert f.tell() == len(samples)
+
+
+def test_readframes_np_little_endian():
+    np = pytest.importorskip("numpy")
+    samples = [0, 1, -1, 32767, -32768, 1234]
+    f = aifc.open(io.BytesIO(_build_aiff(samples)))
+    arr = f.readframes_np(4)
+    assert arr.dtype == np.dtype("<i2")
+    assert arr.tolist() == samples[:4]
+    assert f.readframes_np(10).tolist() == samples[4:]
+
+
+def test_readframes_np_24bit_sign_extends():
+    pytest.importorskip("numpy")
+    samples = [0, 1, -1, 8388607, -8388608]
+    f = aifc.open(io.BytesIO(_build_aiff(samples, sampwidth=3)))
+    assert f.readframes_np(len(samples)).tolist() == samples
+
+
+def test_unknown_chunks_are_skipped():
+    extra = b"NAME" + struct.pack(">I", 5) + b"hello\x00"
+    f = aifc.open(io.BytesIO(_build_aiff([7, -7], extra_chunks=extra)))
+    assert f.getnframes() == 2
+    assert f.readframes(2) == struct.pack(">2h", 7, -7)
+
+
+def test_readframes_samples_yields_frames():
+    f = aifc.open(io.BytesIO(_build_aiff([1, -2, 3, -4], nchannels=2)))
+    assert list(f.readframes_samples(2)) == [(1, -2), (3, -4)]
@@ -0,0 +1,68 @@
+from src.assistant import piper_tts
+
+
+class FakeStream:
+    def __init__(self, writes, **kwargs):
+        self.writes = writes
+        self.aborted = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write(self, block):
+        self.writes.append(len(block))
+
+    def abort(self):
+        self.aborted = True
+
+
+class FakeSoundDevice:
+    def __init__(self):
+        self.writes = []
+
+    def OutputStream(self, **kwargs):
+        return FakeStream(self.writes, **kwargs)
+
+
+def test_playback_ramps_block_size_from_20ms(monkeypatch):
+    sd = FakeSoundDevice()
+    monkeypatch.setattr(piper_tts, "_sd", sd)
+
+    piper_tts.play_stream(iter([list(range(1000))]), 1000, lambda: False)
+    assert sd.writes == [20, 40, 80, 160, 200, 200, 200, 100]
+
+
+def test_playback_stops_between_writes(monkeypatch):
+    sd = FakeSoundDevice()
+    monkeypatch.setattr(piper_tts, "_sd", sd)
+
+    piper_tts.play_stream(iter([list(range(1000))]), 1000, lambda: len(sd.writes) >= 2)
+    assert sd.writes == [20, 40]
+
+
+def test_producer_exits_after_barge_in(monkeypatch):
+    import threading
+    import time
+
+    sd = FakeSoundDevice()
+    monkeypatch.setattr(piper_tts, "_sd", sd)
+    monkeypatch.setattr(FakeStream, "write", lambda self, block: time.sleep(0.1) or self.writes.append(len(block)))
+    closed = []
+
+    def chunks():
+        try:
+            for _ in range(20):
+                yield list(range(20))
+        finally:
+            closed.append(True)
+
+    piper_tts.play_stream(chunks(), 1000, lambda: len(sd.writes) >= 1)
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and any(t.name == "PiperSynth" for t in threading.enumerate()):
+        time.sleep(0.01)
+    assert sd.writes == [20]
+    assert not any(t.name == "PiperSynth" for t in threading.enumerate())
+    assert closed == [True]
@@ -0,0 +1,62 @@
+from src.assistant import stt
+
+
+def test_polling_listener_waits_for_speech_instead_of_cutting_it(monkeypatch):
+    events = []
+    rounds = iter([True, True, False])
+    monkeypatch.setattr(stt.settings, "STT_BACKEND", "polling")
+    monkeypatch.setattr(stt.settings, "ENABLE_WAKE_WORD", False)
+    monkeypatch.setattr(stt, "tts_is_busy", lambda: True)
+    monkeypatch.setattr(stt, "tts_wait_until_idle", lambda timeout: events.append(("wait", timeout)) or True)
+    monkeypatch.setattr(stt, "listen_once", lambda **kw: events.append(("listen",)) or "open notepad")
+    monkeypatch.setattr(stt.time, "time", iter([10.0, 20.0]).__next__)
+
+    stt.continuous_listen(lambda text: events.append(("command", text)), should_continue=lambda: next(rounds))
+    assert events == [
+        ("wait", 6.0), ("listen",), ("command", "open notepad"),
+        ("wait", 6.0), ("listen",), ("command", "open notepad"),
+    ]
+
+
+def test_barge_in_only_for_recognized_commands(monkeypatch):
+    events = []
+    rounds = iter([True, True, True, False])
+    heard = iter([None, "stop music", "next song"])
+    monkeypatch.setattr(stt.settings, "STT_BACKEND", "polling")
+    monkeypatch.setattr(stt.settings, "ENABLE_WAKE_WORD", False)
+    monkeypatch.setattr(stt, "tts_is_busy", lambda: False)
+    monkeypatch.setattr(stt, "tts_barge_in", lambda: events.append("barge"))
+    monkeypatch.setattr(stt, "listen_once", lambda **kw: next(heard))
+    monkeypatch.setattr(stt.time, "time", iter([10.0, 20.0]).__next__)
+
+    def on_command(text):
+        events.append(text)
+        monkeypatch.setattr(stt.settings, "SPEECH_INTERRUPTIBLE", False)
+
+    monkeypatch.setattr(stt.settings, "SPEECH_INTERRUPTIBLE", True)
+    stt.continuous_listen(on_command, should_continue=lambda: next(rounds))
+    assert events == ["barge", "stop music", "next song"]
+
+
+def test_invalidating_devices_rebuilds_pyaudio(monkeypatch):
+    from types import SimpleNamespace
+
+    built, closed = [], []
+
+    class FakePyAudio:
+        def __init__(self):
+            built.append(self)
+
+        def terminate(self):
+            closed.append(self)
+
+    monkeypatch.setattr(stt, "_pyaudio", SimpleNamespace(PyAudio=FakePyAudio))
+    monkeypatch.setattr(stt, "_pa_instance", None)
+    monkeypatch.setattr(stt, "_sr_mic", SimpleNamespace(__exit__=lambda *a: closed.append("mic")))
+    monkeypatch.setattr(stt, "_sr_source", object())
+
+    first = stt._get_pa()
+    assert stt._get_pa() is first
+    stt.invalidate_device_cache()
+    assert closed == [first, "mic"] and stt._sr_source is None
+    assert stt._get_pa() is not first and len(built) == 2
@@ -0,0 +1,77 @@
+from src.assistant import system_health
+
+
+def test_ttl_cache_reuses_value_within_window():
+    calls = []
+    clock = [100.0]
+
+    @system_health._ttl_cache(0.5, clock=lambda: clock[0])
+    def probe():
+        calls.append(clock[0])
+        return len(calls)
+
+    assert probe() == 1
+    clock[0] += 0.2
+    assert probe() == 1
+    clock[0] += 0.5
+    assert probe() == 2
+    assert len(calls) == 2
+
+
+def test_report_action_returns_summary():
+    result = system_health.system_health_report_action({"delay": 0.01})
+    assert result["ok"]
+    assert isinstance(result["say"], str)
+    assert set(result["report"]) >= {"cpu_percent", "memory_percent", "issues"}
+
+
+def test_watch_runs_in_background_and_can_be_stopped(monkeypatch):
+    report = system_health.SystemHealthReport(10.0, 4, 20.0, 8.0, 6.0, 50.0, 100.0, 1.0, None)
+    monkeypatch.setattr(system_health, "collect_system_health", lambda **_: report)
+
+    started = system_health.system_health_watch_action({"duration": 30, "interval": 5})
+    assert started["ok"]
+    job_id = started["job_id"]
+
+    result = system_health.system_health_watch_result_action({"job_id": job_id, "stop": True})
+    assert result["ok"]
+    assert result["running"] is False
+    assert result["samples"][0]["cpu_percent"] == 10.0
+
+    missing = system_health.system_health_watch_result_action({"job_id": job_id})
+    assert not missing["ok"]
+
+
+def test_health_series_is_columnar():
+    series = system_health.HealthSeries()
+    series.append(system_health.SystemHealthReport(10.0, 4, 20.0, 8.0, 6.0, 50.0, 100.0, 1.0, None))
+    series.append(system_health.SystemHealthReport(30.0, 4, 40.0, 8.0, 4.0, 50.0, 100.0, 1.1, None, ["x"]))
+    assert len(series) == 2
+    assert series.to_dict()["cpu_percent"] == [10.0, 30.0]
+    assert series.to_dict()["battery_percent"] == [None, None]
+    assert sum(series.as_arrays()["cpu_percent"]) / 2 == 20.0
+    assert series.rows()[1]["issues"] == ["x"]
+    assert series.rows()[0]["cpu_count"] == 4
+
+
+def test_watch_announces_summary_and_expires(monkeypatch):
+    report = system_health.SystemHealthReport(10.0, 4, 20.0, 8.0, 6.0, 50.0, 100.0, 1.0, None)
+    monkeypatch.setattr(system_health, "collect_system_health", lambda **_: report)
+    monkeypatch.setattr(system_health, "_WATCH_JOBS", {})
+    said = []
+
+    started = system_health.system_health_watch_action({"duration": 5, "interval": 2}, on_done=said.append)
+    job = system_health._WATCH_JOBS[started["job_id"]]
+    job.stop.set()
+    job.thread.join(2)
+    assert said == []
+
+    job = system_health._WatchJob("old", 5.0, 2.0, on_done=said.append)
+    job.duration = 0.0
+    system_health._run_watch(job)
+    assert said == ["Captured 0 health samples over 0 seconds."]
+
+    job.finished_at -= system_health._WATCH_TTL + 1
+    system_health._WATCH_JOBS["old"] = job
+    system_health.system_health_watch_result_action({"job_id": "none"})
+    assert "old" not in system_health._WATCH_JOBS
@@ -0,0 +1,249 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.assistant import task_scheduler
+
+
+def _task(task_id, when, **kwargs):
+    return task_scheduler.ScheduledTask(
+        task_id=task_id,
+        task_type="reminder",
+        parameters={"text": task_id},
+        scheduled_time=when,
+        **kwargs,
+    )
+
+
+def test_storage_round_trip(tmp_path):
+    storage = task_scheduler.TaskStorage(tmp_path)
+    when = datetime.now() + timedelta(hours=1)
+    assert storage.save_tasks([_task("a1", when), _task("b2", when, description="café")])
+
+    loaded = {t.task_id: t for t in storage.load_tasks()}
+    assert set(loaded) == {"a1", "b2"}
+    assert loaded["b2"].description == "café"
+    assert loaded["a1"].scheduled_time == when
+
+
+def test_storage_reloads_only_after_external_writes(tmp_path):
+    storage = task_scheduler.TaskStorage(tmp_path)
+    when = datetime.now() + timedelta(hours=1)
+    assert storage.add_task(_task("a1", when))
+
+    revision = storage.revision
+    assert [t.task_id for t in storage.get_pending_tasks()] == ["a1"]
+    assert storage.remove_task("missing") is False
+    assert storage.revision == revision
+
+    other = task_scheduler.TaskStorage(tmp_path)
+    assert other.add_task(_task("b2", when))
+    assert {t.task_id for t in storage.load_tasks()} == {"a1", "b2"}
+    assert storage.revision > revision
+
+
+def test_scheduler_wakes_for_next_deadline(tmp_path):
+    import threading
+    import time
+
+    storage = task_scheduler.TaskStorage(tmp_path)
+    fired = threading.Event()
+
+    def executor(action):
+        fired.set()
+        return {"ok": True}
+
+    scheduler = task_scheduler.TaskScheduler(storage=storage, executor=executor, poll_interval=30.0)
+    storage.add_task(_task("soon", datetime.now() + timedelta(seconds=0.2)))
+    scheduler.start()
+    try:
+        assert fired.wait(3.0)
+    finally:
+        started = time.monotonic()
+        scheduler.stop()
+    assert time.monotonic() - started < 2.0
+    assert storage.load_tasks()[0].status is task_scheduler.TaskStatus.EXECUTED
+
+
+def test_parse_command_extracts_action_and_time():
+    result = task_scheduler.parse_scheduled_task_command("send good morning to mom at 7am")
+    params = result["parameters"]
+    assert params["task_type"] == "whatsapp_send_multi"
+    assert params["task_parameters"] == {"message": "good morning", "contacts": "mom"}
+    assert datetime.fromisoformat(params["parsed_time"]).hour == 7
+
+    volume = task_scheduler.parse_scheduled_task_command("set volume to 50% at 10pm")
+    assert volume["parameters"]["task_parameters"] == {"percent": 50}
+    assert task_scheduler.parse_scheduled_task_command("open notepad") is None
+
+
+def test_parse_time_expression_words_and_offsets():
+    base = datetime(2024, 5, 1, 10, 0)
+    assert task_scheduler.parse_time_expression("in 2 hours", base) == base + timedelta(hours=2)
+    assert task_scheduler.parse_time_expression("tomorrow morning", base) == datetime(2024, 5, 2, 9, 0)
+    assert task_scheduler.parse_time_expression("7:30pm", base) == datetime(2024, 5, 1, 19, 30)
+
+
+def test_time_and_day_words_prefer_longest_phrase():
+    base = datetime(2024, 5, 1, 10, 0)
+    assert task_scheduler.parse_time_expression("early morning", base) == datetime(2024, 5, 2, 6, 30)
+    assert task_scheduler.parse_time_expression("midnight", base) == datetime(2024, 5, 2, 0, 0)
+    assert task_scheduler.parse_time_expression("day after tomorrow evening", base) == datetime(2024, 5, 3, 18, 30)
+
+
+def test_high_level_api_shares_one_storage(tmp_path, monkeypatch):
+    storage = task_scheduler.TaskStorage(tmp_path)
+    monkeypatch.setattr(task_scheduler, "_storage", storage)
+    monkeypatch.setattr(task_scheduler, "_scheduler", None)
+
+    created = task_scheduler.schedule_task(
+        "reminder", {"text": "stretch"}, datetime.now() + timedelta(hours=2), "Stretch"
+    )
+    assert created["ok"]
+    assert task_scheduler._get_storage() is storage
+    assert task_scheduler.get_task_details(created["task_id"]).description == "Stretch"
+    assert task_scheduler.list_scheduled_tasks()["tasks"][0]["id"] == created["task_id"]
+
+    assert task_scheduler.cancel_scheduled_task(created["task_id"])["ok"]
+    assert task_scheduler.list_scheduled_tasks()["tasks"] == []
+
+
+def test_reschedule_keeps_epoch_in_sync():
+    task = _task("r1", datetime.now() - timedelta(minutes=1))
+    assert task.is_due
+    task.reschedule(datetime.now() + timedelta(hours=1))
+    assert not task.is_due
+    assert task.time_until > timedelta(minutes=59)
+    assert not hasattr(task, "__dict__")
+
+
+def test_legacy_json_is_imported_and_due_query_uses_index(tmp_path):
+    import json
+
+    past = _task("old", datetime.now() - timedelta(minutes=5))
+    future = _task("new", datetime.now() + timedelta(hours=1))
+    (tmp_path / task_scheduler.TASKS_FILE).write_text(
+        json.dumps([past.to_dict(), future.to_dict()]), encoding="utf-8"
+    )
+
+    storage = task_scheduler.TaskStorage(tmp_path)
+    assert storage.db_path.exists()
+    assert [t.task_id for t in storage.get_due_tasks()] == ["old"]
+    assert [t.task_id for t in storage.get_pending_tasks()] == ["old", "new"]
+
+
+def test_execute_action_reuses_parsed_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(task_scheduler, "_storage", task_scheduler.TaskStorage(tmp_path))
+    monkeypatch.setattr(task_scheduler, "_scheduler", None)
+    action = task_scheduler.parse_scheduled_task_command("remind me to drink water at 9pm")
+    monkeypatch.setattr(
+        task_scheduler, "parse_time_expression", lambda *a, **k: pytest.fail("re-parsed")
+    )
+
+    result = task_scheduler.execute_scheduler_action(action)
+    assert result["ok"]
+    assert result["scheduled_time"] == action["parameters"]["parsed_time"]
+
+
+def test_scheduler_picks_up_new_task_without_polling(tmp_path):
+    import threading
+
+    storage = task_scheduler.TaskStorage(tmp_path)
+    fired = threading.Event()
+    scheduler = task_scheduler.TaskScheduler(
+        storage=storage, executor=lambda action: fired.set() or {"ok": True}, poll_interval=30.0
+    )
+    scheduler.start()
+    try:
+        storage.add_task(_task("late", datetime.now()))
+        scheduler.notify()
+        assert fired.wait(3.0)
+    finally:
+        scheduler.stop()
+
+
+def test_get_task_and_missing_ids(tmp_path):
+    storage = task_scheduler.TaskStorage(tmp_path)
+    task = _task("a1", datetime.now() + timedelta(hours=1))
+    storage.add_task(task)
+    assert storage.get_task("a1") is task
+    assert storage.get_task("zz") is None
+    assert storage.update_task(_task("zz", datetime.now())) is False
+    assert storage.remove_task("a1") and storage.get_task("a1") is None
+
+
+def test_from_dict_seeds_epoch_without_recomputing():
+    when = datetime.now() + timedelta(hours=3)
+    data = _task("e1", when).to_dict()
+    assert data["scheduled_ts"] == when.timestamp()
+
+    data["scheduled_ts"] = 123.0
+    assert task_scheduler.ScheduledTask.from_dict(data)._scheduled_ts == 123.0
+    del data["scheduled_ts"]
+    assert task_scheduler.ScheduledTask.from_dict(data)._scheduled_ts == when.timestamp()
+
+
+def test_schedule_trigger_requires_whole_keywords():
+    trigger = task_scheduler._SCHEDULE_TRIGGER_RE
+    assert trigger.search("send hi at 7pm")
+    assert trigger.search("remind me in 5 minutes")
+    assert trigger.search("call mom 6 a.m.")
+    assert not trigger.search("chat with bob about the plan")
+
+
+def test_due_checks_accept_a_shared_clock(tmp_path):
+    storage = task_scheduler.TaskStorage(tmp_path)
+    task = _task("c1", datetime.now() + timedelta(minutes=10))
+    storage.add_task(task)
+    later = task._scheduled_ts + 1
+    assert task.is_due_at(later) and not task.is_due
+    assert storage.get_due_tasks() == []
+    assert storage.get_due_tasks(now=later) == [task]
+
+    now = datetime(2024, 5, 1, 10, 0)
+    assert task_scheduler.format_time_friendly(datetime(2024, 5, 2, 9, 0), now) == "tomorrow at 09:00 AM"
+
+
+def test_command_parse_is_memoized_but_returns_fresh_dicts():
+    task_scheduler._parse_command_spec.cache_clear()
+    first = task_scheduler.parse_scheduled_task_command("Remind me to stretch in 10 minutes")
+    first["parameters"]["task_parameters"]["text"] = "mutated"
+    second = task_scheduler.parse_scheduled_task_command("remind me to stretch in 10 minutes")
+
+    assert second["parameters"]["task_parameters"] == {"text": "stretch"}
+    assert task_scheduler._parse_command_spec.cache_info().hits == 1
+    expected = datetime.now() + timedelta(minutes=10)
+    assert abs(datetime.fromisoformat(second["parameters"]["parsed_time"]) - expected) < timedelta(seconds=5)
+
+
+def test_due_tasks_are_persisted_in_one_batch(tmp_path, monkeypatch):
+    storage = task_scheduler.TaskStorage(tmp_path)
+    past = datetime.now() - timedelta(seconds=1)
+    for task_id in ("t1", "t2", "t3"):
+        storage.add_task(_task(task_id, past))
+
+    monkeypatch.setattr(storage, "update_task", lambda task: pytest.fail("per-task write"))
+    scheduler = task_scheduler.TaskScheduler(
+        storage=storage, executor=lambda action: {"ok": action["parameters"]["text"] != "t2"}
+    )
+    scheduler._process_due_tasks()
+
+    fresh = {t.task_id: t for t in task_scheduler.TaskStorage(tmp_path).load_tasks()}
+    assert fresh["t1"].status is task_scheduler.TaskStatus.EXECUTED
+    assert fresh["t2"].status is task_scheduler.TaskStatus.PENDING
+    assert fresh["t2"].execution_count == 1
+    assert scheduler._next_timeout() == scheduler.poll_interval
+
+
+def test_cold_datetime_fields_parse_on_access():
+    data = _task("l1", datetime.now() + timedelta(hours=1)).to_dict()
+    data["created_at"] = "2024-01-02T03:04:05"
+    data["last_executed"] = "2024-01-03T04:05:06"
+
+    task = task_scheduler.ScheduledTask.from_dict(data)
+    assert isinstance(task._created_at, str)
+    assert task.to_dict()["last_executed"] == "2024-01-03T04:05:06"
+    assert task.created_at == datetime(2024, 1, 2, 3, 4, 5)
+    assert task.last_executed == datetime(2024, 1, 3, 4, 5, 6)
+    task.last_executed = None
+    assert task.to_dict()["last_executed"] is None
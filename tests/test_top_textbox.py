@@ -0,0 +1,161 @@
+import threading
+
+from src.assistant.top_textbox import TopTextboxApp
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, fn):
+        self.scheduled.append((ms, fn))
+
+    def run_pending(self):
+        pending, self.scheduled = self.scheduled, []
+        for _, fn in pending:
+            fn()
+
+
+class FakeVar:
+    def __init__(self):
+        self.values = []
+
+    def set(self, value):
+        self.values.append(value)
+
+
+def _app():
+    app = TopTextboxApp.__new__(TopTextboxApp)
+    app.root = FakeRoot()
+    app.display_var = FakeVar()
+    app._pending_display = None
+    app._pending_scheduled = False
+    app._last_display = ""
+    app._cmd_pool = TopTextboxApp._new_cmd_pool()
+    app.on_command = None
+    return app
+
+
+def test_display_updates_are_coalesced():
+    app = _app()
+    for i in range(5):
+        app._queue_display(f"partial {i}")
+    app.show_assistant("done")
+
+    assert [ms for ms, _ in app.root.scheduled] == [16]
+    app.root.run_pending()
+    assert app.display_var.values == ["Assistant: done"]
+
+    app._queue_display("(listening…)")
+    app.root.run_pending()
+    assert app.display_var.values[-1] == "(listening…)"
+
+
+def test_mic_toggle_reuses_one_stt_worker():
+    import threading
+
+    calls = []
+    exits = threading.Event()
+
+    class FakeSTT:
+        def continuous_listen(self, on_command, on_wake, should_continue):
+            calls.append(threading.current_thread())
+            on_command("hello")
+            while should_continue():
+                threading.Event().wait(0.01)
+            exits.set()
+
+    class FakeButton:
+        def configure(self, **kwargs):
+            pass
+
+    app = _app()
+    app.mic_btn = FakeButton()
+    app.on_command = lambda text: None
+    app._stt = FakeSTT()
+    app._stt_event = threading.Event()
+    app._closing = False
+    app._stt_thread = threading.Thread(target=app._stt_loop, daemon=True)
+    app._stt_thread.start()
+
+    for _ in range(2):
+        app._toggle_mic()
+        assert app._stt_running
+        for _ in range(200):
+            if app._pending_display:
+                break
+            threading.Event().wait(0.01)
+        app._toggle_mic()
+        assert not app._stt_running
+        assert exits.wait(2)
+        exits.clear()
+        app.root.run_pending()
+
+    app._closing = True
+    app._stt_event.set()
+    app._stt_thread.join(2)
+    assert not app._stt_thread.is_alive()
+    assert len(set(calls)) == 1
+    assert app.display_var.values[-1] == "You (voice): hello"
+
+
+def test_unchanged_display_text_is_not_rewritten():
+    app = _app()
+    for text in ("You (voice): hi", "You (voice): hi", "Assistant: ok", "Assistant: ok"):
+        app._queue_display(text)
+        app.root.run_pending()
+    assert app.display_var.values == ["You (voice): hi", "Assistant: ok"]
+
+
+def test_typed_commands_run_off_the_calling_thread():
+    app = _app()
+    app.entry_var = type("Var", (), {"get": lambda self: " open notepad ", "set": lambda self, v: None})()
+    ran = []
+    done = threading.Event()
+    app.on_command = lambda text: ran.append((text, threading.current_thread().name)) or done.set()
+
+    app._on_enter()
+    assert done.wait(2)
+    assert ran[0][0] == "open notepad"
+    assert ran[0][1] != threading.current_thread().name
+    app._cmd_pool.shutdown()
+
+
+def test_commands_run_in_submission_order():
+    app = _app()
+    gate = threading.Event()
+    ran = []
+    done = threading.Event()
+
+    def on_command(text):
+        if text == "first":
+            gate.wait(2)
+        ran.append(text)
+        if len(ran) == 2:
+            done.set()
+
+    app.on_command = on_command
+    app._dispatch_command("first")
+    app._dispatch_command("second")
+    gate.set()
+    assert done.wait(2)
+    assert ran == ["first", "second"]
+
+
+def test_barge_in_honours_setting_and_skips_voice_commands(monkeypatch):
+    from src.assistant import tts
+    from src.assistant.config import settings
+
+    barges = []
+    monkeypatch.setattr(tts, "barge_in", lambda: barges.append(True))
+    app = _app()
+    app.on_command = lambda text: None
+
+    monkeypatch.setattr(settings, "SPEECH_INTERRUPTIBLE", True)
+    app._run_command("typed")
+    app._run_command("spoken", barge=False)
+    assert barges == [True]
+
+    monkeypatch.setattr(settings, "SPEECH_INTERRUPTIBLE", False)
+    app._run_command("typed again")
+    assert barges == [True]
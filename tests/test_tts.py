@@ -0,0 +1,274 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.assistant import tts
+
+
+class FakeEngine:
+    def __init__(self):
+        self.props = {
+            "voices": [
+                SimpleNamespace(id="voice-zira", name="Microsoft Zira Desktop", languages=["en-US"]),
+                SimpleNamespace(id="voice-hemant", name="Microsoft Hemant", languages=["hi-IN"]),
+            ],
+            "rate": 200,
+            "volume": 1.0,
+        }
+        self.spoken = []
+        self.threads = set()
+        self.stopped = 0
+
+    def getProperty(self, name):
+        self.threads.add(threading.current_thread().name)
+        return self.props.get(name)
+
+    def setProperty(self, name, value):
+        self.threads.add(threading.current_thread().name)
+        self.props[name] = value
+
+    def say(self, text):
+        self.threads.add(threading.current_thread().name)
+        self.spoken.append(text)
+
+    def runAndWait(self):
+        pass
+
+    def stop(self):
+        self.stopped += 1
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    fake = FakeEngine()
+    monkeypatch.setattr(tts.pyttsx3, "init", lambda *a, **k: fake)
+    monkeypatch.setattr(tts, "_engine", None)
+    monkeypatch.setattr(tts, "_inited", False)
+    yield fake
+    tts._call(lambda: None)
+
+
+def test_speak_runs_on_single_worker(engine):
+    tts.speak("hello")
+    fut = tts.speak_async("world")
+    fut.result(timeout=2)
+
+    assert engine.spoken == ["hello", "world"]
+    assert engine.threads == {"TTSWorker"}
+    assert not tts.is_busy()
+
+
+def test_set_voice_and_properties(engine):
+    assert tts.set_voice("hemant")
+    assert engine.props["voice"] == "voice-hemant"
+    assert tts.get_current_voice() == "voice-hemant"
+    assert not tts.set_voice("nonexistent")
+    assert tts.set_rate(150) and engine.props["rate"] == 150
+    assert tts.set_volume_percent(50) and engine.props["volume"] == 0.5
+
+
+def test_speak_feeds_engine_sentence_by_sentence(engine):
+    tts.speak("First one. Second one! Third?  trailing words")
+    assert engine.spoken == ["First one.", "Second one!", "Third?", "trailing words"]
+    assert tts._split_sentences("Volume is 3.5 now. Done.") == ["Volume is 3.5 now.", "Done."]
+
+
+def test_stop_cuts_remaining_sentences(engine):
+    original = engine.runAndWait
+    engine.runAndWait = lambda: tts.stop() if engine.spoken == ["One."] else original()
+    tts.speak("One. Two. Three.")
+    assert engine.spoken == ["One."]
+    assert engine.stopped == 1
+
+
+def test_voice_list_is_enumerated_once(engine):
+    calls = []
+    original = engine.getProperty
+    engine.getProperty = lambda name: calls.append(name) or original(name)
+
+    assert [v["name"] for v in tts.list_voices()][0] == "Microsoft Zira Desktop"
+    assert tts.set_voice("hi-in")
+    assert tts.set_voice("zira")
+    assert calls.count("voices") == 1
+
+
+def test_interrupt_is_a_no_op_when_idle(engine):
+    tts.speak("warm up")
+    assert tts.interrupt() is False
+    assert engine.stopped == 0
+
+    engine.runAndWait = lambda: tts.interrupt()
+    tts.speak("Cut. Me. Off.")
+    assert engine.stopped == 1
+    assert engine.spoken == ["warm up", "Cut."]
+
+
+def test_engine_init_failure_is_reported(monkeypatch):
+    def boom(*args, **kwargs):
+        raise RuntimeError("no driver")
+
+    monkeypatch.setattr(tts.pyttsx3, "init", boom)
+    monkeypatch.setattr(tts, "_engine", None)
+    monkeypatch.setattr(tts, "_inited", False)
+    assert tts.set_voice("zira") is False
+    assert tts.list_voices() == []
+
+
+def test_profiles_resolve_through_alias_table(engine):
+    assert tts.set_profile(" Hindi ")
+    assert engine.props["voice"] == "voice-hemant"
+    assert engine.props["rate"] == 150
+    assert tts.set_profile("fast") and engine.props["rate"] == 200
+    assert tts.set_profile("whisper") is False
+
+
+def test_piper_backend_streams_when_available(engine, monkeypatch):
+    from src.assistant import piper_tts
+
+    played = []
+    fake_piper = SimpleNamespace(sample_rate=22050, synthesize_stream=lambda text: iter([text]))
+    monkeypatch.setattr(tts, "_piper_checked", True)
+    monkeypatch.setattr(tts, "_piper", fake_piper)
+    monkeypatch.setattr(
+        piper_tts, "play_stream", lambda chunks, rate, should_stop: played.append((list(chunks), rate))
+    )
+    tts.speak("Hello there. Bye.")
+    assert played == [(["Hello there. Bye."], 22050)]
+    assert engine.spoken == []
+
+    monkeypatch.setattr(tts, "_piper", None)
+    tts.speak("Fallback.")
+    assert engine.spoken == ["Fallback."]
+    assert piper_tts.load_piper("missing/voice.onnx") is None
+
+
+def test_prebuffered_playback_overlaps_synthesis(engine, monkeypatch):
+    import wave
+
+    events = []
+
+    def save_to_file(text, path):
+        events.append(("synth", text))
+        with wave.open(path, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(8000)
+            wf.writeframes(b"\0\0" * 80)
+
+    class FakePlayer:
+        def play_buffer(self, frames, channels, width, rate):
+            events.append(("play", len(frames), rate))
+            return SimpleNamespace(stop=lambda: events.append(("stop",)))
+
+    engine.save_to_file = save_to_file
+    monkeypatch.setattr(tts, "_simpleaudio", FakePlayer())
+    monkeypatch.setattr(tts, "_playback", None)
+
+    tts.speak("One. Two.")
+    assert events == [
+        ("synth", "One."), ("play", 160, 8000), ("synth", "Two."), ("play", 160, 8000),
+    ]
+    assert engine.spoken == []
+
+
+def test_process_worker_serves_requests_over_a_pipe(engine, monkeypatch):
+    import multiprocessing
+
+    from src.assistant import tts_proc
+
+    monkeypatch.setattr(tts, "_child", False)
+    parent, child = multiprocessing.Pipe()
+    server = threading.Thread(target=tts_proc.main, args=(child,))
+    server.start()
+
+    parent.send((1, "say", "Hello. Again."))
+    parent.send((2, "voice", "hemant"))
+    parent.send((3, "bogus", None))
+    replies = {}
+    for _ in range(3):
+        rid, ok, value = parent.recv()
+        replies[rid] = (ok, value)
+    parent.send(None)
+    server.join(2)
+
+    assert replies[1] == (True, None)
+    assert replies[2] == (True, (True, "voice-hemant"))
+    assert replies[3][0] is False
+    assert engine.spoken == ["Hello.", "Again."]
+
+
+def test_persona_chunks_use_cumulative_interjection_table(engine, monkeypatch):
+    monkeypatch.setattr(tts.settings, "TTS_INTERJECTIONS", True)
+    monkeypatch.setitem(tts._INTERJ_TABLE, "friendly", (("umm", None), (0.5, 1.0)))
+    monkeypatch.setattr(tts, "_active_persona", "friendly")
+    picks = iter([["umm"], [None], [None]])
+    monkeypatch.setattr(tts.random, "choices", lambda options, cum_weights: next(picks))
+
+    tts.speak("Well, it costs 3.5 dollars. Okay")
+    assert engine.spoken == ["umm, Well,", "it costs 3.5 dollars.", "Okay"]
+
+    options, cum = tts._INTERJ_TABLE["thoughtful"]
+    assert options[-1] is None and cum[-1] == 1.0
+    assert abs(cum[-2] - tts._PERSONA["thoughtful"]["interj_freq"]) < 1e-9
+
+
+def test_wait_until_idle_blocks_instead_of_polling(engine):
+    import time
+
+    gate = threading.Event()
+    engine.runAndWait = lambda: gate.wait(2)
+    tts.speak_async("Slow one.")
+    time.sleep(0.05)
+    assert tts.is_busy()
+    assert tts.wait_until_idle(timeout=0.05) is False
+
+    gate.set()
+    assert tts.wait_until_idle(timeout=2) is True
+    assert not tts.is_busy()
+
+
+def test_preload_runs_init_on_the_worker(engine):
+    fut = tts.preload()
+    fut.result(timeout=2)
+    assert tts._inited
+    assert engine.threads == {"TTSWorker"}
+    assert tts.preload() is None
+
+
+def test_barge_in_drops_speech_queued_before_it(engine):
+    import time
+
+    gate = threading.Event()
+    engine.runAndWait = lambda: gate.wait(2)
+    first = tts.speak_async("Old reply. More of it.")
+    stale = tts.speak_async("Stale follow up.")
+    time.sleep(0.05)
+
+    tts.barge_in()
+    gate.set()
+    tts.speak("New reply.")
+
+    assert first.done() and stale.done()
+    assert engine.spoken == ["Old reply.", "New reply."]
+    assert engine.stopped == 1
+
+
+def test_unchanged_rate_volume_and_voice_skip_engine_writes(engine):
+    writes = []
+    original = engine.setProperty
+    engine.setProperty = lambda name, value: writes.append(name) or original(name, value)
+
+    assert tts.set_profile("english")
+    first = list(writes)
+    assert "rate" in first and "volume" in first
+    assert tts.set_profile("english")
+    assert tts.set_volume_percent(95)
+    assert writes == first
+
+
+def test_prebuffering_needs_its_own_output_stream(engine, monkeypatch):
+    engine.save_to_file = lambda text, path: pytest.fail("prebuffered without simpleaudio")
+    monkeypatch.setattr(tts, "_simpleaudio", None)
+    tts.speak("Plain path.")
+    assert engine.spoken == ["Plain path."]
@@ -0,0 +1,499 @@
+import threading
+
+import numpy as np
+
+from src.assistant import ui
+
+
+def _rows(height, width=8):
+    """Image whose first pixel on each row is that row's screen y."""
+    return np.repeat(np.arange(height, dtype=np.int32)[:, None], width, axis=1)
+
+
+def _fake_ocr(words, threads=None):
+    """Stand-in for image_to_data: report the (x, y, text) words inside each band."""
+    def ocr(band):
+        if threads is not None:
+            threads.add(threading.current_thread().name)
+        out = {k: [] for k in ui._OCR_DATA_KEYS}
+        offset = int(band[0, 0])
+        for x, y, text in words:
+            if offset <= y and y + 20 <= offset + band.shape[0]:
+                out["text"].append(text)
+                out["conf"].append("90")
+                out["left"].append(x)
+                out["top"].append(y - offset)
+                out["width"].append(100)
+                out["height"].append(20)
+                out["block_num"].append(1)
+                out["par_num"].append(1)
+                out["line_num"].append(1)
+        return out
+    return ocr
+
+
+def test_banded_ocr_keeps_each_word_once_in_screen_coordinates(monkeypatch):
+    monkeypatch.setattr(ui, "_OCR_MAX_BANDS", 4)
+    words = [(100, 10, "top"), (100, 295, "straddles"), (100, 610, "middle"), (100, 1180, "bottom")]
+    threads = set()
+    data = ui._ocr_in_bands(_rows(1200), _fake_ocr(words, threads))
+
+    assert ui._ocr_band_spans(1200) == [(0, 300), (300, 600), (600, 900), (900, 1200)]
+    assert sorted(zip(data["top"], data["text"])) == [
+        (10, "top"), (295, "straddles"), (610, "middle"), (1180, "bottom"),
+    ]
+    assert len(set(data["block_num"])) == 4
+    assert isinstance(data["top"], np.ndarray) and data["conf"].dtype == float
+    assert ui._group_ocr_lines(data)["text"] == ["top", "straddles", "middle", "bottom"]
+    assert threading.current_thread().name not in threads
+
+
+def test_short_images_are_ocrd_in_one_call():
+    calls = []
+    img = _rows(250)
+    ui._ocr_in_bands(img, lambda band: calls.append(band) or {"text": []})
+    assert len(calls) == 1 and calls[0] is img
+
+
+def test_screen_signature_tracks_pixel_changes():
+    first = np.full((1080, 1920, 3), 255, dtype=np.uint8)
+    same = first.copy()
+    changed = first.copy()
+    changed[300:360, 200:900] = 0
+
+    assert ui._screen_signature(first) == ui._screen_signature(same)
+    assert ui._screen_signature(first) != ui._screen_signature(changed)
+
+    ui._OCR_CACHE.update(hash=ui._screen_signature(first), data={"text": []}, ts=0.0)
+    ui._invalidate_ocr_cache()
+    assert ui._OCR_CACHE["hash"] is None
+
+
+def _data(words):
+    """image_to_data-shaped dict from (text, conf, x, y, w, h, line) tuples."""
+    keys = ("text", "conf", "left", "top", "width", "height", "line_num")
+    out = {k: [w[i] for w in words] for i, k in enumerate(keys)}
+    out["block_num"] = [1] * len(words)
+    out["par_num"] = [1] * len(words)
+    return out
+
+
+SERP_WORDS = [
+    ("Images", "95", 220, 150, 70, 20, 1), ("All", "96", 160, 150, 30, 20, 1),
+    ("About", "91", 160, 200, 60, 16, 2), ("1,000", "90", 230, 200, 60, 16, 2), ("results", "92", 300, 200, 80, 16, 2),
+    ("Python", "93", 180, 400, 90, 24, 3), ("Tutorial:", "94", 280, 400, 120, 24, 3),
+    ("Learn", "95", 410, 400, 80, 24, 3), ("basics", "93", 500, 400, 90, 24, 3), ("", "-1", 0, 0, 0, 0, 3),
+    ("noisy", "12", 180, 700, 300, 24, 4),
+    ("Real", "95", 180, 520, 80, 22, 5), ("Python", "95", 270, 520, 90, 22, 5), ("Guide", "95", 370, 520, 100, 22, 5),
+]
+
+
+def test_ocr_lines_are_grouped_left_to_right():
+    lines = ui._group_ocr_lines(_data(SERP_WORDS))
+    assert lines["text"] == ["All Images", "About 1,000 results", "Python Tutorial: Learn basics", "Real Python Guide"]
+    assert lines["left"].tolist() == [160, 160, 180, 180]
+    assert lines["right"].tolist()[2] == 590
+    assert lines["count"].tolist() == [2, 3, 4, 3]
+
+
+def test_result_title_centers_from_ocr_data():
+    centers = ui._ocr_centers_from_data(_data(SERP_WORDS), 0, 3, None)
+    assert centers == [(385, 412), (325, 531)]
+    assert ui._ocr_centers_from_data(_data(SERP_WORDS), 0, 3, [(300, 390, 500, 430)]) == [(325, 531)]
+    assert ui._ocr_centers_from_data({"text": []}, 0, 3, None) == []
+
+
+def test_hyperlinks_come_from_one_findall():
+    from types import SimpleNamespace as NS
+
+    def el(name, rect):
+        return NS(CurrentName=name, CurrentBoundingRectangle=NS(left=rect[0], top=rect[1], right=rect[2], bottom=rect[3]))
+
+    elements = [el(" Python Tutorial ", (180, 400, 600, 424)), el(None, (180, 520, 470, 542))]
+    calls = []
+    found = NS(Length=len(elements), GetElement=elements.__getitem__)
+    uia = NS(CreatePropertyCondition=lambda prop, value: (prop, value))
+    auto = NS(
+        _AutomationClient=NS(instance=lambda: NS(IUIAutomation=uia)),
+        PropertyId=NS(ControlTypeProperty=30003),
+        ControlType=NS(HyperlinkControl=50005),
+        TreeScope=NS(Descendants=4),
+        HyperlinkControl=lambda **kw: calls.append(kw),
+    )
+    win = NS(Element=NS(FindAll=lambda scope, cond: calls.append((scope, cond)) or found))
+
+    assert ui._hyperlink_rects(auto, win) == [
+        ("Python Tutorial", (180, 400, 600, 424)), ("", (180, 520, 470, 542)),
+    ]
+    assert calls == [(4, (30003, 50005))]
+    assert ui._hyperlink_rects(auto, win, limit=1) == [("Python Tutorial", (180, 400, 600, 424))]
+
+
+def test_helpers_bail_out_without_gui_backends(monkeypatch):
+    monkeypatch.setattr(ui, "_AUTO", None)
+    monkeypatch.setattr(ui, "_PG", None)
+    monkeypatch.setattr(ui, "_PYT", None)
+    assert ui._enumerate_hyperlink_candidates() == []
+    assert ui._get_exclusion_rects() == []
+    assert ui._focus_first_result_via_tab() is False
+    assert ui._ocr_first_result_centers() == []
+    assert ui._open_quick_settings() is False
+
+
+def test_adaptive_wait_backs_off_and_honours_timeout(monkeypatch):
+    clock = [0.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(round(seconds, 4))
+        clock[0] += seconds
+
+    monkeypatch.setattr(ui.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(ui.time, "sleep", fake_sleep)
+
+    calls = iter([False, False, True])
+    assert ui._adaptive_wait(lambda: next(calls), timeout=1.0, initial=0.01, factor=2, cap=0.25)
+    assert sleeps == [0.01, 0.02]
+
+    sleeps.clear()
+    assert not ui._adaptive_wait(lambda: False, timeout=0.5, initial=0.1, factor=2, cap=0.25)
+    assert sleeps == [0.1, 0.2, 0.2]
+
+
+def test_banned_tokens_match_whole_words_only():
+    assert ui._BANNED_RE.search("Sponsored · Buy Python books")
+    assert ui._BANNED_RE.search("People Also Ask about Python")
+    assert not ui._BANNED_RE.search("Reading Python source code")
+
+    words = [("Reading", "95", 180, 400, 110, 24, 1), ("Python", "95", 300, 400, 100, 24, 1), ("source", "95", 410, 400, 100, 24, 1)]
+    assert ui._ocr_centers_from_data(_data(words), 0, 3, None) == [(345, 412)]
+
+
+def test_exclusion_grid_matches_exact_rect_test():
+    rects = [(100, 90, 700, 140), (-300, -20, -10, 40), (40, 10, 250, 80)]
+    rng = np.random.default_rng(0)
+    xs = rng.integers(-400, 900, 500)
+    ys = rng.integers(-50, 300, 500)
+    expected = [any(ui._rect_contains_point(r, int(x), int(y)) for r in rects) for x, y in zip(xs, ys)]
+
+    assert ui._excluded_points(rects, xs, ys).tolist() == expected
+    assert ui._build_exclusion_mask(rects).shape == (140 // 32 + 1, 700 // 32 + 1)
+    assert ui._excluded_points([], xs, ys).sum() == 0
+
+
+def test_ocr_buffers_are_reused_per_thread(monkeypatch):
+    from types import SimpleNamespace
+
+    created = []
+    monkeypatch.setattr(ui, "_CV", SimpleNamespace(createCLAHE=lambda **kw: created.append(kw) or object()))
+    monkeypatch.setattr(ui, "_ocr_local", threading.local())
+
+    first = ui._ocr_buffers(1620, 2880)
+    assert ui._ocr_buffers(1620, 2880) is first
+    assert ui._ocr_buffers(1620, 2880, (12, 12))["clahe"] is not first["clahe"]
+    first = ui._ocr_buffers(1620, 2880)
+    assert first["th"].shape == (1620, 2880) and first["scaled"].shape == (1620, 2880, 3)
+    resized = ui._ocr_buffers(1350, 2400)
+    assert resized is not first and resized["clahe"] is first["clahe"]
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(ui._ocr_buffers(1350, 2400)))
+    worker.start(); worker.join()
+    assert other[0] is not resized
+    assert [kw["tileGridSize"] for kw in created] == [(8, 8), (12, 12), (8, 8), (8, 8)]
+
+
+def test_result_discovery_runs_sources_concurrently(monkeypatch):
+    barrier = threading.Barrier(3, timeout=2)
+
+    def source(value):
+        def run(*args, **kwargs):
+            barrier.wait()
+            return value
+        return run
+
+    monkeypatch.setattr(ui, "_get_exclusion_rects", source([(0, 0, 10, 10)]))
+    monkeypatch.setattr(ui, "_enumerate_hyperlink_candidates", source([(300, 400, "Python Tutorial")]))
+    monkeypatch.setattr(ui, "_ocr_screen_data", source({"text": []}))
+
+    rects, links, data = ui._discover_result_targets(0)
+    assert rects == [(0, 0, 10, 10)]
+    assert links == [(300, 400, "Python Tutorial")]
+    assert data == {"text": []}
+
+    monkeypatch.setattr(ui, "_ocr_screen_data", lambda min_y: 1 / 0)
+    monkeypatch.setattr(ui, "_get_exclusion_rects", lambda: [])
+    monkeypatch.setattr(ui, "_enumerate_hyperlink_candidates", lambda **kw: [])
+    assert ui._discover_result_targets(0) == ([], [], None)
+
+
+def test_ocr_crops_below_min_y_and_maps_boxes_back(monkeypatch):
+    assert ui._ocr_scale(3840) == 1600 / 3840
+    assert ui._ocr_scale(1440) == 1.0
+    assert ui._ocr_scale(1024) == 1.5
+
+    seen = []
+
+    boxes = {"text": ["Title"], "conf": ["95"], "left": [400], "top": [50], "width": [200], "height": [10],
+             "block_num": [1], "par_num": [1], "line_num": [1]}
+
+    def image_to_data(band, output_type=None, config=None):
+        seen.append(band.shape)
+        return boxes
+
+    fake_tesseract = type("T", (), {"image_to_data": staticmethod(image_to_data), "Output": type("O", (), {"DICT": "dict"})})
+    monkeypatch.setattr(ui, "_CV", None)
+    monkeypatch.setattr(ui, "_OCR_MAX_BANDS", 1)
+    monkeypatch.setattr(ui, "_ocr_scale", lambda width: 0.5)
+    ui._ocr_config.cache_clear()
+    data = ui._ocr_screenshot_data(np.zeros((1800, 3840, 3), np.uint8), fake_tesseract, y_offset=360)
+    ui._ocr_config.cache_clear()
+
+    assert seen == [(1800, 3840, 3)]  # without OpenCV the frame goes through unscaled
+    assert (data["left"].tolist(), data["top"].tolist()) == ([400], [410])
+
+    scaled = ui._rescale_ocr_boxes({k: np.array(v) for k, v in boxes.items() if k != "text"}, 0.5, 360)
+    assert (scaled["left"].tolist(), scaled["top"].tolist(), scaled["width"].tolist()) == ([800], [460], [400])
+
+
+def test_fast_click_batches_move_and_click(monkeypatch):
+    assert ui._abs_mouse_coords(0, 0, 0, 0, 1920, 1080) == (0, 0)
+    assert ui._abs_mouse_coords(1919, 1079, 0, 0, 1920, 1080) == (65535, 65535)
+    assert ui._abs_mouse_coords(0, 0, -1920, 0, 3840, 1080) == (32776, 0)
+
+    sent = []
+
+    def send_inputs(inputs):
+        sent.append([(i.type, i.mi.dx, i.mi.dy, i.mi.dwFlags) if i.type == 0 else (i.type, i.ki.wVk, i.ki.dwFlags)
+                     for i in inputs])
+        return len(inputs)
+
+    metrics = {76: 0, 77: 0, 78: 1920, 79: 1080}
+    monkeypatch.setattr(ui, "system_metric", metrics.get)
+    monkeypatch.setattr(ui, "send_inputs", send_inputs)
+
+    assert ui._fast_click(1919, 0)
+    assert sent == [[(0, 65535, 0, 0x8001 | 0x4000), (0, 0, 0, 0x2), (0, 0, 0, 0x4)]]
+
+    sent.clear()
+    ui._press_tab(2, shift=True)
+    assert sent == [[(1, 0x10, 0), (1, 9, 0), (1, 9, 2), (1, 9, 0), (1, 9, 2), (1, 0x10, 2)]]
+
+    monkeypatch.setattr(ui, "send_inputs", lambda inputs: 0)
+    assert ui._fast_click(10, 10) is False
+
+
+def test_foreground_title_uses_win32_with_short_cache(monkeypatch):
+    from types import SimpleNamespace
+
+    clock = [100.0]
+    titles = {11: "Google Search", 22: "Python Tutorial"}
+    state = {"hwnd": 11, "reads": 0}
+
+    def get_window_text(hwnd, buf, size):
+        state["reads"] += 1
+        buf.value = titles[hwnd]
+        return len(buf.value)
+
+    user32 = SimpleNamespace(GetForegroundWindow=lambda: state["hwnd"], GetWindowTextW=get_window_text)
+    monkeypatch.setattr(ui.ctypes, "windll", SimpleNamespace(user32=user32), raising=False)
+    monkeypatch.setattr(ui.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(ui, "_TITLE_CACHE", (0.0, 0, ""))
+    monkeypatch.setattr(ui, "_AUTO", None)
+
+    assert ui._get_foreground_title() == "Google Search"
+    assert ui._get_foreground_title() == "Google Search"
+    assert state["reads"] == 1
+    state["hwnd"] = 22
+    assert ui._get_foreground_title() == "Python Tutorial"
+    titles[22] = "Python Tutorial - Renamed"
+    clock[0] += 0.1
+    assert ui._get_foreground_title() == "Python Tutorial - Renamed"
+    assert state["reads"] == 3
+
+
+def test_tab_focus_bursts_through_header_then_steps(monkeypatch):
+    from types import SimpleNamespace
+
+    def ctrl(i, y, kind="Button"):
+        rect = SimpleNamespace(left=200, top=y - 10, right=600, bottom=y + 10)
+        return SimpleNamespace(Name=f"Control number {i}", ControlTypeName=kind + "Control",
+                               BoundingRectangle=rect, GetRuntimeId=lambda: [i])
+
+    order = [ctrl(i, 40 + 20 * i) for i in range(6)]  # header, above min_y=200
+    order += [ctrl(6, 300, "Text"), ctrl(7, 340, "Hyperlink"), ctrl(8, 380, "Hyperlink"), ctrl(9, 420, "Hyperlink")]
+    pos = [0]
+    tabs = []
+
+    def press_tab(count=1, shift=False):
+        tabs.append(-count if shift else count)
+        pos[0] += -count if shift else count
+
+    keys = []
+    monkeypatch.setattr(ui, "_AUTO", SimpleNamespace(GetFocusedControl=lambda: order[pos[0]]))
+    monkeypatch.setattr(ui, "_PG", SimpleNamespace(hotkey=lambda *k: None, moveTo=lambda *a, **k: None, press=keys.append))
+    monkeypatch.setattr(ui, "_press_tab", press_tab)
+    monkeypatch.setattr(ui.time, "sleep", lambda s: None)
+
+    assert ui._focus_first_result_via_tab(min_y=200, batch=4)
+    assert pos[0] == 7 and keys == ["enter"]
+    assert tabs == [4, 4, -4, 1, 1, 1]
+
+
+def test_ocr_config_is_computed_once_per_frame_size():
+    ui._ocr_config.cache_clear()
+    hd = ui._ocr_config(1920, 1080)
+    assert ui._ocr_config(1920, 1080) is hd
+    assert (hd.scale, hd.min_y_floor, hd.nav_max_bottom) == (1600 / 1920, 280, 400)
+    assert hd.size == (1600, 900) and hd.clahe_tiles == (8, 8)
+    uhd = ui._ocr_config(3840, 2160)
+    assert uhd.size == (1600, 900) and uhd.min_y_floor == 380
+    small = ui._ocr_config(1024, 1000)
+    assert small.size == (1536, 1500) and small.clahe_tiles == (12, 12)
+    assert ui._ocr_config.cache_info().hits == 1
+
+
+def test_first_hyperlink_waits_with_uia_exists(monkeypatch):
+    from types import SimpleNamespace
+
+    waits, clicks = [], []
+    rect = SimpleNamespace(left=200, top=390, right=600, bottom=410)
+    link = SimpleNamespace(BoundingRectangle=rect, Exists=lambda timeout, interval: waits.append((timeout, interval)) or True)
+    monkeypatch.setattr(ui, "_AUTO", SimpleNamespace(GetForegroundControl=lambda: object(), HyperlinkControl=lambda **kw: link))
+    monkeypatch.setattr(ui, "_PG", SimpleNamespace(moveTo=lambda *a, **k: clicks.append(a), click=lambda: clicks.append("click")))
+
+    assert ui.click_first_hyperlink_in_foreground(retries=3, sleep_seconds=0.5, min_y=100)
+    assert waits == [(1.5, 0.1)] and clicks == [(400, 400), "click"]
+    assert not ui.click_first_hyperlink_in_foreground(min_y=500)
+
+
+def test_opencl_preprocess_downloads_only_the_result(monkeypatch):
+    from types import SimpleNamespace
+
+    calls = []
+
+    class UMat:
+        def __init__(self, src, step="upload"):
+            calls.append(step)
+            self.src = src
+
+        def get(self):
+            calls.append("get")
+            return self.src
+
+    def stage(name):
+        def run(src, *args, **kwargs):
+            assert isinstance(src, UMat)
+            return UMat(src.src, name)
+        return run
+
+    fake_cv = SimpleNamespace(
+        UMat=UMat, INTER_CUBIC=2, INTER_AREA=3, COLOR_BGR2GRAY=6, ADAPTIVE_THRESH_GAUSSIAN_C=1, THRESH_BINARY=0,
+        resize=stage("resize"), cvtColor=stage("gray"), GaussianBlur=stage("blur"), adaptiveThreshold=stage("threshold"),
+        createCLAHE=lambda **kw: SimpleNamespace(apply=stage("clahe")),
+        ocl=SimpleNamespace(haveOpenCL=lambda: True, useOpenCL=lambda: True),
+    )
+    monkeypatch.setattr(ui, "_CV", fake_cv)
+    monkeypatch.setattr(ui, "_ocr_local", threading.local())
+    ui._use_opencl.cache_clear()
+    try:
+        frame = np.zeros((1080, 1920, 3), np.uint8)
+        assert ui._ocr_preprocess(frame, ui._ocr_config(1920, 1080)) is frame
+    finally:
+        ui._use_opencl.cache_clear()
+    assert calls == ["upload", "resize", "gray", "clahe", "blur", "threshold", "get"]
+
+
+def test_hyperlink_candidates_filtered_in_one_pass(monkeypatch):
+    from types import SimpleNamespace
+
+    links = [
+        ("Second result title", (100, 500, 600, 520)),
+        ("Tiny", (100, 300, 600, 320)),             # name too short
+        ("", (100, 400, 600, 420)),                  # unnamed links are allowed
+        ("Header link here", (100, 50, 600, 70)),    # above min_y
+        ("Narrow result", (100, 600, 200, 620)),     # too narrow
+        ("Right column result", (950, 350, 1400, 370)),
+        ("First result title", (100, 350, 600, 370)),
+    ]
+    monkeypatch.setattr(ui, "_AUTO", SimpleNamespace(GetForegroundControl=lambda: object()))
+    monkeypatch.setattr(ui, "_hyperlink_rects", lambda auto, win: links)
+
+    assert ui._enumerate_hyperlink_candidates(min_y=200, max_candidates=5) == [
+        (350, 360, "First result title"), (350, 410, ""), (350, 510, "Second result title"),
+    ]
+    assert ui._enumerate_hyperlink_candidates(min_y=200, max_candidates=1) == [(350, 360, "First result title")]
+
+
+def test_tesserocr_handles_are_pooled_and_fed_raw_bytes(monkeypatch):
+    import queue
+    from types import SimpleNamespace
+
+    RIL = SimpleNamespace(BLOCK=0, PARA=1, TEXTLINE=2, WORD=3)
+    words = [  # (text, conf, box, starts): starts = levels this word begins
+        ("Python", 93.0, (10, 5, 80, 25), {RIL.BLOCK, RIL.PARA, RIL.TEXTLINE}),
+        ("Tutorial", 91.0, (90, 5, 170, 25), set()),
+        ("Next", 88.0, (10, 40, 60, 60), {RIL.TEXTLINE}),
+    ]
+    created, images = [], []
+
+    class API:
+        def __init__(self, psm):
+            created.append(psm)
+
+        def SetImageBytes(self, data, w, h, bpp, bpl):
+            images.append((len(data), w, h, bpp, bpl))
+
+        def Recognize(self):
+            pass
+
+        def GetIterator(self):
+            return None
+
+    def iterate_level(_iterator, level):
+        for text, conf, box, starts in words:
+            yield SimpleNamespace(
+                IsAtBeginningOf=starts.__contains__, BoundingBox=lambda lvl, box=box: box,
+                GetUTF8Text=lambda lvl, text=text: text, Confidence=lambda lvl, conf=conf: conf,
+            )
+
+    fake = SimpleNamespace(PyTessBaseAPI=API, PSM=SimpleNamespace(SINGLE_BLOCK=6), RIL=RIL, iterate_level=iterate_level)
+    monkeypatch.setattr(ui, "_tesserocr", fake)
+    monkeypatch.setattr(ui, "_tess_apis", queue.LifoQueue())
+    monkeypatch.setattr(ui, "_tess_failed", False)
+    monkeypatch.setattr(ui, "_CV", None)
+    monkeypatch.setattr(ui, "_OCR_MAX_BANDS", 1)
+
+    for _ in range(2):
+        data = ui._ocr_screenshot_data(np.zeros((100, 200, 3), np.uint8), None)
+    assert created == [6]
+    assert images == [(60000, 200, 100, 3, 600)] * 2
+    assert data["text"] == ["Python", "Tutorial", "Next"]
+    assert data["line_num"].tolist() == [1, 1, 2] and data["width"].tolist() == [70, 80, 50]
+
+
+def test_settings_toggle_polls_until_it_appears_and_flips(monkeypatch):
+    from types import SimpleNamespace
+
+    polls, naps, clicks = [], [], []
+    state = SimpleNamespace(CurrentToggleState=0)
+    toggle = SimpleNamespace(Exists=lambda *a: len(polls) >= 3, GetTogglePattern=lambda: state)
+
+    def find(searchFromControl, RegexName):
+        polls.append(RegexName)
+        return toggle
+
+    def click(ctrl):
+        clicks.append(ctrl)
+        state.CurrentToggleState = 1
+        return True
+
+    fake = SimpleNamespace(GetForegroundControl=lambda: object(), ToggleButtonControl=find)
+    monkeypatch.setattr(ui, "_AUTO", fake)
+    monkeypatch.setattr(ui, "_click_with_cursor", click)
+    monkeypatch.setattr(ui.time, "sleep", naps.append)
+
+    assert ui._set_foreground_toggle(r"(?i)night\s*light", True)
+    assert clicks == [toggle] and len(polls) == 3
+    assert naps == [0.03, 0.03 * 1.7]
+    assert ui._set_foreground_toggle(r"(?i)night\s*light", True) and clicks == [toggle]